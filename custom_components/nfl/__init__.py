@@ -1,35 +1,147 @@
 """ NFL Team Status """
+import asyncio
 import logging
-from datetime import timedelta
-import arrow
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+import zlib
 
 import aiohttp
-from async_timeout import timeout
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.entity_registry import (
     async_entries_for_config_entry,
     async_get,
 )
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .api import get_client, team_events
 from .const import (
-    API_ENDPOINT,
+    CONF_FLIGHT_RECORDER,
+    CONF_GROUPS,
+    CONF_IDLE_INTERVAL,
+    CONF_LEAGUE,
+    CONF_LIMIT,
+    CONF_LIVE_INTERVAL,
+    CONF_MQTT_MODE,
+    CONF_MQTT_TOPIC,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_STANDINGS,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
     COORDINATOR,
+    COUNTDOWN_INTERVAL_SECONDS,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_LEAGUE,
+    DEFAULT_LIVE_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    IDLE_TEAM_ENDPOINT_MAX_TEAMS,
     ISSUE_URL,
+    LEAGUES,
+    LOOP_HOLD_BUDGET_MS,
+    LOOP_HOLD_SAMPLES,
+    MQTT_MODE_OFF,
+    MQTT_MODE_SUBSCRIBE,
     PLATFORMS,
-    USER_AGENT,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+    PRIORITY_PRE,
+    SCOREBOARD_RECHECK_SECONDS,
+    SERIES_GAMES,
     VERSION,
+    WARMUP_INTERVAL_SECONDS,
+    WARMUP_LEAD_SECONDS,
+    WEBHOOK_SAFETY_NET_SECONDS,
 )
+from .limiter import RequestBudgetExceeded, get_request_budget
+from .freshness import LatencyHistogram
+from .game_ends import get_game_ends
+
+if TYPE_CHECKING:
+    from .series import GameSeries
 
 _LOGGER = logging.getLogger(__name__)
 
+# (upper bound in seconds, unit, unit size in seconds) used by _humanize. A
+# size of 0 means the unit text is used as-is ("a minute", "an hour").
+_HUMANIZE_STEPS = (
+    (45, "seconds", 0),
+    (90, "a minute", 0),
+    (2700, "minutes", 60),
+    (5400, "an hour", 0),
+    (79200, "hours", 3600),
+    (129600, "a day", 0),
+    (554400, "days", 86400),
+    (907200, "a week", 0),
+    (2419200, "weeks", 604800),
+    (3888000, "a month", 0),
+    (29808000, "months", 2592000),
+    (47260800, "a year", 0),
+)
+
+
+def _humanize(when: datetime, now: datetime) -> str:
+    """Return a relative description of when, like "in 30 minutes" or "2 days ago"."""
+    delta = (when - now).total_seconds()
+    seconds = abs(delta)
+    if seconds < 10:
+        return "just now"
+
+    for limit, unit, size in _HUMANIZE_STEPS:
+        if seconds < limit:
+            text = f"{max(int(seconds // size), 2)} {unit}" if size else unit
+            break
+    else:
+        text = f"{max(int(seconds // 31536000), 2)} years"
+
+    return f"in {text}" if delta > 0 else f"{text} ago"
+
+
+def team_ids(config: dict) -> list[str]:
+    """Return the teams an entry tracks; older entries store a single team."""
+    teams = config[CONF_TEAM_ID]
+    if isinstance(teams, str):
+        teams = teams.split(",")
+    return [team.strip().upper() for team in teams if team.strip()]
+
+
+def league_query(config: dict) -> tuple[str, dict]:
+    """Return an entry's league and its scoreboard parameters, like groups and limit."""
+    league = config.get(CONF_LEAGUE) or DEFAULT_LEAGUE
+    params = dict(LEAGUES.get(league, {}))
+    for key in (CONF_GROUPS, CONF_LIMIT):
+        if config.get(key):
+            params[key] = str(config[key])
+    return league, params
+
+
+def _now_w3c() -> str:
+    """Return the current local time formatted like "2023-09-10 13:00:00-04:00"."""
+    return dt_util.now().isoformat(sep=" ", timespec="seconds")
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the NFL component."""
+    # Only needed once the component is set up, so kept out of its import
+    from .services import async_setup_services
+    from .websocket_api import async_setup_websocket
+
+    hass.data.setdefault(DOMAIN, {})
+    async_setup_websocket(hass)
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Load the saved entities."""
@@ -48,11 +160,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         for entity in async_entries_for_config_entry(ent_reg, entry.entry_id):
             ent_reg.async_update_entity(entity.entity_id, new_unique_id=entry.entry_id)
 
-    # Setup the data coordinator
+    if {**entry.data, **entry.options}.get(CONF_WEBHOOK) and CONF_WEBHOOK_ID not in entry.data:
+        from homeassistant.components.webhook import async_generate_id
+
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: async_generate_id()}
+        )
+
+    config = {**entry.data, **entry.options}
+    get_request_budget(hass).set_budget(
+        entry.entry_id, config.get(CONF_REQUESTS_PER_MINUTE)
+    )
+    get_client(hass).set_recording(entry.entry_id, config.get(CONF_FLIGHT_RECORDER, False))
+    get_client(hass).set_results_tracking(entry.entry_id, config.get(CONF_STANDINGS, False))
+
+    # Setup the data coordinator. The team the entry was created for keeps
+    # its unsuffixed unique ids, whichever teams the options add or reorder.
+    created_for = team_ids(entry.data)
     coordinator = AlertsDataUpdateCoordinator(
         hass,
-        entry.data,
-        entry.data.get(CONF_TIMEOUT)
+        config,
+        config.get(CONF_TIMEOUT),
+        created_for[0] if created_for else None,
     )
 
     # Fetch initial data so we have data when entities subscribe
@@ -61,7 +190,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {
         COORDINATOR: coordinator,
     }
-    
+
+    if config.get(CONF_MQTT_MODE, MQTT_MODE_OFF) != MQTT_MODE_OFF:
+        from .mqtt_sync import async_setup_mqtt_sync
+
+        try:
+            stop_sync = await async_setup_mqtt_sync(hass, coordinator)
+        except ConfigEntryNotReady:
+            # The first refresh already started timers; stop them before setup is retried
+            async_release_entry(hass, entry.entry_id)
+            await coordinator.async_shutdown()
+            raise
+        if stop_sync is not None:
+            entry.async_on_unload(stop_sync)
+
+    if config.get(CONF_WEBHOOK):
+        from .push import async_setup_push
+
+        entry.async_on_unload(async_setup_push(hass, coordinator))
+
+    entry.async_on_unload(entry.add_update_listener(update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -69,18 +217,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass, config_entry):
     """Handle removal of an entry."""
     try:
-        await hass.config_entries.async_forward_entry_unload(config_entry, "sensor")
-        _LOGGER.info("Successfully removed sensor from the " + DOMAIN + " integration")
+        await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+        _LOGGER.info("Successfully removed the platforms of the " + DOMAIN + " integration")
     except ValueError:
         pass
+    async_release_entry(hass, config_entry.entry_id)
     return True
 
 
+@callback
+def async_release_entry(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop an entry's share of the client and stop its coordinator."""
+    get_request_budget(hass).set_budget(entry_id, None)
+    get_client(hass).set_recording(entry_id, False)
+    get_client(hass).set_results_tracking(entry_id, False)
+    # Services and websocket subscriptions look coordinators up here, so drop it
+    entry_data = hass.data.get(DOMAIN, {}).pop(entry_id, None)
+    if entry_data is not None:
+        entry_data[COORDINATOR].async_unload()
+
+
 async def update_listener(hass, entry):
-    """Update listener."""
-    entry.data = entry.options
-    await hass.config_entries.async_forward_entry_unload(entry, "sensor")
-    hass.async_add_job(hass.config_entries.async_forward_entry_setup(entry, "sensor"))
+    """Apply changed options to the running coordinator and entities."""
+    from .players import parse_watchlist
+
+    config = {**entry.data, **entry.options}
+    get_request_budget(hass).set_budget(
+        entry.entry_id, config.get(CONF_REQUESTS_PER_MINUTE)
+    )
+    get_client(hass).set_recording(entry.entry_id, config.get(CONF_FLIGHT_RECORDER, False))
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    if (
+        bool(config.get(CONF_STANDINGS)) != bool(coordinator.config.get(CONF_STANDINGS))
+        or parse_watchlist(config) != parse_watchlist(coordinator.config)
+        or team_ids(config) != coordinator.teams
+        or league_query(config)[0] != coordinator.league
+        or config.get(CONF_MQTT_MODE) != coordinator.config.get(CONF_MQTT_MODE)
+        or config.get(CONF_MQTT_TOPIC) != coordinator.config.get(CONF_MQTT_TOPIC)
+        or bool(config.get(CONF_WEBHOOK)) != bool(coordinator.config.get(CONF_WEBHOOK))
+    ):
+        # Adding or removing teams, standings or players changes the entity set,
+        # another league needs its own schedules and MQTT sharing and the webhook
+        # are set up once
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    await coordinator.async_update_config(config)
 
 async def async_migrate_entry(hass, config_entry):
      """Migrate an old config entry."""
@@ -103,547 +284,984 @@ async def async_migrate_entry(hass, config_entry):
      return True
 
 class AlertsDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching NFL data."""
+    """Class to manage fetching NFL data.
 
-    def __init__(self, hass, config, the_timeout: int):
+    One coordinator serves every team of an entry: each refresh parses all of
+    them from a single scoreboard fetch, and data maps team to game state.
+    """
+
+    def __init__(self, hass, config, the_timeout: int, legacy_team: str | None = None):
         """Initialize."""
-        self.interval = timedelta(minutes=10)
+        self.interval = timedelta(seconds=config.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL))
         self.name = config[CONF_NAME]
         self.timeout = the_timeout
         self.config = config
+        self.teams = team_ids(config)
+        # Entities of this team keep the unique ids from before entries tracked several teams
+        self.legacy_team = legacy_team or self.teams[0]
+        self.league = league_query(config)[0]
+        # Subscribers read their states from another instance over MQTT instead of polling
+        self.shared = config.get(CONF_MQTT_MODE) == MQTT_MODE_SUBSCRIBE
         self.hass = hass
+        self._warm_up_at = None
+        self._warm_up_unsub = None
+        self._countdown_unsub = None
+        self.replaying = False
+        self._scoreboard_fetched = None
+        self.latency = LatencyHistogram()
+        self.loop_holds = LatencyHistogram(LOOP_HOLD_SAMPLES)
+        self.last_loop_hold: float | None = None
+        self.loop_holds_over_budget = 0
+        self._upstream_seen: set = set()
+        self._detail_consumers: dict[str | None, int] = {}
+        self._shared_details_pending: set[str] = set()
+        self._unload_listeners: list[CALLBACK_TYPE] = []
+        self.series: dict[str, GameSeries] = {}
 
         _LOGGER.debug("Data will be updated every %s", self.interval)
 
-        super().__init__(hass, _LOGGER, name=self.name, update_interval=self.interval)
+        super().__init__(
+            hass, _LOGGER, name=self.name, update_interval=None if self.shared else self.interval
+        )
 
     async def _async_update_data(self):
         """Fetch data"""
-        async with timeout(self.timeout):
+        if self.shared:
+            # States arrive over MQTT; until they do, every team is cleared
+            if self.data is not None:
+                return self.data
+            return {
+                team: await async_clear_states({**self.config, CONF_TEAM_ID: team})
+                for team in self.teams
+            }
+        if self.replaying and self.data is not None:
+            # A replay is feeding recorded payloads; don't overwrite them
+            return self.data
+        async with asyncio.timeout(self.timeout):
             try:
-                data = await update_game(self.config)
-                # update the interval based on flag
-                if data["private_fast_refresh"] == True:
-                    self.update_interval = timedelta(seconds=5)
+                if self._idle_fetch_allowed():
+                    data = await self._async_fetch_teams(self._request_priority())
                 else:
-                    self.update_interval = timedelta(minutes=10)
+                    scoreboard = await async_fetch_scoreboard(
+                        self.hass, self.config, self._request_priority()
+                    )
+                    self._scoreboard_fetched = time.monotonic()
+                    started = time.perf_counter()
+                    data = await async_parse_teams(self.config, scoreboard)
+                    self._async_record_loop_hold(time.perf_counter() - started)
+                self.update_interval = self._interval_for(data)
+            except RequestBudgetExceeded as error:
+                if self.data is None:
+                    raise UpdateFailed(error) from error
+                _LOGGER.debug("Keeping previous data for %s: %s", self.name, error)
+                return self.data
             except Exception as error:
                 raise UpdateFailed(error) from error
+            await self._async_apply_game_ends(data)
+            await self._async_update_details(data)
+            self._async_track_freshness(data)
+            self.async_record_series(data)
+            self._async_schedule_warm_up(data)
+            self._async_schedule_countdown(data)
             return data
-        
-
 
-async def update_game(config) -> dict:
+    async def _async_apply_game_ends(self, data: dict) -> None:
+        """Fill in when finished games ended, capturing games that just went final."""
+        game_ends = get_game_ends(self.hass)
+        await game_ends.async_load()
+        for team, state in data.items():
+            if state.get("state") != "POST":
+                continue
+            event_id = state.get("private_event_id")
+            ended = game_ends.get(event_id)
+            previous = (self.data or {}).get(team, {})
+            if (
+                ended is None
+                and event_id is not None
+                and previous.get("state") == "IN"
+                and previous.get("private_event_id") == event_id
+            ):
+                ended = game_ends.async_record(event_id, state.get("private_kickoff"))
+            if ended is not None:
+                state.update(ended)
+
+    @callback
+    def _async_schedule_countdown(self, data: dict) -> None:
+        """Run the local kickoff countdown while any team has a kickoff time."""
+        needed = any(state.get("private_kickoff") is not None for state in data.values())
+        if needed and self._countdown_unsub is None:
+            self._countdown_unsub = async_track_time_interval(
+                self.hass, self._async_countdown, timedelta(seconds=COUNTDOWN_INTERVAL_SECONDS)
+            )
+        elif not needed:
+            self._async_cancel_countdown()
+
+    @callback
+    def _async_cancel_countdown(self) -> None:
+        """Stop the kickoff countdown."""
+        if self._countdown_unsub is not None:
+            self._countdown_unsub()
+        self._countdown_unsub = None
+
+    @callback
+    def _async_countdown(self, _now) -> None:
+        """Refresh each team's kickoff_in from its cached kickoff, without a request."""
+        if not self.data:
+            return
+        now = dt_util.now()
+        changed = False
+        for state in self.data.values():
+            kickoff = state.get("private_kickoff")
+            if kickoff is None:
+                continue
+            kickoff_in = _humanize(kickoff, now)
+            if kickoff_in != state.get("kickoff_in"):
+                state["kickoff_in"] = kickoff_in
+                changed = True
+        if changed:
+            self.async_update_listeners()
+
+    @callback
+    def _async_track_freshness(self, data: dict) -> None:
+        """Add how long each new upstream payload took to reach Home Assistant."""
+        now = dt_util.utcnow()
+        upstream_times = {
+            state["private_upstream_time"]
+            for state in data.values()
+            if state.get("private_upstream_time") is not None
+        }
+        for upstream in upstream_times - self._upstream_seen:
+            self.latency.add((now - upstream).total_seconds())
+        self._upstream_seen = upstream_times
+
+    def _idle_fetch_allowed(self) -> bool:
+        """Return whether the next refresh can use the team endpoint.
+
+        That is the case while no team has a game close or live and the full
+        scoreboard, which alone reports bye weeks and every other final, was
+        read recently. Watched players need every game's leaders, so entries
+        with a watchlist always read the scoreboard. The team endpoint takes a
+        request per team, so entries with several teams read the one scoreboard.
+        """
+        from .players import parse_watchlist
+
+        if self.data is None or self._scoreboard_fetched is None or parse_watchlist(self.config):
+            return False
+        if len(self.teams) > IDLE_TEAM_ENDPOINT_MAX_TEAMS:
+            return False
+        if time.monotonic() - self._scoreboard_fetched > SCOREBOARD_RECHECK_SECONDS:
+            return False
+        return all(
+            state.get("state") in ("POST", "BYE", "NOT_FOUND")
+            or (
+                state.get("state") == "PRE"
+                and not state.get("private_warm_up")
+                and not state.get("private_fast_refresh")
+            )
+            for state in self.data.values()
+        )
+
+    async def _async_fetch_teams(self, priority: int) -> dict:
+        """Refresh every team from its own next event instead of the scoreboard."""
+        client = get_client(self.hass)
+        data = {}
+        longest = 0.0
+        for team in self.teams:
+            team_data = await client.async_get_team(team, priority, self.league)
+            if team_data is None:
+                raise UpdateFailed(f"Unable to fetch the next event for {team}")
+            started = time.perf_counter()
+            state = await async_parse_state({**self.config, CONF_TEAM_ID: team}, team_data)
+            longest = max(longest, time.perf_counter() - started)
+            previous = self.data.get(team, {})
+            if previous.get("state") == "BYE" and (state["week_number"] or 0) > (
+                previous["week_number"] or 0
+            ):
+                # The team endpoint already points at next week's game
+                state = {**previous, "last_update": _now_w3c()}
+            data[team] = state
+        # Each team is parsed between requests, so the longest parse is the hold
+        self._async_record_loop_hold(longest)
+        return data
+
+    @callback
+    def _async_record_loop_hold(self, seconds: float) -> None:
+        """Add how long a refresh held the event loop parsing, without yielding."""
+        held = seconds * 1000
+        self.loop_holds.add(held)
+        self.last_loop_hold = round(held, 2)
+        if held > LOOP_HOLD_BUDGET_MS:
+            self.loop_holds_over_budget += 1
+            _LOGGER.debug("Parsing for %s held the event loop for %.1f ms", self.name, held)
+
+    def team_name(self, team: str) -> str:
+        """Return the entity name for team; entries with several teams add the team."""
+        name = self.config.get(CONF_NAME, self.name)
+        return name if len(self.teams) == 1 else f"{name} {team}"
+
+    def unique_id_suffix(self, team: str) -> str:
+        """Return the unique id suffix for team; the legacy team keeps the original ids."""
+        return "" if team == self.legacy_team else f"_{team.lower()}"
+
+    @callback
+    def async_record_series(self, data: dict, when: datetime | None = None) -> None:
+        """Add each game's win probability, spread and total to its series."""
+        from .series import GameSeries
+
+        for state in data.values():
+            event_id = state.get("private_event_id")
+            if event_id is None:
+                continue
+            series = self.series.get(event_id)
+            if series is None:
+                series = self.series[event_id] = GameSeries(event_id)
+                while len(self.series) > SERIES_GAMES * len(self.teams):
+                    del self.series[next(iter(self.series))]
+            series.add(when or dt_util.utcnow(), state)
+
+    async def async_ingest(self, data: dict, partial: bool = False) -> list[str]:
+        """Parse a pushed scoreboard into the teams' states and return the teams updated.
+
+        A partial scoreboard only updates the teams playing in it; the others
+        keep their state. Every push also postpones the next poll.
+        """
+        teams = [team for team in self.teams if not partial or team_events(data, team)]
+        if not teams:
+            return []
+        started = time.perf_counter()
+        states = {
+            team: await async_parse_state({**self.config, CONF_TEAM_ID: team}, data)
+            for team in teams
+        }
+        self._async_record_loop_hold(time.perf_counter() - started)
+        merged = {**(self.data or {}), **states}
+        self.update_interval = self._interval_for(merged)
+        await self._async_apply_game_ends(merged)
+        await self._async_update_details(merged)
+        self._async_track_freshness(merged)
+        self.async_record_series(merged)
+        self._async_schedule_warm_up(merged)
+        self._async_schedule_countdown(merged)
+        self.async_set_updated_data(merged)
+        return teams
+
+    @callback
+    def async_set_shared_state(self, team: str, state: dict) -> None:
+        """Replace one team's state with the one another instance published.
+
+        Game details are not shared, so they are kept from the previous state
+        and fetched here for live games that something reads.
+        """
+        live = state.get("state") == "IN"
+        previous = (self.data or {}).get(team, {})
+        if live and previous.get("private_event_id") == state.get("private_event_id"):
+            state["game_details"] = previous.get("game_details")
+        data = {**(self.data or {}), team: state}
+        self._async_track_freshness(data)
+        self.async_record_series(data)
+        self._async_schedule_countdown(data)
+        self.async_set_updated_data(data)
+        if live and team not in self._shared_details_pending:
+            self._shared_details_pending.add(team)
+            self.hass.async_create_task(self._async_update_shared_details(team))
+
+    async def _async_update_shared_details(self, team: str) -> None:
+        """Fetch the game details of one shared team state."""
+        try:
+            state = dict(self.data[team])
+            await self._async_update_details({team: state})
+        finally:
+            self._shared_details_pending.discard(team)
+        current = self.data[team]
+        if (
+            current.get("private_event_id") == state.get("private_event_id")
+            and current.get("game_details") is not state.get("game_details")
+        ):
+            # Another message may have arrived meanwhile, so only the details are replaced
+            self.async_set_updated_data(
+                {**self.data, team: {**current, "game_details": state.get("game_details")}}
+            )
+
+    @callback
+    def async_add_unload_listener(self, unload_listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call unload_listener once the entry unloads; returns a callback that removes it."""
+        self._unload_listeners.append(unload_listener)
+
+        @callback
+        def _remove() -> None:
+            if unload_listener in self._unload_listeners:
+                self._unload_listeners.remove(unload_listener)
+
+        return _remove
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop the coordinator's timers and tell whatever still holds it that it is gone."""
+        self._async_cancel_countdown()
+        self._async_cancel_warm_up()
+        while self._unload_listeners:
+            self._unload_listeners.pop()()
+
+    @callback
+    def async_add_detail_consumer(self, team: str | None = None) -> CALLBACK_TYPE:
+        """Register something that reads team's game details, or every team's if None.
+
+        Returns a callback that removes the consumer again.
+        """
+        self._detail_consumers[team] = self._detail_consumers.get(team, 0) + 1
+
+        @callback
+        def _remove() -> None:
+            self._detail_consumers[team] -= 1
+
+        return _remove
+
+    async def _async_update_details(self, data: dict) -> None:
+        """Attach the game summary to live games that something reads."""
+        for team, state in data.items():
+            event_id = state.get("private_event_id")
+            if state.get("state") != "IN" or event_id is None:
+                continue
+            if not self._detail_consumers.get(team) and not self._detail_consumers.get(None):
+                continue
+            sequence = state.get("private_play_id") or f"{state['quarter']}-{state['clock']}"
+            try:
+                state["game_details"] = await get_client(self.hass).async_get_game_summary(
+                    event_id, str(sequence), self.league
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, zlib.error) as error:
+                # Details are an extra; a bad summary must never fail the scoreboard refresh
+                _LOGGER.debug("Unable to fetch game details for %s: %s", team, error)
+                if self.data is not None and team in self.data:
+                    state["game_details"] = self.data[team].get("game_details")
+
+    def _interval_for(self, data: dict) -> timedelta:
+        """Return the polling tier of the most urgent game in data.
+
+        Entries fed through their webhook poll no faster than the safety net.
+        """
+        if any(state["private_fast_refresh"] for state in data.values()):
+            interval = timedelta(
+                seconds=self.config.get(CONF_LIVE_INTERVAL, DEFAULT_LIVE_INTERVAL)
+            )
+        elif any(state["private_warm_up"] for state in data.values()):
+            interval = timedelta(seconds=WARMUP_INTERVAL_SECONDS)
+        else:
+            interval = timedelta(
+                seconds=self.config.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
+            )
+        if self.config.get(CONF_WEBHOOK):
+            interval = max(interval, timedelta(seconds=WEBHOOK_SAFETY_NET_SECONDS))
+        return interval
+
+    async def async_update_config(self, config: dict) -> None:
+        """Apply new options without rebuilding the coordinator.
+
+        Only a team change needs fresh data; every other option is picked up by
+        the running coordinator and its entities straight away.
+        """
+        team_changed = team_ids(config) != self.teams
+        self.config = config
+        self.teams = team_ids(config)
+        self.timeout = config.get(CONF_TIMEOUT) or DEFAULT_TIMEOUT
+        self.name = config.get(CONF_NAME, self.name)
+
+        if team_changed or self.data is None:
+            await self.async_refresh()
+            return
+
+        if not self.shared:
+            self.update_interval = self._interval_for(self.data)
+        self._schedule_refresh()
+        self.async_update_listeners()
+
+    def _request_priority(self) -> int:
+        """Return the request budget priority for the next refresh."""
+        if self.data is None:
+            return PRIORITY_PRE
+        states = self.data.values()
+        if any(state.get("state") == "IN" for state in states):
+            return PRIORITY_LIVE
+        if any(state.get("private_fast_refresh") or state.get("private_warm_up") for state in states):
+            return PRIORITY_PRE
+        return PRIORITY_IDLE
+
+    @callback
+    def _async_schedule_warm_up(self, data: dict) -> None:
+        """Schedule the warm-up stage ahead of the next kickoff of any team."""
+        now = dt_util.utcnow()
+        warm_ups = [
+            state["private_kickoff"] - timedelta(seconds=WARMUP_LEAD_SECONDS)
+            for state in data.values()
+            if state.get("state") == "PRE" and state.get("private_kickoff") is not None
+        ]
+        warm_ups = [warm_up_at for warm_up_at in warm_ups if warm_up_at > now]
+        if not warm_ups:
+            self._async_cancel_warm_up()
+            return
+
+        warm_up_at = min(warm_ups)
+        if warm_up_at == self._warm_up_at:
+            return
+        self._async_cancel_warm_up()
+
+        _LOGGER.debug("Scheduling warm-up for %s at %s", self.name, warm_up_at)
+        self._warm_up_at = warm_up_at
+        self._warm_up_unsub = async_track_point_in_utc_time(
+            self.hass, self._async_warm_up, warm_up_at
+        )
+
+    @callback
+    def _async_cancel_warm_up(self) -> None:
+        """Cancel a pending warm-up."""
+        if self._warm_up_unsub is not None:
+            self._warm_up_unsub()
+        self._warm_up_unsub = None
+        self._warm_up_at = None
+
+    async def _async_warm_up(self, _now) -> None:
+        """Open the pooled connection and prime the caches before kickoff."""
+        self._warm_up_unsub = None
+        try:
+            await get_client(self.hass).async_warm_up(*league_query(self.config))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            _LOGGER.debug("Warm-up for %s failed: %s", self.name, error)
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled work and shut down the coordinator."""
+        self._async_cancel_warm_up()
+        self._async_cancel_countdown()
+        await super().async_shutdown()
+
+
+async def update_game(hass, config, priority: int = PRIORITY_IDLE) -> dict:
     """Fetch new state data for the sensor.
     This is the only method that should fetch new data for Home Assistant.
     """
 
-    data = await async_get_state(config)
+    data = await async_get_state(hass, config, priority)
     return data
 
-async def async_get_state(config) -> dict:
+async def async_get_state(hass, config, priority: int = PRIORITY_IDLE) -> dict:
     """Query API for status."""
 
-    values = {}
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
-    data = None
-    url = API_ENDPOINT
+    _LOGGER.debug("Getting state for %s", config[CONF_TEAM_ID])
+    data = await async_fetch_scoreboard(hass, config, priority)
+    return await async_parse_teams(config, data)
+
+async def async_fetch_scoreboard(hass, config, priority: int = PRIORITY_IDLE) -> dict:
+    """Return the scoreboard of the configured league."""
+    league, params = league_query(config)
+    data = await get_client(hass).async_get_scoreboard(league, params, priority=priority)
+    if data is None:
+        raise UpdateFailed(f"Unable to fetch the scoreboard for {config[CONF_TEAM_ID]}")
+    return data
+
+async def async_parse_teams(config, data) -> dict:
+    """Parse the game state of every configured team from one scoreboard payload."""
+    return {
+        team: await async_parse_state({**config, CONF_TEAM_ID: team}, data)
+        for team in team_ids(config)
+    }
+
+async def async_parse_state(config, data) -> dict:
+    """Parse the configured team's game state from a scoreboard payload."""
+
+    # Start from the full attribute set so the dict is sized once up front
+    values = await async_clear_states(config)
     team_id = config[CONF_TEAM_ID]
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as r:
-            _LOGGER.debug("Getting state for %s from %s" % (team_id, url))
-            if r.status == 200:
-                data = await r.json()
 
     values["my_team_abbr"] = team_id
     found_team = False
+    kickoff = None
     if data is not None:
-        for event in data["events"]:
-            #_LOGGER.debug("Looking at this event: %s" % event)
-            if team_id in event["shortName"]:
-                _LOGGER.debug("Found event; parsing data.")
-                
-                found_team = True
-                # Determine whether our team is Competitor 0 or 1
-                team_index = 0 if event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
-                team_home_away = event["competitions"][0]["competitors"][team_index]["homeAway"]
-                oppo_index = abs((team_index-1))
-                
-                # state will be one of: pre, in, post
-                try:
-                    values["state"] = event["status"]["type"]["state"].upper()
-                except:
-                    values["state"] = None
-                
-                # detailed_state will be one of: STATUS_SCHEDULED, STATUS_IN_PROGRESS, STATUS_FINAL
-                try:
-                    values["detailed_state"] = event["status"]["type"]["name"]
-                except:
-                    values["detailed_state"] = None
-                
-                # Attempt to calculate the length of the game
-                #try:
-                #    if prior_state in ['STATUS_IN_PROGRESS'] and values["state"] in ['STATUS_FINAL']:
-                #        _LOGGER.debug("Calulating game time for %s" % (team_id))
-                #        values["game_end_time"] = arrow.now().format(arrow.FORMAT_W3C)
-                #        values["game_length"] = str(values["game_end_time"] - event["date"])
-                #    elif values["state"] not in ['STATUS_FINAL']:
-                #        values["game_end_time"] = None
-                #        values["game_length"] = None
-                #except:
-                values["game_end_time"] = None
-                values["game_length"] = None
-                
-                try:
-                    values["date"] = event["date"]
-                except:
-                    values["date"] = None
+        for event in team_events(data, team_id):
+            _LOGGER.debug("Found event; parsing data.")
+            
+            found_team = True
+            values["private_event_id"] = event.get("id")
+            # Determine whether our team is Competitor 0 or 1
+            team_index = 0 if event["competitions"][0]["competitors"][0]["team"]["abbreviation"] == team_id else 1
+            team_home_away = event["competitions"][0]["competitors"][team_index]["homeAway"]
+            oppo_index = abs((team_index-1))
+            
+            # state will be one of: pre, in, post
+            try:
+                values["state"] = event["status"]["type"]["state"].upper()
+            except:
+                values["state"] = None
+            
+            # detailed_state will be one of: STATUS_SCHEDULED, STATUS_IN_PROGRESS, STATUS_FINAL
+            try:
+                values["detailed_state"] = event["status"]["type"]["name"]
+            except:
+                values["detailed_state"] = None
+            
+            # The coordinator fills these in once it has seen the game end
+            values["game_end_time"] = None
+            values["game_length"] = None
+            
+            try:
+                values["date"] = event["date"]
+                kickoff = dt_util.parse_datetime(event["date"])
+            except:
+                values["date"] = None
 
-                try:
-                    values["week_number"] = event["week"]["number"]
-                except:
-                    values["week_number"] = None
-                
-                try:
-                    values["attendance"] = event["competitions"][0]["attendance"]
-                except:
-                    values["attendance"] = None
-                
-                # Formatted as full team names like "New York Giants at Tennessee Titans"
-                try:
-                    values["event_name"] = event["name"]
-                except:
-                    values["event_name"] = None
-                
-                # Formatted as abbreviations like "NYG @ TEN"
-                try:
-                    values["event_short_name"] = event["shortName"]
-                except:
-                    values["event_short_name"] = None
+            try:
+                values["week_number"] = event["week"]["number"]
+            except:
+                values["week_number"] = None
+            
+            try:
+                values["attendance"] = event["competitions"][0]["attendance"]
+            except:
+                values["attendance"] = None
+            
+            # Formatted as full team names like "New York Giants at Tennessee Titans"
+            try:
+                values["event_name"] = event["name"]
+            except:
+                values["event_name"] = None
+            
+            # Formatted as abbreviations like "NYG @ TEN"
+            try:
+                values["event_short_name"] = event["shortName"]
+            except:
+                values["event_short_name"] = None
 
-                # Formatted as "STD", "RD16", "QTR"
-                try:
-                    values["event_type"] = event["competitions"][0]["type"]["abbreviation"]
-                except:
-                    values["event_type"] = None
-                
-                # Formatted as ???
-                try:
-                    values["game_notes"] = event["competitions"][0]["notes"][0]["headline"]
-                except:
-                    values["game_notes"] = None
-                
-                # Formatted as ???
-                try:
-                    values["series_summary"] = event["competitions"][0]["series"]["summary"]
-                except:
-                    values["series_summary"] = None
-                
-                try:
-                    values["venue_name"] = event["competitions"][0]["venue"]["fullName"]
-                except:
-                    values["venue_name"] = None
-                
-                try:
-                    values["venue_city"] = event["competitions"][0]["venue"]["address"]["city"]
-                except:
-                    values["venue_city"] = None
-                
-                try:
-                    values["venue_state"] = event["competitions"][0]["venue"]["address"]["state"]
-                except:
-                    values["venue_state"] = None
-                
-                try:
-                    values["venue_capacity"] = event["competitions"][0]["venue"]["capacity"]
-                except:
-                    values["venue_capacity"] = None
-                
-                # Formatted as true/false
-                try:
-                    values["venue_indoor"] = event["competitions"][0]["venue"]["indoor"]
-                except:
-                    values["venue_indoor"] = None
+            # Formatted as "STD", "RD16", "QTR"
+            try:
+                values["event_type"] = event["competitions"][0]["type"]["abbreviation"]
+            except:
+                values["event_type"] = None
+            
+            # Formatted as ???
+            try:
+                values["game_notes"] = event["competitions"][0]["notes"][0]["headline"]
+            except:
+                values["game_notes"] = None
+            
+            # Formatted as ???
+            try:
+                values["series_summary"] = event["competitions"][0]["series"]["summary"]
+            except:
+                values["series_summary"] = None
+            
+            try:
+                values["venue_name"] = event["competitions"][0]["venue"]["fullName"]
+            except:
+                values["venue_name"] = None
+            
+            try:
+                values["venue_city"] = event["competitions"][0]["venue"]["address"]["city"]
+            except:
+                values["venue_city"] = None
+            
+            try:
+                values["venue_state"] = event["competitions"][0]["venue"]["address"]["state"]
+            except:
+                values["venue_state"] = None
+            
+            try:
+                values["venue_capacity"] = event["competitions"][0]["venue"]["capacity"]
+            except:
+                values["venue_capacity"] = None
+            
+            # Formatted as true/false
+            try:
+                values["venue_indoor"] = event["competitions"][0]["venue"]["indoor"]
+            except:
+                values["venue_indoor"] = None
 
-                
-                # featuredAthletes for post-game???
+            
+            # featuredAthletes for post-game???
 
 
-                try:
-                    values["game_status"] = event["status"]["type"]["shortDetail"]
-                except:
-                    values["game_status"] = None
-                
-                try:
-                    values["home_team_abbr"] = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
-                except:
-                    values["home_team_abbr"] = None
-                
-                try:
-                    values["home_team_id"] = event["competitions"][0]["competitors"][0]["team"]["id"]
-                except:
-                    values["home_team_id"] = None
-                    
-                try:
-                    values["home_team_city"] = event["competitions"][0]["competitors"][0]["team"]["location"]
-                except:
-                    values["home_team_city"] = None
-                
-                try:
-                    values["home_team_name"] = event["competitions"][0]["competitors"][0]["team"]["name"]
-                except:
-                    values["home_team_name"] = None
-                
-                try:
-                    values["home_team_logo"] = event["competitions"][0]["competitors"][0]["team"]["logo"]
-                except:
-                    values["home_team_logo"] = None
+            try:
+                values["game_status"] = event["status"]["type"]["shortDetail"]
+            except:
+                values["game_status"] = None
+            
+            try:
+                values["home_team_abbr"] = event["competitions"][0]["competitors"][0]["team"]["abbreviation"]
+            except:
+                values["home_team_abbr"] = None
+            
+            try:
+                values["home_team_id"] = event["competitions"][0]["competitors"][0]["team"]["id"]
+            except:
+                values["home_team_id"] = None
                 
-                try:
-                    values["home_team_score"] = event["competitions"][0]["competitors"][0]["score"]
-                except:
-                    values["home_team_score"] = None
+            try:
+                values["home_team_city"] = event["competitions"][0]["competitors"][0]["team"]["location"]
+            except:
+                values["home_team_city"] = None
+            
+            try:
+                values["home_team_name"] = event["competitions"][0]["competitors"][0]["team"]["name"]
+            except:
+                values["home_team_name"] = None
+            
+            try:
+                values["home_team_logo"] = event["competitions"][0]["competitors"][0]["team"]["logo"]
+            except:
+                values["home_team_logo"] = None
+            
+            try:
+                values["home_team_score"] = event["competitions"][0]["competitors"][0]["score"]
+            except:
+                values["home_team_score"] = None
 
-                try:
-                    values["home_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][0]["team"]["color"])), 
-                        ''.join(('#',event["competitions"][0]["competitors"][0]["team"]["alternateColor"]))]
-                except:
-                    values["home_team_colors"] = ['#013369','#013369']
-                
-                # Need to check if this is used while in progress
-                try:
-                    values["home_team_ls_1"] = event["competitions"][0]["competitors"][0]["linescores"][0]["value"]
-                except:
-                    values["home_team_ls_1"] = None
+            try:
+                values["home_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][0]["team"]["color"])), 
+                    ''.join(('#',event["competitions"][0]["competitors"][0]["team"]["alternateColor"]))]
+            except:
+                values["home_team_colors"] = ['#013369','#013369']
+            
+            # Need to check if this is used while in progress
+            try:
+                values["home_team_ls_1"] = event["competitions"][0]["competitors"][0]["linescores"][0]["value"]
+            except:
+                values["home_team_ls_1"] = None
 
-                try:
-                    values["home_team_ls_2"] = event["competitions"][0]["competitors"][0]["linescores"][1]["value"]
-                except:
-                    values["home_team_ls_2"] = None
+            try:
+                values["home_team_ls_2"] = event["competitions"][0]["competitors"][0]["linescores"][1]["value"]
+            except:
+                values["home_team_ls_2"] = None
 
-                try:
-                    values["home_team_ls_3"] = event["competitions"][0]["competitors"][0]["linescores"][2]["value"]
-                except:
-                    values["home_team_ls_3"] = None
-                
-                try:
-                    values["home_team_ls_4"] = event["competitions"][0]["competitors"][0]["linescores"][3]["value"]
-                except:
-                    values["home_team_ls_4"] = None
+            try:
+                values["home_team_ls_3"] = event["competitions"][0]["competitors"][0]["linescores"][2]["value"]
+            except:
+                values["home_team_ls_3"] = None
+            
+            try:
+                values["home_team_ls_4"] = event["competitions"][0]["competitors"][0]["linescores"][3]["value"]
+            except:
+                values["home_team_ls_4"] = None
 
-                try:
-                    values["home_team_ls_ot"] = event["competitions"][0]["competitors"][0]["linescores"][4]["value"]
-                except:
-                    values["home_team_ls_ot"] = None
+            try:
+                values["home_team_ls_ot"] = event["competitions"][0]["competitors"][0]["linescores"][4]["value"]
+            except:
+                values["home_team_ls_ot"] = None
 
-                
-                try:
-                    values["home_team_record"] = event["competitions"][0]["competitors"][0]["records"][0]["summary"]
-                except:
-                    values["home_team_record"] = None
+            
+            try:
+                values["home_team_record"] = event["competitions"][0]["competitors"][0]["records"][0]["summary"]
+            except:
+                values["home_team_record"] = None
 
-                try:
-                    values["home_team_passing_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][0]["leaders"][0]["displayValue"]
-                except:
-                    values["home_team_passing_leader_stats"] = None
+            try:
+                values["home_team_passing_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][0]["leaders"][0]["displayValue"]
+            except:
+                values["home_team_passing_leader_stats"] = None
 
-                try:
-                    values["home_team_passing_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["home_team_passing_leader_name"] = None
+            try:
+                values["home_team_passing_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["home_team_passing_leader_name"] = None
 
-                try:
-                    values["home_team_rushing_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][1]["leaders"][0]["displayValue"]
-                except:
-                    values["home_team_rushing_leader_stats"] = None
+            try:
+                values["home_team_rushing_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][1]["leaders"][0]["displayValue"]
+            except:
+                values["home_team_rushing_leader_stats"] = None
 
-                try:
-                    values["home_team_rushing_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["home_team_rushing_leader_name"] = None
+            try:
+                values["home_team_rushing_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["home_team_rushing_leader_name"] = None
 
-                try:
-                    values["home_team_receiving_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][2]["leaders"][0]["displayValue"]
-                except:
-                    values["home_team_receiving_leader_stats"] = None
+            try:
+                values["home_team_receiving_leader_stats"] = event["competitions"][0]["competitors"][0]["leaders"][2]["leaders"][0]["displayValue"]
+            except:
+                values["home_team_receiving_leader_stats"] = None
 
-                try:
-                    values["home_team_receiving_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["home_team_receiving_leader_name"] = None
-       
-                try:
-                    values["away_team_abbr"] = event["competitions"][0]["competitors"][1]["team"]["abbreviation"]
-                except:
-                    values["away_team_abbr"] = None
-                    
-                try:
-                    values["away_team_id"] = event["competitions"][0]["competitors"][1]["team"]["id"]
-                except:
-                    values["away_team_id"] = None
-                
-                try:
-                    values["away_team_city"] = event["competitions"][0]["competitors"][1]["team"]["location"]
-                except:
-                    values["away_team_city"] = None
-                
-                try:
-                    values["away_team_name"] = event["competitions"][0]["competitors"][1]["team"]["name"]
-                except:
-                    values["away_team_name"] = None
-                
-                try:
-                    values["away_team_logo"] = event["competitions"][0]["competitors"][1]["team"]["logo"]
-                except:
-                    values["away_team_logo"] = None
+            try:
+                values["home_team_receiving_leader_name"] = event["competitions"][0]["competitors"][0]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["home_team_receiving_leader_name"] = None
+   
+            try:
+                values["away_team_abbr"] = event["competitions"][0]["competitors"][1]["team"]["abbreviation"]
+            except:
+                values["away_team_abbr"] = None
                 
-                try:
-                    values["away_team_score"] = event["competitions"][0]["competitors"][1]["score"]
-                except:
-                    values["away_team_score"] = None
-                    
-                try:
-                    values["away_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][1]["team"]["color"])), 
-                        ''.join(('#',event["competitions"][0]["competitors"][1]["team"]["alternateColor"]))]
-                except:
-                    values["away_team_colors"] = ['#D50A0A','#D50A0A']
+            try:
+                values["away_team_id"] = event["competitions"][0]["competitors"][1]["team"]["id"]
+            except:
+                values["away_team_id"] = None
+            
+            try:
+                values["away_team_city"] = event["competitions"][0]["competitors"][1]["team"]["location"]
+            except:
+                values["away_team_city"] = None
+            
+            try:
+                values["away_team_name"] = event["competitions"][0]["competitors"][1]["team"]["name"]
+            except:
+                values["away_team_name"] = None
+            
+            try:
+                values["away_team_logo"] = event["competitions"][0]["competitors"][1]["team"]["logo"]
+            except:
+                values["away_team_logo"] = None
+            
+            try:
+                values["away_team_score"] = event["competitions"][0]["competitors"][1]["score"]
+            except:
+                values["away_team_score"] = None
                 
-                try:
-                    values["away_team_ls_1"] = event["competitions"][0]["competitors"][1]["linescores"][0]["value"]
-                except:
-                    values["away_team_ls_1"] = None
+            try:
+                values["away_team_colors"] = [''.join(('#',event["competitions"][0]["competitors"][1]["team"]["color"])), 
+                    ''.join(('#',event["competitions"][0]["competitors"][1]["team"]["alternateColor"]))]
+            except:
+                values["away_team_colors"] = ['#D50A0A','#D50A0A']
+            
+            try:
+                values["away_team_ls_1"] = event["competitions"][0]["competitors"][1]["linescores"][0]["value"]
+            except:
+                values["away_team_ls_1"] = None
 
-                try:
-                    values["away_team_ls_2"] = event["competitions"][0]["competitors"][1]["linescores"][1]["value"]
-                except:
-                    values["away_team_ls_2"] = None
+            try:
+                values["away_team_ls_2"] = event["competitions"][0]["competitors"][1]["linescores"][1]["value"]
+            except:
+                values["away_team_ls_2"] = None
 
-                try:
-                    values["away_team_ls_3"] = event["competitions"][0]["competitors"][1]["linescores"][2]["value"]
-                except:
-                    values["away_team_ls_3"] = None
+            try:
+                values["away_team_ls_3"] = event["competitions"][0]["competitors"][1]["linescores"][2]["value"]
+            except:
+                values["away_team_ls_3"] = None
 
-                try:
-                    values["away_team_ls_4"] = event["competitions"][0]["competitors"][1]["linescores"][3]["value"]
-                except:
-                    values["away_team_ls_4"] = None
+            try:
+                values["away_team_ls_4"] = event["competitions"][0]["competitors"][1]["linescores"][3]["value"]
+            except:
+                values["away_team_ls_4"] = None
 
-                try:
-                    values["away_team_ls_ot"] = event["competitions"][0]["competitors"][1]["linescores"][4]["value"]
-                except:
-                    values["away_team_ls_ot"] = None
-                
-                try:
-                    values["away_team_record"] = event["competitions"][0]["competitors"][1]["records"][0]["summary"]
-                except:
-                    values["away_team_record"] = None
+            try:
+                values["away_team_ls_ot"] = event["competitions"][0]["competitors"][1]["linescores"][4]["value"]
+            except:
+                values["away_team_ls_ot"] = None
+            
+            try:
+                values["away_team_record"] = event["competitions"][0]["competitors"][1]["records"][0]["summary"]
+            except:
+                values["away_team_record"] = None
 
-                try:
-                    values["away_team_passing_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][0]["leaders"][0]["displayValue"]
-                except:
-                    values["away_team_passing_leader_stats"] = None
+            try:
+                values["away_team_passing_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][0]["leaders"][0]["displayValue"]
+            except:
+                values["away_team_passing_leader_stats"] = None
 
-                try:
-                    values["away_team_passing_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["away_team_passing_leader_name"] = None
+            try:
+                values["away_team_passing_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["away_team_passing_leader_name"] = None
 
-                try:
-                    values["away_team_rushing_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][1]["leaders"][0]["displayValue"]
-                except:
-                    values["away_team_rushing_leader_stats"] = None
+            try:
+                values["away_team_rushing_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][1]["leaders"][0]["displayValue"]
+            except:
+                values["away_team_rushing_leader_stats"] = None
 
-                try:
-                    values["away_team_rushing_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["away_team_rushing_leader_name"] = None
+            try:
+                values["away_team_rushing_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["away_team_rushing_leader_name"] = None
 
-                try:
-                    values["away_team_receiving_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][2]["leaders"][0]["displayValue"]
-                except:
-                    values["away_team_receiving_leader_stats"] = None
+            try:
+                values["away_team_receiving_leader_stats"] = event["competitions"][0]["competitors"][1]["leaders"][2]["leaders"][0]["displayValue"]
+            except:
+                values["away_team_receiving_leader_stats"] = None
 
-                try:
-                    values["away_team_receiving_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
-                except:
-                    values["away_team_receiving_leader_name"] = None
+            try:
+                values["away_team_receiving_leader_name"] = event["competitions"][0]["competitors"][1]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["away_team_receiving_leader_name"] = None
 
-                try:
-                    values["kickoff_in"] = arrow.get(event["date"]).humanize()
-                except:
-                    values["kickoff_in"] = None
-                
-                try:
-                    values["tv_network"] = event["competitions"][0]["broadcasts"][0]["names"][0]
-                except:
-                    values["tv_network"] = None
+            try:
+                values["kickoff_in"] = _humanize(kickoff, dt_util.now())
+            except:
+                values["kickoff_in"] = None
+            
+            try:
+                values["tv_network"] = event["competitions"][0]["broadcasts"][0]["names"][0]
+            except:
+                values["tv_network"] = None
+            
+            try:
+                values["odds"] = event["competitions"][0]["odds"][0]["details"]
+            except:
+                values["odds"] = None
                 
-                try:
-                    values["odds"] = event["competitions"][0]["odds"][0]["details"]
+            try:
+                values["overunder"] = event["competitions"][0]["odds"][0]["overUnder"]
+            except:
+                values["overunder"] = None
+
+            try:
+                values["private_spread"] = event["competitions"][0]["odds"][0]["spread"]
+            except:
+                values["private_spread"] = None
+            
+            try:
+                values["home_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["homeTeamOdds"]["winPercentage"]
+            except:
+                values["home_team_odds_win_pct"] = None
+            
+            try:
+                values["away_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["awayTeamOdds"]["winPercentage"]
+            except:
+                values["away_team_odds_win_pct"] = None
+            
+            try:
+                values["headlines"] = event["competitions"][0]["headlines"][0]["shortLinkText"]
+            except:
+                values["headlines"] = None
+
+            # Formatted like "Mostly clear"
+            try:
+                values["weather_conditions"] = event["weather"]["displayValue"]
+            except:
+                values["weather_conditions"] = None
+
+            # Integer like "68"
+            try:
+                values["weather_temp"] = event["weather"]["temperature"]
+            except:
+                values["weather_temp"] = None
+
+            try:
+                values["post_game_passing_leader_stats"] = event["competitions"][0]["leaders"][0]["leaders"][0]["displayValue"]
+            except:
+                values["post_game_passing_leader_stats"] = None
+
+            try:
+                values["post_game_passing_leader_name"] = event["competitions"][0]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["post_game_passing_leader_name"] = None
+
+            try:
+                values["post_game_rushing_leader_stats"] = event["competitions"][0]["leaders"][1]["leaders"][0]["displayValue"]
+            except:
+                values["post_game_rushing_leader_stats"] = None
+
+            try:
+                values["post_game_rushing_leader_name"] = event["competitions"][0]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["post_game_rushing_leader_name"] = None
+
+            try:
+                values["post_game_receiving_leader_stats"] = event["competitions"][0]["leaders"][2]["leaders"][0]["displayValue"]
+            except:
+                values["post_game_receiving_leader_stats"] = None
+
+            try:
+                values["post_game_receiving_leader_name"] = event["competitions"][0]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
+            except:
+                values["post_game_receiving_leader_name"] = None
+              
+            if event["status"]["type"]["state"].lower() in ['pre', 'post']: # could use status.completed == true as well
+                values["quarter"] = None
+                values["clock"] = None
+                values["last_play"] = None
+                values["current_drive_summary"] = None
+                values["current_drive_start_position"] = None
+                values["current_drive_elapsed_time"] = None
+                values["down"] = None
+                values["yard_line"] = None
+                values["distance_to_go"] = None
+                values["short_down_distance_text"] = None
+                values["in_red_zone"] = None
+                values["down_distance_text"] = None
+                values["possession"] = None
+                values["home_team_timeouts"] = 3
+                values["away_team_timeouts"] = 3
+                values["home_team_win_probability"] = None
+                values["away_team_win_probability"] = None
+            else:
+                values["quarter"] = event["status"]["period"]
+                values["clock"] = event["status"]["displayClock"]
+                values["last_play"] = event["competitions"][0]["situation"]["lastPlay"]["text"]
+                values["private_play_id"] = event["competitions"][0]["situation"]["lastPlay"].get("id")
+                values["private_play_time"] = dt_util.parse_datetime(
+                    event["competitions"][0]["situation"]["lastPlay"].get("wallclock") or ""
+                )
+
+                # Description of current drive, expressed like "1 play, 8 yards, 0:26"
+                try:
+                    values["current_drive_summary"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["description"]
                 except:
-                    values["odds"] = None
-                    
+                    values["current_drive_summary"] = None
+
+                # Description of where current drive started, expressed like "LAR 16"
                 try:
-                    values["overunder"] = event["competitions"][0]["odds"][0]["overUnder"]
+                    values["current_drive_start_position"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["start"]["text"]
                 except:
-                    values["overunder"] = None
-                
+                    values["current_drive_start_position"] = None
+
+                # Elapsed time of current drive, expressed like "0:26"
                 try:
-                    values["home_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["homeTeamOdds"]["winPercentage"]
+                    values["current_drive_elapsed_time"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["timeElapsed"]["displayValue"]
                 except:
-                    values["home_team_odds_win_pct"] = None
-                
+                    values["current_drive_elapsed_time"] = None
+
+                # Current down, expressed as integer like "2"
                 try:
-                    values["away_team_odds_win_pct"] = event["competitions"][0]["odds"][1]["awayTeamOdds"]["winPercentage"]
+                    values["down"] = event["competitions"][0]["situation"]["down"]
                 except:
-                    values["away_team_odds_win_pct"] = None
-                
+                    values["down"] = None
+
+                # Current yard line, expressed as integer like "17"
                 try:
-                    values["headlines"] = event["competitions"][0]["headlines"][0]["shortLinkText"]
+                    values["yard_line"] = event["competitions"][0]["situation"]["yardLine"]
                 except:
-                    values["headlines"] = None
+                    values["yard_line"] = None
 
-                # Formatted like "Mostly clear"
+                # Number of yards remaining for 1st down, expressed as integer like "10"
                 try:
-                    values["weather_conditions"] = event["weather"]["displayValue"]
+                    values["distance_to_go"] = event["competitions"][0]["situation"]["distance"]
                 except:
-                    values["weather_conditions"] = None
+                    values["distance_to_go"] = None
 
-                # Integer like "68"
+                # Short description of down and distance, expressed like "2nd & 10"
                 try:
-                    values["weather_temp"] = event["weather"]["temperature"]
+                    values["short_down_distance_text"] = event["competitions"][0]["situation"]["shortDownDistanceText"]
                 except:
-                    values["weather_temp"] = None
+                    values["short_down_distance_text"] = None
 
+                # Indicator if team is in red zone( eg. "true" or "false")
                 try:
-                    values["post_game_passing_leader_stats"] = event["competitions"][0]["leaders"][0]["leaders"][0]["displayValue"]
+                    values["in_red_zone"] = event["competitions"][0]["situation"]["isRedZone"]
                 except:
-                    values["post_game_passing_leader_stats"] = None
+                    values["in_red_zone"] = None
 
                 try:
-                    values["post_game_passing_leader_name"] = event["competitions"][0]["leaders"][0]["leaders"][0]["athlete"]["displayName"]
+                    values["down_distance_text"] = event["competitions"][0]["situation"]["downDistanceText"]
                 except:
-                    values["post_game_passing_leader_name"] = None
-
+                    values["down_distance_text"] = None
                 try:
-                    values["post_game_rushing_leader_stats"] = event["competitions"][0]["leaders"][1]["leaders"][0]["displayValue"]
+                    values["possession"] = event["competitions"][0]["situation"]["possession"]
                 except:
-                    values["post_game_rushing_leader_stats"] = None
-
+                    values["possession"] = None
                 try:
-                    values["post_game_rushing_leader_name"] = event["competitions"][0]["leaders"][1]["leaders"][0]["athlete"]["displayName"]
+                    values["home_team_timeouts"] = event["competitions"][0]["situation"]["homeTimeouts"]
                 except:
-                    values["post_game_rushing_leader_name"] = None
-
+                    values["home_team_timeouts"] = None
                 try:
-                    values["post_game_receiving_leader_stats"] = event["competitions"][0]["leaders"][2]["leaders"][0]["displayValue"]
+                    values["away_team_timeouts"] = event["competitions"][0]["situation"]["awayTimeouts"]
                 except:
-                    values["post_game_receiving_leader_stats"] = None
-
+                    values["away_team_timeouts"] = None
                 try:
-                    values["post_game_receiving_leader_name"] = event["competitions"][0]["leaders"][2]["leaders"][0]["athlete"]["displayName"]
+                    values["home_team_win_probability"] = event["competitions"][0]["situation"]["lastPlay"]["probability"]["homeWinPercentage"]
                 except:
-                    values["post_game_receiving_leader_name"] = None
-                  
-                if event["status"]["type"]["state"].lower() in ['pre', 'post']: # could use status.completed == true as well
-                    values["quarter"] = None
-                    values["clock"] = None
-                    values["last_play"] = None
-                    values["current_drive_summary"] = None
-                    values["current_drive_start_position"] = None
-                    values["current_drive_elapsed_time"] = None
-                    values["down"] = None
-                    values["yard_line"] = None
-                    values["distance_to_go"] = None
-                    values["short_down_distance_text"] = None
-                    values["in_red_zone"] = None
-                    values["down_distance_text"] = None
-                    values["possession"] = None
-                    values["home_team_timeouts"] = 3
-                    values["away_team_timeouts"] = 3
                     values["home_team_win_probability"] = None
+                try:
+                    values["away_team_win_probability"] = event["competitions"][0]["situation"]["lastPlay"]["probability"]["awayWinPercentage"]
+                except:
                     values["away_team_win_probability"] = None
-                else:
-                    values["quarter"] = event["status"]["period"]
-                    values["clock"] = event["status"]["displayClock"]
-                    values["last_play"] = event["competitions"][0]["situation"]["lastPlay"]["text"]
-
-                    # Description of current drive, expressed like "1 play, 8 yards, 0:26"
-                    try:
-                        values["current_drive_summary"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["description"]
-                    except:
-                        values["current_drive_summary"] = None
-
-                    # Description of where current drive started, expressed like "LAR 16"
-                    try:
-                        values["current_drive_start_position"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["start"]["text"]
-                    except:
-                        values["current_drive_start_position"] = None
-
-                    # Elapsed time of current drive, expressed like "0:26"
-                    try:
-                        values["current_drive_elapsed_time"] = event["competitions"][0]["situation"]["lastPlay"]["drive"]["timeElapsed"]["displayValue"]
-                    except:
-                        values["current_drive_elapsed_time"] = None
-
-                    # Current down, expressed as integer like "2"
-                    try:
-                        values["down"] = event["competitions"][0]["situation"]["down"]
-                    except:
-                        values["down"] = None
-
-                    # Current yard line, expressed as integer like "17"
-                    try:
-                        values["yard_line"] = event["competitions"][0]["situation"]["yardLine"]
-                    except:
-                        values["yard_line"] = None
-
-                    # Number of yards remaining for 1st down, expressed as integer like "10"
-                    try:
-                        values["distance_to_go"] = event["competitions"][0]["situation"]["distance"]
-                    except:
-                        values["distance_to_go"] = None
-
-                    # Short description of down and distance, expressed like "2nd & 10"
-                    try:
-                        values["short_down_distance_text"] = event["competitions"][0]["situation"]["shortDownDistanceText"]
-                    except:
-                        values["short_down_distance_text"] = None
-
-                    # Indicator if team is in red zone( eg. "true" or "false")
-                    try:
-                        values["in_red_zone"] = event["competitions"][0]["situation"]["isRedZone"]
-                    except:
-                        values["in_red_zone"] = None
-
-                    try:
-                        values["down_distance_text"] = event["competitions"][0]["situation"]["downDistanceText"]
-                    except:
-                        values["down_distance_text"] = None
-                    try:
-                        values["possession"] = event["competitions"][0]["situation"]["possession"]
-                    except:
-                        values["possession"] = None
-                    try:
-                        values["home_team_timeouts"] = event["competitions"][0]["situation"]["homeTimeouts"]
-                    except:
-                        values["home_team_timeouts"] = None
-                    try:
-                        values["away_team_timeouts"] = event["competitions"][0]["situation"]["awayTimeouts"]
-                    except:
-                        values["away_team_timeouts"] = None
-                    try:
-                        values["home_team_win_probability"] = event["competitions"][0]["situation"]["lastPlay"]["probability"]["homeWinPercentage"]
-                    except:
-                        values["home_team_win_probability"] = None
-                    try:
-                        values["away_team_win_probability"] = event["competitions"][0]["situation"]["lastPlay"]["probability"]["awayWinPercentage"]
-                    except:
-                        values["away_team_win_probability"] = None
-                    
-                values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
-                values["private_fast_refresh"] = False
-        
+                
+            values["last_update"] = _now_w3c()
+            values["private_fast_refresh"] = False
+    
         # Never found the team. Either a bye or a post-season condition
         if not found_team:
             _LOGGER.debug("Did not find a game with for the configured team. Checking if it's a bye week.")
@@ -659,14 +1277,14 @@ async def async_get_state(config) -> dict:
                         values["home_team_name"] = bye_team["shortDisplayName"]
                         values["home_team_logo"] = bye_team["logo"]
                         values["state"] = 'BYE'
-                        values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
+                        values["last_update"] = _now_w3c()
                 if found_bye == False:
                         _LOGGER.debug("Team not found in active games or bye week list. Have you missed the playoffs?")
                         values["home_team_abbr"] = None
                         values["home_team_name"] = None
                         values["home_team_logo"] = None
                         values["state"] = 'NOT_FOUND'
-                        values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
+                        values["last_update"] = _now_w3c()
             except:
                 _LOGGER.debug("Team not found in active games or bye week list. Have you missed the playoffs?")
                 values["week_number"] = None
@@ -674,9 +1292,23 @@ async def async_get_state(config) -> dict:
                 values["home_team_name"] = None
                 values["home_team_logo"] = None
                 values["state"] = 'NOT_FOUND'
-                values["last_update"] = arrow.now().format(arrow.FORMAT_W3C)
-
-        if values["state"] == 'PRE' and ((arrow.get(values["date"])-arrow.now()).total_seconds() < 1200):
+                values["last_update"] = _now_w3c()
+
+        from .players import find_player, leader_index, parse_watchlist
+
+        watchlist = parse_watchlist(config)
+        if watchlist:
+            index = leader_index(data)
+            values["private_watchlist"] = {
+                player: find_player(index, player) for player in watchlist
+            }
+
+        values["private_kickoff"] = kickoff
+        values["private_upstream_time"] = data.get("upstream_time")
+        values["private_warm_up"] = values["state"] == 'PRE' and kickoff is not None and (
+            (kickoff - dt_util.now()).total_seconds() < WARMUP_LEAD_SECONDS
+        )
+        if values["state"] == 'PRE' and kickoff is not None and ((kickoff - dt_util.now()).total_seconds() < 1200):
             _LOGGER.debug("Event is within 20 minutes, setting refresh rate to 5 seconds.")
             values["private_fast_refresh"] = True
         elif values["state"] == 'IN':
@@ -784,7 +1416,16 @@ async def async_clear_states(config) -> dict:
         "away_team_win_probability": None,
         "last_update": None,
         "team_id": None,
-        "private_fast_refresh": False
+        "game_details": None,
+        "private_fast_refresh": False,
+        "private_warm_up": False,
+        "private_kickoff": None,
+        "private_event_id": None,
+        "private_play_id": None,
+        "private_spread": None,
+        "private_play_time": None,
+        "private_upstream_time": None,
+        "private_watchlist": {},
     }
 
     return values
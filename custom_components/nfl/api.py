@@ -0,0 +1,557 @@
+"""Scoreboard fetch layer for NFL."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+import zlib
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .const import (
+    API_ENDPOINT,
+    BUDGET_MAX_WAIT_SECONDS,
+    CLIENT,
+    DEFAULT_LEAGUE,
+    DETAIL_CACHE_SIZE,
+    DETAIL_REQUESTS_PER_MINUTE,
+    DOMAIN,
+    LOOP_HOLD_SAMPLES,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+    PRIORITY_PRE,
+    RECORDER_DIR,
+    SCOREBOARD_CACHE_SECONDS,
+    SUMMARY_ENDPOINT,
+    TEAM_ENDPOINT,
+    TEAM_SCHEDULE_ENDPOINT,
+    USER_AGENT,
+)
+from .freshness import LatencyHistogram, upstream_time
+from .limiter import RequestBudget, RequestBudgetExceeded, get_request_budget
+
+if TYPE_CHECKING:
+    from .flight_recorder import FlightRecorder
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only advertise the encodings _decode_body can undo
+_ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+# Key under which a scoreboard keeps its team index once built
+_TEAM_INDEX = "team_index"
+
+# The parts of the scoreboard the parser reads. True keeps a value as-is, a
+# dict keeps only the listed keys (of each item, for lists). Everything else,
+# such as the season calendar, links, tickets and athlete bios, is dropped.
+_LEADERS_SLICE = {
+    "name": True,
+    "leaders": {"displayValue": True, "athlete": {"id": True, "displayName": True}},
+}
+_SCOREBOARD_SLICE = {
+    "season": {"year": True, "type": True},
+    "week": {
+        "number": True,
+        "teamsOnBye": {"abbreviation": True, "shortDisplayName": True, "logo": True},
+    },
+    "events": {
+        "id": True,
+        "date": True,
+        "name": True,
+        "shortName": True,
+        "week": True,
+        "season": {"year": True, "type": True},
+        "weather": {"displayValue": True, "temperature": True},
+        "status": {"displayClock": True, "period": True, "type": True},
+        "competitions": {
+            "attendance": True,
+            "type": True,
+            "notes": {"headline": True},
+            "series": {"summary": True},
+            "venue": {"fullName": True, "address": True, "capacity": True, "indoor": True},
+            "broadcasts": {"names": True},
+            "odds": {
+                "details": True,
+                "overUnder": True,
+                "spread": True,
+                "homeTeamOdds": {"winPercentage": True},
+                "awayTeamOdds": {"winPercentage": True},
+            },
+            "headlines": {"shortLinkText": True},
+            "leaders": _LEADERS_SLICE,
+            "competitors": {
+                "homeAway": True,
+                "score": True,
+                "linescores": {"value": True},
+                "records": {"summary": True},
+                "leaders": _LEADERS_SLICE,
+                "team": {
+                    "id": True,
+                    "abbreviation": True,
+                    "location": True,
+                    "name": True,
+                    "logo": True,
+                    "color": True,
+                    "alternateColor": True,
+                },
+            },
+            "situation": {
+                "down": True,
+                "yardLine": True,
+                "distance": True,
+                "shortDownDistanceText": True,
+                "downDistanceText": True,
+                "isRedZone": True,
+                "possession": True,
+                "homeTimeouts": True,
+                "awayTimeouts": True,
+                "lastPlay": {
+                    "id": True,
+                    "text": True,
+                    "wallclock": True,
+                    "probability": True,
+                    "drive": {
+                        "description": True,
+                        "start": {"text": True},
+                        "timeElapsed": {"displayValue": True},
+                    },
+                },
+            },
+        },
+    },
+}
+
+_SCHEDULE_SLICE = {
+    "events": {
+        "id": True,
+        "date": True,
+        "name": True,
+        "shortName": True,
+        "week": {"number": True},
+        "competitions": {
+            "venue": {"fullName": True, "address": True},
+            "broadcasts": {"media": {"shortName": True}},
+            "status": {"type": {"state": True, "shortDetail": True}},
+        },
+    },
+}
+
+_DRIVE_SLICE = {
+    "description": True,
+    "displayResult": True,
+    "team": {"abbreviation": True},
+    "start": {"text": True},
+    "end": {"text": True},
+    "timeElapsed": {"displayValue": True},
+    "yards": True,
+}
+_SUMMARY_SLICE = {
+    "drives": {"previous": _DRIVE_SLICE, "current": _DRIVE_SLICE},
+    "boxscore": {
+        "teams": {
+            "team": {"abbreviation": True},
+            "statistics": {"label": True, "displayValue": True},
+        },
+        "players": {
+            "team": {"abbreviation": True},
+            "statistics": {
+                "name": True,
+                "labels": True,
+                "athletes": {"athlete": {"displayName": True}, "stats": True},
+            },
+        },
+    },
+    "scoringPlays": {
+        "text": True,
+        "type": {"abbreviation": True},
+        "team": {"abbreviation": True},
+        "period": {"number": True},
+        "clock": {"displayValue": True},
+        "awayScore": True,
+        "homeScore": True,
+    },
+}
+
+
+def _slice(node, spec):
+    """Return the parts of node selected by spec."""
+    if spec is True:
+        return node
+    if isinstance(node, list):
+        return [_slice(item, spec) for item in node]
+    if not isinstance(node, dict):
+        return node
+    return {key: _slice(node[key], sub) for key, sub in spec.items() if key in node}
+
+
+def _decode_body(raw: bytes, encoding: str) -> bytes:
+    """Undo the content encoding of a response body."""
+    if encoding == "gzip":
+        return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib header
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(raw)
+    return raw
+
+
+def extract_scoreboard(data: dict) -> dict:
+    """Return the slices of a decoded scoreboard that the parser needs."""
+    return _slice(data, _SCOREBOARD_SLICE)
+
+
+def _scoreboard_competitor(competitor: dict) -> dict:
+    """Return a team endpoint competitor in the scoreboard's shape."""
+    competitor = dict(competitor)
+    score = competitor.get("score")
+    if isinstance(score, dict):
+        competitor["score"] = score.get("displayValue")
+    if "record" in competitor:
+        competitor["records"] = competitor.pop("record")
+    team = competitor.get("team")
+    if isinstance(team, dict) and "logo" not in team and team.get("logos"):
+        competitor["team"] = {**team, "logo": team["logos"][0].get("href")}
+    return competitor
+
+
+def extract_team(data: dict) -> dict:
+    """Return a team's next event from the team endpoint as a one-game scoreboard.
+
+    The team endpoint nests the status inside the competition, returns scores
+    as objects and names broadcasts differently; this moves them to where the
+    scoreboard parser expects them.
+    """
+    events = []
+    for event in data.get("team", {}).get("nextEvent", []):
+        event = dict(event)
+        competitions = []
+        for competition in event.get("competitions", []):
+            competition = dict(competition)
+            status = competition.pop("status", None)
+            if status is not None:
+                event.setdefault("status", status)
+            competition["competitors"] = [
+                _scoreboard_competitor(competitor)
+                for competitor in competition.get("competitors", [])
+            ]
+            competition["broadcasts"] = [
+                {"names": [broadcast["media"]["shortName"]]}
+                for broadcast in competition.get("broadcasts", [])
+                if broadcast.get("media", {}).get("shortName")
+            ]
+            competitions.append(competition)
+        event["competitions"] = competitions
+        events.append(event)
+    return _slice({"events": events}, _SCOREBOARD_SLICE)
+
+
+def extract_schedule(data: dict) -> dict:
+    """Return the slices of a decoded team schedule that the calendar needs."""
+    return _slice(data, _SCHEDULE_SLICE)
+
+
+def extract_summary(data: dict) -> dict:
+    """Return the drive chart, box score and scoring plays of a game summary."""
+    summary = _slice(data, _SUMMARY_SLICE)
+    drives = summary.get("drives", {})
+    return {
+        "drives": drives.get("previous", []) + ([drives["current"]] if "current" in drives else []),
+        "box_score": summary.get("boxscore", {}),
+        "scoring_plays": summary.get("scoringPlays", []),
+    }
+
+
+def team_events(data: dict, team_id: str) -> list[dict]:
+    """Return the scoreboard events team_id plays in.
+
+    The events are indexed by competitor abbreviation on first use and the
+    index is kept in the scoreboard, so every team parsed from one fetch
+    shares a single pass over the events, however many the league lists.
+    """
+    index = data.get(_TEAM_INDEX)
+    if index is None:
+        index = data[_TEAM_INDEX] = {}
+        for event in data.get("events", []):
+            for competition in event.get("competitions", [])[:1]:
+                for competitor in competition.get("competitors", []):
+                    abbreviation = competitor.get("team", {}).get("abbreviation")
+                    if abbreviation:
+                        index.setdefault(abbreviation.upper(), []).append(event)
+    return index.get(team_id, [])
+
+
+def _scoreboard_key(league: str, params: dict | None) -> str:
+    """Return the cache key of a league's scoreboard query."""
+    url = API_ENDPOINT.format(league=league)
+    return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+
+def get_client(hass: HomeAssistant) -> ScoreboardClient:
+    """Return the scoreboard client shared by every NFL coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if CLIENT not in domain_data:
+        domain_data[CLIENT] = ScoreboardClient(hass)
+    return domain_data[CLIENT]
+
+
+class ScoreboardClient:
+    """Fetch the league scoreboard over a pooled Home Assistant session.
+
+    The session leaves bodies compressed so the client can count the bytes on
+    the wire as well as the bytes decoded; it asks for gzip, deflate and,
+    when a brotli module is installed, br.
+
+    Responses are cached for a few seconds so coordinators that refresh at the
+    same time share one request instead of each downloading the scoreboard.
+    Every network request draws from the integration-wide request budget; when
+    the budget refuses a request the last payload is served instead. Game
+    summaries have a budget of their own and are cached per play, so they are
+    only requested again once the game has moved on.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        self._session: aiohttp.ClientSession | None = None
+        self._cache: dict[str, tuple[float, dict]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.last_timings: dict[str, float] = {}
+        # Milliseconds each fetch held the event loop decoding and slicing its body
+        self.decode_holds = LatencyHistogram(LOOP_HOLD_SAMPLES)
+        self.last_transfer: dict[str, int | str] = {}
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.recorder: FlightRecorder | None = None
+        self._recording_for: set[str] = set()
+        self._results_for: set[str] = set()
+        self._stored_finals: set[str] = set()
+        self._details: dict[str, tuple[str, dict]] = {}
+        self.detail_budget = RequestBudget(DETAIL_REQUESTS_PER_MINUTE)
+
+    def set_recording(self, key: str, enabled: bool) -> None:
+        """Turn the flight recorder on or off for key; it runs while any key wants it."""
+        if enabled:
+            self._recording_for.add(key)
+        else:
+            self._recording_for.discard(key)
+
+        if self._recording_for and self.recorder is None:
+            from .flight_recorder import FlightRecorder
+
+            self.recorder = FlightRecorder(self.hass, self.hass.config.path(RECORDER_DIR))
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+            _LOGGER.debug("Flight recorder writing to %s", self.recorder.directory)
+        elif not self._recording_for and self.recorder is not None:
+            self.hass.async_create_task(self.recorder.async_flush())
+            self.recorder = None
+
+    def set_results_tracking(self, key: str, enabled: bool) -> None:
+        """Turn storing final results on or off for key; it runs while any key wants it."""
+        if enabled:
+            self._results_for.add(key)
+        else:
+            self._results_for.discard(key)
+
+    @callback
+    def _async_store_finals(self, data: dict) -> None:
+        """Add games that went final since the last fetch to the results store."""
+        # sqlite3 is only loaded once results are tracked
+        from .results import game_from_event, get_results_store
+
+        season = data.get("season", {})
+        games = []
+        for event in data.get("events", []):
+            if event.get("id") in self._stored_finals:
+                continue
+            event_season = event.get("season", season)
+            if event_season.get("year") is None:
+                continue
+            game = game_from_event(event, event_season["year"], event_season.get("type", 2))
+            if game is not None:
+                self._stored_finals.add(game["event_id"])
+                games.append(game)
+        if games:
+            _LOGGER.debug("Storing %s final results", len(games))
+            self.hass.async_create_task(get_results_store(self.hass).async_add_games(games))
+
+    async def _async_stop(self, _event: Event) -> None:
+        """Flush recorded payloads when Home Assistant stops."""
+        if self.recorder is not None:
+            await self.recorder.async_flush()
+
+    async def async_get_scoreboard(
+        self,
+        league: str = DEFAULT_LEAGUE,
+        params: dict | None = None,
+        max_age: float = SCOREBOARD_CACHE_SECONDS,
+        priority: int = PRIORITY_IDLE,
+    ) -> dict | None:
+        """Return a league's scoreboard, reusing a cached copy younger than max_age."""
+        url = API_ENDPOINT.format(league=league)
+        key = _scoreboard_key(league, params)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+
+            max_wait = BUDGET_MAX_WAIT_SECONDS if priority == PRIORITY_LIVE else 0
+            try:
+                data = await self._async_fetch(url, params, priority, max_wait)
+            except RequestBudgetExceeded:
+                if cached is not None:
+                    _LOGGER.debug("Request budget exhausted, serving cached scoreboard")
+                    return cached[1]
+                raise
+            if data is None:
+                return None
+
+            self._cache[key] = (time.monotonic(), data)
+            if self._results_for and league == DEFAULT_LEAGUE:
+                self._async_store_finals(data)
+            return data
+
+    @callback
+    def async_invalidate_scoreboard(
+        self, league: str = DEFAULT_LEAGUE, params: dict | None = None
+    ) -> None:
+        """Drop a league's cached scoreboard, so the next request fetches it."""
+        self._cache.pop(_scoreboard_key(league, params), None)
+
+    async def async_get_scoreboard_page(
+        self, params: dict, priority: int = PRIORITY_IDLE, max_wait: float = 0
+    ) -> dict | None:
+        """Return an uncached NFL scoreboard query, such as a past week.
+
+        Pages are not flight recorded: replays expect the live scoreboard.
+        """
+        return await self._async_fetch(
+            API_ENDPOINT.format(league=DEFAULT_LEAGUE), params, priority, max_wait, record=False
+        )
+
+    async def async_get_team(
+        self, team_id: str, priority: int = PRIORITY_IDLE, league: str = DEFAULT_LEAGUE
+    ) -> dict | None:
+        """Return a team's next event, a far smaller request than the scoreboard."""
+        url = TEAM_ENDPOINT.format(league=league, team_id=team_id.lower())
+        return await self._async_fetch(url, None, priority, 0, extract_team)
+
+    async def async_get_team_schedule(
+        self, team_id: str, priority: int = PRIORITY_IDLE, league: str = DEFAULT_LEAGUE
+    ) -> dict | None:
+        """Return a team's season schedule."""
+        url = TEAM_SCHEDULE_ENDPOINT.format(league=league, team_id=team_id.lower())
+        return await self._async_fetch(url, None, priority, 0, extract_schedule)
+
+    async def async_get_game_summary(
+        self, event_id: str, sequence: str, league: str = DEFAULT_LEAGUE
+    ) -> dict | None:
+        """Return a game's details, requesting them only once per play sequence."""
+        lock = self._locks.setdefault(f"summary:{event_id}", asyncio.Lock())
+        async with lock:
+            cached = self._details.get(event_id)
+            if cached is not None and cached[0] == sequence:
+                return cached[1]
+
+            try:
+                data = await self._async_fetch(
+                    SUMMARY_ENDPOINT.format(league=league),
+                    {"event": event_id},
+                    PRIORITY_LIVE,
+                    0,
+                    extract_summary,
+                    self.detail_budget,
+                )
+            except RequestBudgetExceeded:
+                _LOGGER.debug("Detail budget exhausted, serving cached summary for %s", event_id)
+                return cached[1] if cached is not None else None
+            if data is None:
+                return cached[1] if cached is not None else None
+
+            self._details.pop(event_id, None)
+            self._details[event_id] = (sequence, data)
+            while len(self._details) > DETAIL_CACHE_SIZE:
+                del self._details[next(iter(self._details))]
+            return data
+
+    async def _async_fetch(
+        self,
+        url: str,
+        params: dict | None,
+        priority: int,
+        max_wait: float,
+        extract=extract_scoreboard,
+        budget: RequestBudget | None = None,
+        record: bool = True,
+    ) -> dict | None:
+        """Request url within the request budget and return its extracted slices."""
+        budget = budget or get_request_budget(self.hass)
+        if not await budget.async_acquire(priority, max_wait):
+            raise RequestBudgetExceeded(f"No request budget left for {url}")
+
+        if self._session is None:
+            self._session = async_create_clientsession(self.hass, auto_decompress=False)
+
+        started = time.perf_counter()
+        async with self._session.get(url, params=params, headers=self._headers) as r:
+            _LOGGER.debug("Getting scoreboard from %s", r.url)
+            if r.status != 200:
+                _LOGGER.debug("Scoreboard request returned HTTP %s", r.status)
+                return None
+            raw = await r.read()
+            encoding = r.headers.get(hdrs.CONTENT_ENCODING, "identity").lower()
+            upstream = upstream_time(r.headers)
+            request_url = str(r.url)
+        received = time.perf_counter()
+        body = _decode_body(raw, encoding)
+        self.last_transfer = {
+            "encoding": encoding,
+            "compressed_bytes": len(raw),
+            "decompressed_bytes": len(body),
+        }
+        self.bytes_received += len(raw)
+        self.bytes_decoded += len(body)
+        del raw
+        if self.recorder is not None and record and extract is extract_scoreboard:
+            # Replays feed records to the scoreboard parser, so only record live scoreboards
+            self.recorder.async_record(request_url, body)
+        # Keep only the slices the parser reads; the raw body and full
+        # document are released when this returns
+        data = extract(json.loads(body))
+        data["upstream_time"] = upstream
+        del body
+        self.last_timings = {
+            "network": received - started,
+            "decode": time.perf_counter() - received,
+        }
+        self.decode_holds.add(self.last_timings["decode"] * 1000)
+        return data
+
+    async def async_warm_up(self, league: str = DEFAULT_LEAGUE, params: dict | None = None) -> None:
+        """Open the pooled connection and refresh the cached scoreboard."""
+        _LOGGER.debug("Warming up the %s scoreboard connection", league)
+        await self.async_get_scoreboard(league, params, max_age=0, priority=PRIORITY_PRE)
@@ -0,0 +1,80 @@
+"""Season backfill for NFL."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from .api import get_client
+from .const import (
+    BACKFILL_CONCURRENCY,
+    BACKFILL_MAX_WAIT_SECONDS,
+    PRIORITY_IDLE,
+    SEASON_WEEKS,
+)
+from .limiter import RequestBudgetExceeded
+from .results import game_from_event, get_results_store
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_backfill_season(
+    hass: HomeAssistant, season: int, seasontype: int, weeks: list[int] | None = None
+) -> dict:
+    """Store the final results of a season, skipping weeks already backfilled.
+
+    Weeks are fetched a few at a time and every request waits its turn in the
+    request budget. A week only counts as done once it lists games and all of
+    them are final, so an interrupted, in-progress or not yet scheduled season
+    picks up where it left off.
+    """
+    store = get_results_store(hass)
+    client = get_client(hass)
+    weeks = weeks or list(range(1, SEASON_WEEKS[seasontype] + 1))
+    done = await store.async_completed_weeks(season, seasontype)
+    pending = [week for week in weeks if week not in done]
+    semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+    async def _async_backfill_week(week: int) -> int:
+        async with semaphore:
+            data = await client.async_get_scoreboard_page(
+                {"dates": season, "seasontype": seasontype, "week": week},
+                PRIORITY_IDLE,
+                BACKFILL_MAX_WAIT_SECONDS,
+            )
+        if data is None:
+            raise ValueError(f"No scoreboard for week {week}")
+
+        events = data.get("events", [])
+        games = [game for event in events if (game := game_from_event(event, season, seasontype))]
+        await store.async_add_games(games)
+        # An empty week is one ESPN has not published yet, not a finished one
+        if games and len(games) == len(events):
+            await store.async_mark_week_done(season, seasontype, week)
+        return len(games)
+
+    results = await asyncio.gather(
+        *(_async_backfill_week(week) for week in pending), return_exceptions=True
+    )
+
+    stored = 0
+    failed = []
+    for week, result in zip(pending, results):
+        if isinstance(result, (RequestBudgetExceeded, aiohttp.ClientError, asyncio.TimeoutError, ValueError)):
+            _LOGGER.debug("Backfill of %s week %s failed: %s", season, week, result)
+            failed.append(week)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            stored += result
+
+    return {
+        "season": season,
+        "seasontype": seasontype,
+        "weeks_fetched": len(pending) - len(failed),
+        "weeks_skipped": len(weeks) - len(pending),
+        "weeks_failed": failed,
+        "games_stored": stored,
+    }
@@ -0,0 +1,108 @@
+"""Binary sensor platform for NFL."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_FRESHNESS_SLO, COORDINATOR, DEFAULT_FRESHNESS_SLO, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Setup the binary sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    async_add_entities(
+        [NFLStaleDataBinarySensor(hass, entry, team) for team in coordinator.teams]
+    )
+
+
+class NFLStaleDataBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """On while a live game's data is older than the freshness SLO.
+
+    Outside games the integration polls slowly on purpose, so the SLO only
+    applies while the game is live or about to kick off.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, team: str) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._team = team
+        self._recheck_unsub = None
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_stale{self.coordinator.unique_id_suffix(self._team)}"
+
+    @property
+    def name(self):
+        """Return the name of the binary sensor."""
+        return f"{self.coordinator.team_name(self._team)} Stale Data"
+
+    @property
+    def _slo(self) -> int:
+        return self.coordinator.config.get(CONF_FRESHNESS_SLO) or DEFAULT_FRESHNESS_SLO
+
+    @property
+    def _age(self) -> float | None:
+        """Return the age of the team's data if the SLO applies to it now."""
+        state = (self.coordinator.data or {}).get(self._team, {})
+        upstream = state.get("private_upstream_time")
+        if upstream is None or not (state.get("state") == "IN" or state.get("private_fast_refresh")):
+            return None
+        return (dt_util.utcnow() - upstream).total_seconds()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return whether the data is older than the SLO."""
+        age = self._age
+        if age is None:
+            return False
+        return age > self._slo
+
+    @property
+    def extra_state_attributes(self):
+        """Return the SLO and the current data age."""
+        age = self._age
+        return {"slo": self._slo, "age": round(age, 1) if age is not None else None}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state and recheck it once the data would breach the SLO."""
+        self._async_cancel_recheck()
+        age = self._age
+        if age is not None and age <= self._slo:
+            self._recheck_unsub = async_call_later(
+                self.hass, self._slo - age + 1, self._async_recheck
+            )
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_recheck(self, _now) -> None:
+        """Re-evaluate the SLO when no fresh data arrived in time."""
+        self._recheck_unsub = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_recheck(self) -> None:
+        if self._recheck_unsub is not None:
+            self._recheck_unsub()
+            self._recheck_unsub = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending recheck."""
+        self._async_cancel_recheck()
+        await super().async_will_remove_from_hass()
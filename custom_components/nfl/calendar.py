@@ -0,0 +1,93 @@
+"""Calendar platform for NFL."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import COORDINATOR, DOMAIN
+from .schedule import GAME_DURATION, TeamSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Setup the calendar platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    calendars = []
+    for team in coordinator.teams:
+        schedule = TeamSchedule(hass, team, coordinator.league)
+        await schedule.async_load()
+        calendars.append(NFLScheduleCalendar(hass, entry, team, schedule))
+    async_add_entities(calendars)
+
+
+def _calendar_event(start: datetime, event: dict) -> CalendarEvent:
+    """Return a schedule event as a CalendarEvent."""
+    description = event["description"]
+    if event.get("tv_network"):
+        description = f"{description} ({event['tv_network']})"
+    return CalendarEvent(
+        start=start,
+        end=start + GAME_DURATION,
+        summary=event["summary"],
+        description=description,
+        location=event["location"] or None,
+        uid=event["id"],
+    )
+
+
+class NFLScheduleCalendar(CoordinatorEntity, CalendarEntity):
+    """Season schedule of the tracked team."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, team: str, schedule: TeamSchedule
+    ) -> None:
+        """Initialize the calendar."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._team = team
+        self._schedule = schedule
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_schedule{self.coordinator.unique_id_suffix(self._team)}"
+
+    @property
+    def name(self):
+        """Return the name of the calendar."""
+        return f"{self.coordinator.team_name(self._team)} Schedule"
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the game in progress or the next one."""
+        upcoming = self._schedule.next_event(dt_util.utcnow())
+        if upcoming is None:
+            return None
+        return _calendar_event(*upcoming)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the games between start_date and end_date."""
+        return [
+            _calendar_event(start, event)
+            for start, event in self._schedule.events_between(start_date, end_date)
+        ]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Patch the current game into the schedule and refresh it when stale."""
+        data = (self.coordinator.data or {}).get(self._team, {})
+        self._schedule.async_update_game(
+            data.get("private_event_id"), data.get("date"), data.get("tv_network")
+        )
+        if self._schedule.stale:
+            self.hass.async_create_task(self._schedule.async_refresh())
+        super()._handle_coordinator_update()
@@ -4,21 +4,41 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
 
 from .const import (
-    API_ENDPOINT,
+    CONF_FLIGHT_RECORDER,
+    CONF_FRESHNESS_SLO,
+    CONF_GROUPS,
+    CONF_IDLE_INTERVAL,
+    CONF_LEAGUE,
+    CONF_LIMIT,
+    CONF_LIVE_INTERVAL,
+    CONF_MQTT_MODE,
+    CONF_MQTT_TOPIC,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_STANDINGS,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
+    CONF_WATCHLIST,
+    CONF_WEBHOOK,
+    DEFAULT_FRESHNESS_SLO,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_LEAGUE,
+    DEFAULT_LIVE_INTERVAL,
+    DEFAULT_MQTT_TOPIC,
     DEFAULT_NAME,
+    DEFAULT_REQUESTS_PER_MINUTE,
     DEFAULT_TIMEOUT,
     DOMAIN,
-    USER_AGENT,
+    LEAGUES,
+    MQTT_MODE_OFF,
+    MQTT_MODES,
 )
 
 JSON_FEATURES = "features"
@@ -27,6 +47,41 @@ JSON_ID = "id"
 
 _LOGGER = logging.getLogger(__name__)
 
+TEAMS = [
+    'ARI',
+    'ATL',
+    'BAL',
+    'BUF',
+    'CAR',
+    'CHI',
+    'CIN',
+    'CLE',
+    'DAL',
+    'DEN',
+    'DET',
+    'GB',
+    'HOU',
+    'IND',
+    'JAX',
+    'KC',
+    'LAC',
+    'LAR',
+    'LV',
+    'MIA',
+    'MIN',
+    'NE',
+    'NO',
+    'NYG',
+    'NYJ',
+    'PHI',
+    'PIT',
+    'SEA',
+    'SF',
+    'TB',
+    'TEN',
+    'WSH'
+]
+
 
 def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
     """Gets a schema using the default_dict as a backup."""
@@ -37,11 +92,57 @@ def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
         """Gets default value for key."""
         return user_input.get(key, default_dict.get(key))
 
+    # Entries created before several teams were supported store a single team
+    teams = _get_default(CONF_TEAM_ID) or []
+    if isinstance(teams, str):
+        teams = [teams]
+
     return vol.Schema(
         {
-            vol.Required(CONF_TEAM_ID, default=_get_default(CONF_TEAM_ID)): str,
+            vol.Required(CONF_TEAM_ID, default=teams): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=TEAMS, multiple=True, custom_value=True
+                )
+            ),
+            vol.Optional(
+                CONF_LEAGUE, default=_get_default(CONF_LEAGUE) or DEFAULT_LEAGUE
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=list(LEAGUES), custom_value=True)
+            ),
+            vol.Optional(CONF_GROUPS, default=_get_default(CONF_GROUPS) or ""): str,
+            vol.Optional(CONF_LIMIT, default=_get_default(CONF_LIMIT) or 0): int,
             vol.Optional(CONF_NAME, default=_get_default(CONF_NAME)): str,
             vol.Optional(CONF_TIMEOUT, default=_get_default(CONF_TIMEOUT)): int,
+            vol.Optional(
+                CONF_REQUESTS_PER_MINUTE,
+                default=_get_default(CONF_REQUESTS_PER_MINUTE) or DEFAULT_REQUESTS_PER_MINUTE,
+            ): int,
+            vol.Optional(
+                CONF_LIVE_INTERVAL,
+                default=_get_default(CONF_LIVE_INTERVAL) or DEFAULT_LIVE_INTERVAL,
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_IDLE_INTERVAL,
+                default=_get_default(CONF_IDLE_INTERVAL) or DEFAULT_IDLE_INTERVAL,
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_FLIGHT_RECORDER, default=_get_default(CONF_FLIGHT_RECORDER) or False
+            ): bool,
+            vol.Optional(CONF_STANDINGS, default=_get_default(CONF_STANDINGS) or False): bool,
+            vol.Optional(CONF_WATCHLIST, default=_get_default(CONF_WATCHLIST) or ""): str,
+            vol.Optional(
+                CONF_FRESHNESS_SLO,
+                default=_get_default(CONF_FRESHNESS_SLO) or DEFAULT_FRESHNESS_SLO,
+            ): int,
+            vol.Optional(
+                CONF_MQTT_MODE, default=_get_default(CONF_MQTT_MODE) or MQTT_MODE_OFF
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=MQTT_MODES, translation_key=CONF_MQTT_MODE)
+            ),
+            vol.Optional(
+                CONF_MQTT_TOPIC, default=_get_default(CONF_MQTT_TOPIC) or DEFAULT_MQTT_TOPIC
+            ): str,
+            vol.Optional(CONF_WEBHOOK, default=_get_default(CONF_WEBHOOK) or False): bool,
         }
     )
 
@@ -49,41 +150,8 @@ def _get_schema(hass: Any, user_input: list, default_dict: list) -> Any:
 async def _get_team_list(self):
     """Return list of team acronyms"""
 
-    team_list = [
-        'ARI',
-        'ATL',
-        'BAL',
-        'BUF',
-        'CAR',
-        'CHI',
-        'CIN',
-        'CLE',
-        'DAL',
-        'DEN',
-        'DET',
-        'GB',
-        'HOU',
-        'IND',
-        'JAX',
-        'KC',
-        'LAC',
-        'LAR',
-        'LV',
-        'MIA',
-        'MIN',
-        'NE',
-        'NO',
-        'NYG',
-        'NYJ',
-        'PHI',
-        'PIT',
-        'SEA',
-        'SF',
-        'TB',
-        'TEN',
-        'WSH'
-    ]
-    
+    team_list = list(TEAMS)
+
     _LOGGER.debug("Team list: %s", team_list)
     return team_list
 
@@ -115,6 +183,9 @@ class NFLScoresFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._team_list = await _get_team_list(self)
 
         if user_input is not None:
+            if not user_input.get(CONF_TEAM_ID):
+                self._errors[CONF_TEAM_ID] = "no_teams"
+                return await self._show_config_form(user_input)
             self._data.update(user_input)
             return self.async_create_entry(title=self._data[CONF_NAME], data=self._data)
         return await self._show_config_form(user_input)
@@ -126,7 +197,20 @@ class NFLScoresFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         defaults = {
             CONF_NAME: DEFAULT_NAME,
             CONF_TIMEOUT: DEFAULT_TIMEOUT,
-            CONF_TEAM_ID: self._team_list,
+            CONF_REQUESTS_PER_MINUTE: DEFAULT_REQUESTS_PER_MINUTE,
+            CONF_LIVE_INTERVAL: DEFAULT_LIVE_INTERVAL,
+            CONF_IDLE_INTERVAL: DEFAULT_IDLE_INTERVAL,
+            CONF_FLIGHT_RECORDER: False,
+            CONF_STANDINGS: False,
+            CONF_WATCHLIST: "",
+            CONF_FRESHNESS_SLO: DEFAULT_FRESHNESS_SLO,
+            CONF_LEAGUE: DEFAULT_LEAGUE,
+            CONF_GROUPS: "",
+            CONF_LIMIT: 0,
+            CONF_MQTT_MODE: MQTT_MODE_OFF,
+            CONF_MQTT_TOPIC: DEFAULT_MQTT_TOPIC,
+            CONF_WEBHOOK: False,
+            CONF_TEAM_ID: [],
         }
 
         return self.async_show_form(
@@ -147,12 +231,16 @@ class NFLScoresOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize."""
         self.config = config_entry
-        self._data = dict(config_entry.options)
+        self._data = {**config_entry.data, **config_entry.options}
         self._errors = {}
 
     async def async_step_init(self, user_input=None):
         """Manage options."""
+        self._errors = {}
         if user_input is not None:
+            if not user_input.get(CONF_TEAM_ID):
+                self._errors[CONF_TEAM_ID] = "no_teams"
+                return await self._show_options_form(user_input)
             self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
         return await self._show_options_form(user_input)
@@ -1,15 +1,133 @@
 # API
-API_ENDPOINT = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+LEAGUE_ENDPOINT = "http://site.api.espn.com/apis/site/v2/sports/football/{league}"
+API_ENDPOINT = LEAGUE_ENDPOINT + "/scoreboard"
+TEAM_ENDPOINT = LEAGUE_ENDPOINT + "/teams/{team_id}"
+TEAM_SCHEDULE_ENDPOINT = LEAGUE_ENDPOINT + "/teams/{team_id}/schedule"
+SUMMARY_ENDPOINT = LEAGUE_ENDPOINT + "/summary"
+# Football leagues on the same ESPN API and their default scoreboard parameters;
+# without groups the college scoreboard only lists ranked teams, 80 is all of FBS
+LEAGUES = {
+    "nfl": {},
+    "college-football": {"groups": "80", "limit": "400"},
+}
+SCOREBOARD_CACHE_SECONDS = 4
+SCOREBOARD_SERVICE_MAX_AGE = 60
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 11_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15"
 
 # Config
 CONF_TIMEOUT = "timeout"
 CONF_TEAM_ID = "team_id"
+CONF_REQUESTS_PER_MINUTE = "requests_per_minute"
+CONF_LIVE_INTERVAL = "live_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_FLIGHT_RECORDER = "flight_recorder"
+CONF_STANDINGS = "standings"
+CONF_WATCHLIST = "watchlist"
+CONF_FRESHNESS_SLO = "freshness_slo"
+CONF_LEAGUE = "league"
+CONF_GROUPS = "groups"
+CONF_LIMIT = "limit"
+CONF_MQTT_MODE = "mqtt_mode"
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_WEBHOOK = "webhook"
+CONF_WEBHOOK_ID = "webhook_id"
 
 # Defaults
 DEFAULT_ICON = "mdi:football"
+STANDINGS_ICON = "mdi:format-list-numbered"
+DETAIL_ICON = "mdi:clipboard-list"
+PLAYER_ICON = "mdi:account-star"
+FRESHNESS_ICON = "mdi:timer-sand"
 DEFAULT_NAME = "NFL Tracker"
 DEFAULT_TIMEOUT = 120
+DEFAULT_REQUESTS_PER_MINUTE = 30
+DEFAULT_LIVE_INTERVAL = 5
+DEFAULT_IDLE_INTERVAL = 600
+DEFAULT_FRESHNESS_SLO = 60
+DEFAULT_LEAGUE = "nfl"
+DEFAULT_MQTT_TOPIC = "nfl"
+
+# Polling
+WARMUP_LEAD_SECONDS = 1500
+WARMUP_INTERVAL_SECONDS = 60
+# Idle refreshes use the team endpoint but re-read the full scoreboard this often
+SCOREBOARD_RECHECK_SECONDS = 21600
+# Each team costs one team endpoint request, so only entries tracking this many
+# teams or fewer use it; anything more costs more than one shared scoreboard read
+IDLE_TEAM_ENDPOINT_MAX_TEAMS = 1
+
+# Request budget priorities, most urgent first
+PRIORITY_LIVE = 0
+PRIORITY_PRE = 1
+PRIORITY_IDLE = 2
+BUDGET_MAX_WAIT_SECONDS = 5
+
+# Game details, fetched from the summary endpoint on their own budget
+DETAIL_REQUESTS_PER_MINUTE = 12
+DETAIL_CACHE_SIZE = 16
+
+# Win probability and betting line series
+SERIES_SIZE = 512
+SERIES_GAMES = 2
+SERIES_POINTS = 60
+
+# Event loop holds: the time a refresh runs without yielding, kept per refresh
+LOOP_HOLD_SAMPLES = 200
+LOOP_HOLD_BUDGET_MS = 50
+
+# Freshness
+FRESHNESS_SAMPLES = 500
+FRESHNESS_BUCKETS = (1, 2, 5, 10, 15, 30, 60, 120, 300)
+
+# Sharing game state over MQTT: one publishing instance polls, subscribers don't
+MQTT_MODE_OFF = "off"
+MQTT_MODE_PUBLISH = "publish"
+MQTT_MODE_SUBSCRIBE = "subscribe"
+MQTT_MODES = [MQTT_MODE_OFF, MQTT_MODE_PUBLISH, MQTT_MODE_SUBSCRIBE]
+# Publish a full retained snapshot after this many diffs
+MQTT_SNAPSHOT_EVERY = 12
+
+# Pushed scoreboards: with a webhook, polling only runs as a safety net this often
+WEBHOOK_SAFETY_NET_SECONDS = 120
+
+# Flight recorder
+RECORDER_DIR = "nfl_flight_recorder"
+RECORDER_MAX_BYTES = 50 * 1024 * 1024
+RECORDER_SEGMENTS = 10
+RECORDER_FLUSH_SECONDS = 60
+RECORDER_FLUSH_BYTES = 1024 * 1024
+# Recorded payloads read from disk per executor job while streaming a recording
+RECORDER_READ_BATCH = 10
+
+# Results store and backfill
+RESULTS_DB = "nfl_results.db"
+BACKFILL_CONCURRENCY = 3
+BACKFILL_MAX_WAIT_SECONDS = 120
+# Weeks per seasontype: 1 preseason, 2 regular season, 3 postseason
+SEASON_WEEKS = {1: 4, 2: 18, 3: 5}
+DIVISIONS = {
+    "AFC East": ["BUF", "MIA", "NE", "NYJ"],
+    "AFC North": ["BAL", "CIN", "CLE", "PIT"],
+    "AFC South": ["HOU", "IND", "JAX", "TEN"],
+    "AFC West": ["DEN", "KC", "LAC", "LV"],
+    "NFC East": ["DAL", "NYG", "PHI", "WSH"],
+    "NFC North": ["CHI", "DET", "GB", "MIN"],
+    "NFC South": ["ATL", "CAR", "NO", "TB"],
+    "NFC West": ["ARI", "LAR", "SEA", "SF"],
+}
+
+# Calendar
+SCHEDULE_STORAGE_VERSION = 1
+SCHEDULE_MAX_AGE_HOURS = 24
+SCHEDULE_RETRY_MINUTES = 30
+SCHEDULE_SAVE_DELAY = 30
+GAME_DURATION_MINUTES = 210
+
+# Derived times: kickoff countdown refresh and stored game ends
+COUNTDOWN_INTERVAL_SECONDS = 60
+GAME_ENDS_STORAGE_VERSION = 1
+GAME_ENDS_SAVE_DELAY = 10
+GAME_ENDS_KEPT = 64
 
 # Misc
 TEAM_ID = ""
@@ -19,4 +137,8 @@ DOMAIN = "nfl"
 PLATFORM = "sensor"
 ATTRIBUTION = "Data provided by ESPN"
 COORDINATOR = "coordinator"
-PLATFORMS = ["sensor"]
+CLIENT = "client"
+RATE_LIMITER = "rate_limiter"
+RESULTS_STORE = "results_store"
+GAME_ENDS = "game_ends"
+PLATFORMS = ["sensor", "binary_sensor", "calendar"]
@@ -0,0 +1,54 @@
+"""Diagnostics for NFL."""
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import get_client
+from .const import CONF_WEBHOOK_ID, COORDINATOR, DOMAIN, LOOP_HOLD_BUDGET_MS
+from .freshness import LatencyHistogram
+
+TO_REDACT = {CONF_WEBHOOK_ID}
+
+
+def _holds(histogram: LatencyHistogram) -> dict:
+    """Return the spread of a histogram's samples."""
+    return {
+        "samples": len(histogram),
+        "p50": histogram.percentile(0.5),
+        "p95": histogram.percentile(0.95),
+        "max": histogram.percentile(1.0),
+    }
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    client = get_client(hass)
+    return {
+        "config": async_redact_data({**entry.data, **entry.options}, TO_REDACT),
+        "teams": {
+            team: (state or {}).get("state") for team, state in (coordinator.data or {}).items()
+        },
+        "update_interval": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        # Parsing runs inline on the event loop; these are the stretches it ran
+        # without yielding, per refresh for parsing and per fetch for decoding
+        "loop_hold_ms": {
+            "budget": LOOP_HOLD_BUDGET_MS,
+            "last_parse": coordinator.last_loop_hold,
+            "parse": {
+                **_holds(coordinator.loop_holds),
+                "over_budget": coordinator.loop_holds_over_budget,
+            },
+            "decode": _holds(client.decode_holds),
+        },
+        "freshness_s": _holds(coordinator.latency),
+        "transfer": {
+            **client.last_transfer,
+            "bytes_received": client.bytes_received,
+            "bytes_decoded": client.bytes_decoded,
+        },
+    }
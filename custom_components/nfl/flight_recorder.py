@@ -0,0 +1,141 @@
+"""Flight recorder for raw NFL scoreboard payloads."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    RECORDER_FLUSH_BYTES,
+    RECORDER_FLUSH_SECONDS,
+    RECORDER_MAX_BYTES,
+    RECORDER_SEGMENTS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_SEGMENT_GLOB = "segment-*.jsonl.gz"
+
+
+class FlightRecorder:
+    """Append distinct scoreboard payloads to a ring of gzip segments.
+
+    Each record is a JSON header line (timestamp, url, sha1) followed by the raw
+    payload on one line. Records are buffered and written in batches from the
+    executor. Once the newest segment reaches its share of the size cap a new
+    one is started and the oldest segments are deleted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        segments: int = RECORDER_SEGMENTS,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.directory = directory
+        self._segment_bytes = max_bytes // segments
+        self._segments = segments
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._recent: deque[str] = deque(maxlen=64)
+        self._flush_unsub = None
+        self._write_lock = asyncio.Lock()
+
+    @callback
+    def async_record(self, url: str, body: bytes) -> None:
+        """Queue a payload unless it was recorded recently."""
+        digest = hashlib.sha1(body).hexdigest()
+        if digest in self._recent:
+            return
+        self._recent.append(digest)
+
+        header = json.dumps({"ts": dt_util.utcnow().isoformat(), "url": url, "sha1": digest})
+        # JSON never has raw line breaks inside strings, so this keeps it intact
+        payload = body.replace(b"\r", b" ").replace(b"\n", b" ")
+        record = b"".join((header.encode(), b"\n", payload, b"\n"))
+        self._pending.append(record)
+        self._pending_bytes += len(record)
+
+        if self._pending_bytes >= RECORDER_FLUSH_BYTES:
+            self.hass.async_create_task(self.async_flush())
+        elif self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self.hass, RECORDER_FLUSH_SECONDS, self._async_flush_later
+            )
+
+    async def _async_flush_later(self, _now) -> None:
+        """Flush the batch when the flush timer fires."""
+        self._flush_unsub = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the pending batch from the executor."""
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+        if not batch:
+            return
+        async with self._write_lock:
+            await self.hass.async_add_executor_job(self._write, batch)
+
+    def _write(self, batch: list[bytes]) -> None:
+        """Append batch to the newest segment and trim the ring."""
+        os.makedirs(self.directory, exist_ok=True)
+        segments = sorted(glob.glob(os.path.join(self.directory, _SEGMENT_GLOB)))
+        if segments and os.path.getsize(segments[-1]) < self._segment_bytes:
+            path = segments[-1]
+        else:
+            index = _segment_index(segments[-1]) + 1 if segments else 0
+            path = os.path.join(self.directory, f"segment-{index:08d}.jsonl.gz")
+            segments.append(path)
+
+        # Each batch is its own gzip member; readers see one continuous stream
+        with gzip.open(path, "ab") as segment:
+            segment.write(b"".join(batch))
+
+        for old in segments[: -self._segments]:
+            os.remove(old)
+        _LOGGER.debug("Recorded %s scoreboard payloads to %s", len(batch), path)
+
+
+def _segment_index(path: str) -> int:
+    """Return the index in a segment file name."""
+    return int(os.path.basename(path).split("-")[1].split(".")[0])
+
+
+def read_records(path: str, limit: int | None = None) -> Iterator[tuple[datetime, bytes]]:
+    """Yield the (timestamp, payload) records in a segment or recorder directory, oldest first.
+
+    Records are read one at a time, so a full recorder never has to fit in
+    memory; reading stops after limit records. This reads files, so iterate
+    it from the executor.
+    """
+    if os.path.isdir(path):
+        paths = sorted(glob.glob(os.path.join(path, _SEGMENT_GLOB)))
+    else:
+        paths = [path]
+
+    count = 0
+    for segment_path in paths:
+        with gzip.open(segment_path, "rb") as segment:
+            for header in segment:
+                if limit is not None and count >= limit:
+                    return
+                payload = segment.readline()
+                count += 1
+                yield dt_util.parse_datetime(json.loads(header)["ts"]), payload
@@ -0,0 +1,69 @@
+"""Data freshness tracking for NFL."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+from .const import FRESHNESS_BUCKETS, FRESHNESS_SAMPLES
+
+
+def _http_date(value: str | None) -> datetime | None:
+    """Parse an HTTP date header."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def upstream_time(headers) -> datetime | None:
+    """Return when ESPN produced a response, from its Last-Modified or Date and Age headers."""
+    modified = _http_date(headers.get("Last-Modified"))
+    if modified is not None:
+        return modified
+    date = _http_date(headers.get("Date"))
+    if date is None:
+        return None
+    try:
+        age = int(headers.get("Age", 0))
+    except ValueError:
+        age = 0
+    return date - timedelta(seconds=age)
+
+
+class LatencyHistogram:
+    """Rolling histogram of the delay between ESPN producing data and Home Assistant reading it."""
+
+    def __init__(self, size: int = FRESHNESS_SAMPLES) -> None:
+        """Initialize."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(max(float(seconds), 0.0))
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency below which fraction of the samples fall."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return round(ordered[min(int(fraction * len(ordered)), len(ordered) - 1)], 1)
+
+    def buckets(self) -> dict[str, int]:
+        """Return the sample count per bucket, like {"<=5s": 12, ">300s": 0}."""
+        counts = {f"<={bound}s": 0 for bound in FRESHNESS_BUCKETS}
+        counts[f">{FRESHNESS_BUCKETS[-1]}s"] = 0
+        for seconds in self._samples:
+            for bound in FRESHNESS_BUCKETS:
+                if seconds <= bound:
+                    counts[f"<={bound}s"] += 1
+                    break
+            else:
+                counts[f">{FRESHNESS_BUCKETS[-1]}s"] += 1
+        return counts
@@ -0,0 +1,68 @@
+"""End times and lengths of finished NFL games."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    GAME_ENDS,
+    GAME_ENDS_KEPT,
+    GAME_ENDS_SAVE_DELAY,
+    GAME_ENDS_STORAGE_VERSION,
+)
+
+
+class GameEnds:
+    """When games went final and how long they ran, kept across restarts.
+
+    ESPN reports neither, so a game's end is captured locally the first time a
+    coordinator sees it go from IN to POST, and its length is measured from
+    kickoff. Only the most recent games are kept.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store = Store(hass, GAME_ENDS_STORAGE_VERSION, f"{DOMAIN}.{GAME_ENDS}")
+        self._ends: dict[str, dict] | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored game ends, once."""
+        if self._ends is None:
+            self._ends = await self._store.async_load() or {}
+
+    def get(self, event_id: str | None) -> dict | None:
+        """Return the game_end_time and game_length of a finished game."""
+        return (self._ends or {}).get(event_id)
+
+    @callback
+    def async_record(self, event_id: str, kickoff: datetime | None) -> dict:
+        """Record that a game ended now and return its end time and length."""
+        if self._ends is None:
+            self._ends = {}
+        if event_id in self._ends:
+            return self._ends[event_id]
+
+        ended = dt_util.now()
+        length = None
+        if kickoff is not None:
+            length = str(timedelta(seconds=int(max((ended - kickoff).total_seconds(), 0))))
+        self._ends[event_id] = {
+            "game_end_time": ended.isoformat(sep=" ", timespec="seconds"),
+            "game_length": length,
+        }
+        while len(self._ends) > GAME_ENDS_KEPT:
+            del self._ends[next(iter(self._ends))]
+        self._store.async_delay_save(lambda: self._ends, GAME_ENDS_SAVE_DELAY)
+        return self._ends[event_id]
+
+
+def get_game_ends(hass: HomeAssistant) -> GameEnds:
+    """Return the game ends shared by every NFL coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if GAME_ENDS not in domain_data:
+        domain_data[GAME_ENDS] = GameEnds(hass)
+    return domain_data[GAME_ENDS]
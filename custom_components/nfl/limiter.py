@@ -0,0 +1,115 @@
+"""Integration-wide request budget for NFL."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DOMAIN,
+    PRIORITY_IDLE,
+    PRIORITY_LIVE,
+    PRIORITY_PRE,
+    RATE_LIMITER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Share of the bucket each priority must leave untouched for the ones above it
+_RESERVE = {
+    PRIORITY_LIVE: 0.0,
+    PRIORITY_PRE: 0.25,
+    PRIORITY_IDLE: 0.5,
+}
+
+
+def get_request_budget(hass: HomeAssistant) -> RequestBudget:
+    """Return the request budget shared by every NFL coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if RATE_LIMITER not in domain_data:
+        domain_data[RATE_LIMITER] = RequestBudget(DEFAULT_REQUESTS_PER_MINUTE)
+    return domain_data[RATE_LIMITER]
+
+
+class RequestBudgetExceeded(Exception):
+    """Raised when the request budget has no room for a request."""
+
+
+class RequestBudget:
+    """Token bucket shared by every NFL coordinator.
+
+    The bucket holds one minute's worth of requests and refills continuously.
+    Live games may wait for a token; pre-game and idle requests are refused
+    rather than queued once the bucket drops into the share reserved for
+    higher priorities. A request that waits never holds up a more urgent one,
+    and while a more urgent request waits, less urgent ones get no tokens.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        """Initialize."""
+        self._budgets: dict[str, int] = {}
+        self._default = requests_per_minute
+        self._capacity = float(requests_per_minute)
+        self._tokens = float(requests_per_minute)
+        self._updated = time.monotonic()
+        self._waiting: dict[int, int] = {}
+
+    @property
+    def requests_per_minute(self) -> int:
+        """Return the effective budget."""
+        return int(self._capacity)
+
+    def set_budget(self, key: str, requests_per_minute: int | None) -> None:
+        """Set the budget requested by key; the smallest configured budget wins."""
+        if requests_per_minute is None:
+            self._budgets.pop(key, None)
+        else:
+            self._budgets[key] = max(int(requests_per_minute), 1)
+        self._refill()
+        self._capacity = float(min(self._budgets.values(), default=self._default))
+        self._tokens = min(self._tokens, self._capacity)
+        _LOGGER.debug("Request budget is %s per minute", self.requests_per_minute)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._capacity / 60
+        )
+        self._updated = now
+
+    def _available(self, priority: int) -> bool:
+        """Return whether a request at priority fits above its reserve."""
+        return self._tokens - 1 >= self._capacity * _RESERVE[priority]
+
+    def _try_take(self, priority: int) -> bool:
+        """Take a token unless a more urgent request is waiting or priority's reserve is reached.
+
+        This never awaits, so checking and taking are atomic on the event loop.
+        """
+        self._refill()
+        if any(count for waiting, count in self._waiting.items() if waiting < priority):
+            return False
+        if not self._available(priority):
+            return False
+        self._tokens -= 1
+        return True
+
+    async def async_acquire(self, priority: int, max_wait: float = 0) -> bool:
+        """Take a token for a request at priority, waiting up to max_wait seconds."""
+        if self._try_take(priority):
+            return True
+        deadline = time.monotonic() + max_wait
+        self._waiting[priority] = self._waiting.get(priority, 0) + 1
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                await asyncio.sleep(min(remaining, 60 / self._capacity))
+                if self._try_take(priority):
+                    return True
+        finally:
+            self._waiting[priority] -= 1
+        _LOGGER.debug("Request budget exhausted for priority %s", priority)
+        return False
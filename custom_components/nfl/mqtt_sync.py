@@ -0,0 +1,183 @@
+"""Share NFL game state between Home Assistant instances over MQTT."""
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from homeassistant.components import mqtt
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_MQTT_MODE,
+    CONF_MQTT_TOPIC,
+    CONF_TEAM_ID,
+    DEFAULT_MQTT_TOPIC,
+    MQTT_MODE_PUBLISH,
+    MQTT_MODE_SUBSCRIBE,
+    MQTT_SNAPSHOT_EVERY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Game details are fetched by each subscriber that reads them, and far too
+# large to share; last_update is sent in the message header instead
+_UNSHARED = frozenset({"game_details", "last_update"})
+# Values that are datetimes in the game state and ISO strings on the wire
+_DATETIMES = ("private_kickoff", "private_play_time", "private_upstream_time")
+
+_MISSING = object()
+
+
+async def _async_templates(config: dict, teams: list[str]) -> dict[str, dict]:
+    """Return each team's cleared state, which shared states are relative to."""
+    from . import async_clear_states
+
+    return {team: await async_clear_states({**config, CONF_TEAM_ID: team}) for team in teams}
+
+
+def _dumps(message: dict) -> str:
+    """Return a message as compact JSON."""
+    return json.dumps(message, default=str, separators=(",", ":"))
+
+
+class GameStatePublisher:
+    """Publish a coordinator's game states, as diffs against the last one sent.
+
+    A team's state is published only when it changed, as the keys that
+    changed. Every few diffs, and whenever the game state itself changes, a
+    full snapshot is retained on the team's state topic instead, so an
+    instance that subscribes late starts from it. States are compacted
+    against the cleared state, so unset attributes are never sent.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, topic: str, templates: dict[str, dict]) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.topic = topic
+        self._templates = templates
+        self._epoch = int(time.time())
+        self._published: dict[str, dict] = {}
+        self._seq: dict[str, int] = {}
+        self._diffs: dict[str, int] = {}
+
+    def _compact(self, team: str, state: dict) -> dict:
+        """Return the shared attributes of state that differ from the cleared state."""
+        template = self._templates[team]
+        return {
+            key: value
+            for key, value in state.items()
+            if key not in _UNSHARED and template.get(key, _MISSING) != value
+        }
+
+    @callback
+    def async_publish_updates(self) -> None:
+        """Publish every team whose state changed since it was last published."""
+        for team, state in (self.coordinator.data or {}).items():
+            if team not in self._templates:
+                continue
+            compact = self._compact(team, state)
+            previous = self._published.get(team)
+            if compact == previous:
+                continue
+
+            seq = self._seq[team] = self._seq.get(team, 0) + 1
+            self._published[team] = compact
+            header = {"epoch": self._epoch, "seq": seq, "updated": state.get("last_update")}
+            if (
+                previous is None
+                or self._diffs.get(team, 0) >= MQTT_SNAPSHOT_EVERY
+                or previous.get("state") != compact.get("state")
+            ):
+                self._diffs[team] = 0
+                self._async_publish(f"{team}/state", {**header, "state": compact}, True)
+                continue
+
+            self._diffs[team] += 1
+            changed = {
+                key: value for key, value in compact.items() if previous.get(key, _MISSING) != value
+            }
+            unset = [key for key in previous if key not in compact]
+            self._async_publish(f"{team}/diff", {**header, "set": changed, "unset": unset}, False)
+
+    @callback
+    def _async_publish(self, subtopic: str, message: dict, retain: bool) -> None:
+        """Publish a message under the shared topic."""
+        self.hass.async_create_task(
+            mqtt.async_publish(self.hass, f"{self.topic}/{subtopic}", _dumps(message), 0, retain)
+        )
+
+
+class GameStateSubscriber:
+    """Fill a coordinator's game states from another instance's publisher.
+
+    Diffs are applied only on top of the state they follow; after a missed
+    diff or a publisher restart the team waits for the next snapshot.
+    """
+
+    def __init__(self, coordinator, templates: dict[str, dict]) -> None:
+        """Initialize."""
+        self.coordinator = coordinator
+        self._templates = templates
+        self._shared: dict[str, dict] = {}
+        self._position: dict[str, tuple[int, int]] = {}
+
+    @callback
+    def async_message_received(self, msg) -> None:
+        """Apply a snapshot or diff of one tracked team."""
+        try:
+            team, kind = msg.topic.rsplit("/", 2)[-2:]
+            message = json.loads(msg.payload)
+            position = (message["epoch"], message["seq"])
+        except (ValueError, KeyError, TypeError) as error:
+            _LOGGER.debug("Ignoring MQTT message on %s: %s", msg.topic, error)
+            return
+        if team not in self._templates:
+            return
+
+        current = self._position.get(team)
+        if kind == "state":
+            if current is not None and current[0] == position[0] and current[1] >= position[1]:
+                return
+            self._shared[team] = dict(message["state"])
+        elif kind == "diff":
+            if current != (position[0], position[1] - 1):
+                return
+            shared = self._shared[team]
+            shared.update(message["set"])
+            for key in message["unset"]:
+                shared.pop(key, None)
+        else:
+            return
+
+        self._position[team] = position
+        state = {**self._templates[team], **self._shared[team]}
+        for key in _DATETIMES:
+            if isinstance(state.get(key), str):
+                state[key] = dt_util.parse_datetime(state[key])
+        state["last_update"] = message.get("updated")
+        self.coordinator.async_set_shared_state(team, state)
+
+
+async def async_setup_mqtt_sync(hass: HomeAssistant, coordinator) -> CALLBACK_TYPE | None:
+    """Start publishing or subscribing, as configured; return a callback that stops it."""
+    mode = coordinator.config.get(CONF_MQTT_MODE)
+    if mode not in (MQTT_MODE_PUBLISH, MQTT_MODE_SUBSCRIBE):
+        return None
+    if not await mqtt.async_wait_for_mqtt_client(hass):
+        raise ConfigEntryNotReady("MQTT is not connected")
+
+    topic = (coordinator.config.get(CONF_MQTT_TOPIC) or DEFAULT_MQTT_TOPIC).rstrip("/")
+    templates = await _async_templates(coordinator.config, coordinator.teams)
+    if mode == MQTT_MODE_PUBLISH:
+        publisher = GameStatePublisher(hass, coordinator, topic, templates)
+        publisher.async_publish_updates()
+        _LOGGER.debug("Publishing %s game states to %s", coordinator.name, topic)
+        return coordinator.async_add_listener(publisher.async_publish_updates)
+
+    subscriber = GameStateSubscriber(coordinator, templates)
+    _LOGGER.debug("Reading %s game states from %s", coordinator.name, topic)
+    return await mqtt.async_subscribe(hass, f"{topic}/+/+", subscriber.async_message_received)
@@ -0,0 +1,78 @@
+"""Player watchlist for NFL."""
+from __future__ import annotations
+
+from .const import CONF_WATCHLIST
+
+# Key under which a scoreboard keeps its leader index once built
+_LEADER_INDEX = "leader_index"
+
+
+def parse_watchlist(config: dict) -> list[str]:
+    """Return the watched players, as names or ESPN athlete ids, from config."""
+    watchlist = config.get(CONF_WATCHLIST) or ""
+    if isinstance(watchlist, str):
+        watchlist = watchlist.split(",")
+    return [player.strip() for player in watchlist if player.strip()]
+
+
+def leader_index(data: dict) -> dict[str, dict]:
+    """Return every leader entry of a scoreboard, keyed by athlete id and name.
+
+    The index is built on first use and kept in the scoreboard, so every
+    coordinator reading the same fetch shares it.
+    """
+    index = data.get(_LEADER_INDEX)
+    if index is None:
+        index = data[_LEADER_INDEX] = _build_leader_index(data)
+    return index
+
+
+def _build_leader_index(data: dict) -> dict[str, dict]:
+    """Collect each athlete's leader categories across all games."""
+    players: dict[str, dict] = {}
+
+    def _add(event: dict, category: dict, team: str | None) -> None:
+        for leader in category.get("leaders", []):
+            athlete = leader.get("athlete", {})
+            if "id" not in athlete:
+                continue
+            player = players.setdefault(
+                athlete["id"],
+                {
+                    "athlete_id": athlete["id"],
+                    "name": athlete.get("displayName"),
+                    "team": team,
+                    "event_id": event.get("id"),
+                    "event_short_name": event.get("shortName"),
+                    "game_state": event.get("status", {}).get("type", {}).get("state"),
+                    "stats": {},
+                },
+            )
+            player["team"] = player["team"] or team
+            player["stats"].setdefault(category.get("name"), leader.get("displayValue"))
+
+    for event in data.get("events", []):
+        for competition in event.get("competitions", []):
+            for competitor in competition.get("competitors", []):
+                team = competitor.get("team", {}).get("abbreviation")
+                for category in competitor.get("leaders", []):
+                    _add(event, category, team)
+            for category in competition.get("leaders", []):
+                _add(event, category, None)
+
+    index = dict(players)
+    for player in players.values():
+        if player["name"]:
+            index.setdefault(player["name"].lower(), player)
+    return index
+
+
+def find_player(index: dict[str, dict], player: str) -> dict | None:
+    """Return the index entry of a watched player, by athlete id or name."""
+    return index.get(player) or index.get(player.lower())
+
+
+def stat_line(player: dict) -> str | None:
+    """Return a player's stats as one line, like "21/30, 254 YDS, 2 TD"."""
+    lines = [value for value in player["stats"].values() if value]
+    return "; ".join(lines) if lines else None
@@ -0,0 +1,61 @@
+"""Pushed scoreboard ingestion for NFL."""
+from __future__ import annotations
+
+from http import HTTPStatus
+import json
+import logging
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .api import extract_scoreboard
+from .const import CONF_WEBHOOK_ID, DOMAIN
+from .freshness import upstream_time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def pushed_scoreboard(payload) -> dict | None:
+    """Return a pushed scoreboard or single event as a scoreboard, or None if it is neither."""
+    if not isinstance(payload, dict):
+        return None
+    if isinstance(payload.get("events"), list):
+        return payload
+    if "competitions" in payload and "id" in payload:
+        return {"events": [payload]}
+    return None
+
+
+@callback
+def async_setup_push(hass: HomeAssistant, coordinator) -> CALLBACK_TYPE:
+    """Accept scoreboards posted to the entry's webhook; return a callback that stops it."""
+    webhook_id = coordinator.config[CONF_WEBHOOK_ID]
+
+    async def _async_handle(hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response:
+        """Feed a posted scoreboard or event to the coordinator."""
+        try:
+            payload = json.loads(await request.read())
+        except ValueError:
+            return web.json_response({"error": "invalid JSON"}, status=HTTPStatus.BAD_REQUEST)
+        data = pushed_scoreboard(payload)
+        if data is None:
+            return web.json_response(
+                {"error": "expected a scoreboard or an event"}, status=HTTPStatus.BAD_REQUEST
+            )
+
+        data = extract_scoreboard(data)
+        # A relay can pass ESPN's Last-Modified or Date and Age headers along
+        data["upstream_time"] = upstream_time(request.headers)
+        # Without the week, byes can't be told apart, so only the teams playing are updated
+        teams = await coordinator.async_ingest(data, partial="week" not in data)
+        return web.json_response({"teams": teams})
+
+    webhook.async_register(hass, DOMAIN, coordinator.name, webhook_id, _async_handle)
+    _LOGGER.info("%s accepts pushed scoreboards at /api/webhook/%s", coordinator.name, webhook_id)
+
+    @callback
+    def _async_stop() -> None:
+        webhook.async_unregister(hass, webhook_id)
+
+    return _async_stop
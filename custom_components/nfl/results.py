@@ -0,0 +1,328 @@
+"""Local store of NFL game results."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+
+from .const import DIVISIONS, DOMAIN, RESULTS_DB, RESULTS_STORE
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    event_id TEXT PRIMARY KEY,
+    season INTEGER NOT NULL,
+    seasontype INTEGER NOT NULL,
+    week INTEGER,
+    date TEXT,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_score INTEGER,
+    away_score INTEGER
+);
+CREATE INDEX IF NOT EXISTS games_home_team ON games (home_team, season, seasontype);
+CREATE INDEX IF NOT EXISTS games_away_team ON games (away_team, season, seasontype);
+CREATE INDEX IF NOT EXISTS games_week ON games (season, seasontype, week);
+CREATE TABLE IF NOT EXISTS team_records (
+    team TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    seasontype INTEGER NOT NULL,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    ties INTEGER NOT NULL DEFAULT 0,
+    points_for INTEGER NOT NULL DEFAULT 0,
+    points_against INTEGER NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (team, season, seasontype)
+);
+CREATE TABLE IF NOT EXISTS backfill_progress (
+    season INTEGER NOT NULL,
+    seasontype INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    PRIMARY KEY (season, seasontype, week)
+);
+"""
+_SCHEMA_VERSION = 1
+
+
+def get_results_store(hass: HomeAssistant) -> ResultsStore:
+    """Return the results store shared by the NFL integration."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if RESULTS_STORE not in domain_data:
+        store = ResultsStore(hass, hass.config.path(RESULTS_DB))
+        domain_data[RESULTS_STORE] = store
+
+        async def _async_close(_event: Event) -> None:
+            await store.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close)
+    return domain_data[RESULTS_STORE]
+
+
+def game_from_event(event: dict, season: int, seasontype: int) -> dict | None:
+    """Return the result row for a final event, or None if it isn't final."""
+    try:
+        if event["status"]["type"]["state"] != "post":
+            return None
+        competitors = event["competitions"][0]["competitors"]
+        home = next(c for c in competitors if c["homeAway"] == "home")
+        away = next(c for c in competitors if c["homeAway"] == "away")
+        return {
+            "event_id": event["id"],
+            "season": season,
+            "seasontype": seasontype,
+            "week": event.get("week", {}).get("number"),
+            "date": event.get("date"),
+            "home_team": home["team"]["abbreviation"],
+            "away_team": away["team"]["abbreviation"],
+            "home_score": int(home["score"]),
+            "away_score": int(away["score"]),
+        }
+    except (KeyError, IndexError, StopIteration, TypeError, ValueError):
+        _LOGGER.debug("Skipping event without a usable result: %s", event.get("id"))
+        return None
+
+
+def division_of(team: str) -> str | None:
+    """Return the division team plays in."""
+    for division, teams in DIVISIONS.items():
+        if team in teams:
+            return division
+    return None
+
+
+def format_record(record: dict) -> str:
+    """Return a record like "10-6" or "9-7-1"."""
+    text = f"{record['wins']}-{record['losses']}"
+    return f"{text}-{record['ties']}" if record["ties"] else text
+
+
+def format_streak(streak: int) -> str | None:
+    """Return a streak like "W3" or "L1"."""
+    if streak > 0:
+        return f"W{streak}"
+    if streak < 0:
+        return f"L{-streak}"
+    return None
+
+
+def group_by_division(standings: list[dict]) -> dict[str, list[dict]]:
+    """Split standings into divisions, adding each team's division_rank."""
+    divisions: dict[str, list[dict]] = {}
+    for record in standings:
+        teams = divisions.setdefault(record["division"] or "Other", [])
+        teams.append({**record, "division_rank": len(teams) + 1})
+    return divisions
+
+
+class ResultsStore:
+    """SQLite store of final game results.
+
+    Each team's record and streak is updated as its games are added, so
+    standings are read from the team_records table instead of being computed
+    from every game. The database is only touched from the executor, one job
+    at a time.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _async_run(self, func, *args):
+        """Run func(connection, *args) in the executor."""
+        async with self._lock:
+            return await self.hass.async_add_executor_job(self._run, func, *args)
+
+    def _run(self, func, *args):
+        """Open the database if needed and run func inside a transaction."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(_SCHEMA)
+            with self._connection:
+                _migrate(self._connection)
+        with self._connection:
+            return func(self._connection, *args)
+
+    async def async_add_games(self, games: list[dict]) -> None:
+        """Insert or update final results."""
+        if games:
+            await self._async_run(_add_games, games)
+
+    async def async_mark_week_done(self, season: int, seasontype: int, week: int) -> None:
+        """Record that a week has been backfilled."""
+        await self._async_run(_mark_week_done, season, seasontype, week)
+
+    async def async_completed_weeks(self, season: int, seasontype: int) -> set[int]:
+        """Return the weeks of a season that have been backfilled."""
+        return await self._async_run(_completed_weeks, season, seasontype)
+
+    async def async_latest_season(self) -> int | None:
+        """Return the most recent season with results."""
+        return await self._async_run(_latest_season)
+
+    async def async_standings(self, season: int, seasontype: int) -> list[dict]:
+        """Return every team's record for a season, best first."""
+        return await self._async_run(_standings, season, seasontype)
+
+    async def async_team_record(self, team: str, season: int, seasontype: int) -> dict | None:
+        """Return a team's record for a season."""
+        return await self._async_run(_team_record, team, season, seasontype)
+
+    async def async_head_to_head(
+        self, team: str, opponent: str, season: int | None = None
+    ) -> list[dict]:
+        """Return the games between two teams, newest first."""
+        return await self._async_run(_head_to_head, team, opponent, season)
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        async with self._lock:
+            if self._connection is not None:
+                await self.hass.async_add_executor_job(self._connection.close)
+                self._connection = None
+
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    """Build team records for databases created before they were tracked."""
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        connection.execute("DELETE FROM team_records")
+        for game in connection.execute("SELECT * FROM games ORDER BY date").fetchall():
+            _apply_result(connection, dict(game))
+    connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+
+def _add_games(connection: sqlite3.Connection, games: list[dict]) -> None:
+    for game in games:
+        cursor = connection.execute(
+            """INSERT OR IGNORE INTO games VALUES (
+                :event_id, :season, :seasontype, :week, :date,
+                :home_team, :away_team, :home_score, :away_score
+            )""",
+            game,
+        )
+        if cursor.rowcount:
+            _apply_result(connection, game)
+
+
+def _apply_result(connection: sqlite3.Connection, game: dict) -> None:
+    """Add a new final game to both teams' records and streaks."""
+    sides = (
+        (game["home_team"], game["home_score"], game["away_score"]),
+        (game["away_team"], game["away_score"], game["home_score"]),
+    )
+    for team, scored, allowed in sides:
+        connection.execute(
+            """INSERT INTO team_records
+                (team, season, seasontype, wins, losses, ties, points_for, points_against)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (team, season, seasontype) DO UPDATE SET
+                wins = wins + excluded.wins,
+                losses = losses + excluded.losses,
+                ties = ties + excluded.ties,
+                points_for = points_for + excluded.points_for,
+                points_against = points_against + excluded.points_against""",
+            (
+                team,
+                game["season"],
+                game["seasontype"],
+                int(scored > allowed),
+                int(scored < allowed),
+                int(scored == allowed),
+                scored,
+                allowed,
+            ),
+        )
+        _update_streak(connection, team, game["season"], game["seasontype"])
+
+
+def _update_streak(connection: sqlite3.Connection, team: str, season: int, seasontype: int) -> None:
+    """Recount a team's streak from its latest games.
+
+    Games can arrive out of order during a backfill, so the streak is read
+    back from the indexed games table rather than adjusted in place.
+    """
+    rows = connection.execute(
+        """SELECT CASE WHEN home_team = :team THEN home_score - away_score
+                       ELSE away_score - home_score END AS margin
+        FROM games
+        WHERE (home_team = :team OR away_team = :team)
+            AND season = :season AND seasontype = :seasontype
+        ORDER BY date DESC""",
+        {"team": team, "season": season, "seasontype": seasontype},
+    )
+    streak = 0
+    for (margin,) in rows:
+        if margin == 0 or (streak > 0 and margin < 0) or (streak < 0 and margin > 0):
+            break
+        streak += 1 if margin > 0 else -1
+    connection.execute(
+        "UPDATE team_records SET streak = ? WHERE team = ? AND season = ? AND seasontype = ?",
+        (streak, team, season, seasontype),
+    )
+
+
+def _record_row(row: sqlite3.Row) -> dict:
+    record = dict(row)
+    record["record"] = format_record(record)
+    record["streak"] = format_streak(record["streak"])
+    record["division"] = division_of(record["team"])
+    return record
+
+
+def _latest_season(connection: sqlite3.Connection) -> int | None:
+    return connection.execute("SELECT MAX(season) FROM games").fetchone()[0]
+
+
+def _standings(connection: sqlite3.Connection, season: int, seasontype: int) -> list[dict]:
+    rows = connection.execute(
+        """SELECT * FROM team_records WHERE season = ? AND seasontype = ?
+        ORDER BY (wins + 0.5 * ties) * 1.0 / MAX(wins + losses + ties, 1) DESC,
+            points_for - points_against DESC""",
+        (season, seasontype),
+    )
+    return [_record_row(row) for row in rows]
+
+
+def _team_record(connection: sqlite3.Connection, team: str, season: int, seasontype: int) -> dict | None:
+    row = connection.execute(
+        "SELECT * FROM team_records WHERE team = ? AND season = ? AND seasontype = ?",
+        (team, season, seasontype),
+    ).fetchone()
+    return _record_row(row) if row is not None else None
+
+
+def _head_to_head(connection: sqlite3.Connection, team: str, opponent: str, season: int | None) -> list[dict]:
+    query = """SELECT * FROM games
+        WHERE ((home_team = :team AND away_team = :opponent)
+            OR (home_team = :opponent AND away_team = :team))"""
+    if season is not None:
+        query += " AND season = :season"
+    rows = connection.execute(
+        query + " ORDER BY date DESC",
+        {"team": team, "opponent": opponent, "season": season},
+    )
+    return [dict(row) for row in rows]
+
+
+def _mark_week_done(connection: sqlite3.Connection, season: int, seasontype: int, week: int) -> None:
+    connection.execute(
+        "INSERT OR IGNORE INTO backfill_progress VALUES (?, ?, ?)",
+        (season, seasontype, week),
+    )
+
+
+def _completed_weeks(connection: sqlite3.Connection, season: int, seasontype: int) -> set[int]:
+    rows = connection.execute(
+        "SELECT week FROM backfill_progress WHERE season = ? AND seasontype = ?",
+        (season, seasontype),
+    )
+    return {row[0] for row in rows}
@@ -0,0 +1,179 @@
+"""Season schedule of a tracked NFL team."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from datetime import datetime, timedelta
+import logging
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import get_client
+from .const import (
+    DEFAULT_LEAGUE,
+    DOMAIN,
+    GAME_DURATION_MINUTES,
+    SCHEDULE_MAX_AGE_HOURS,
+    SCHEDULE_RETRY_MINUTES,
+    SCHEDULE_SAVE_DELAY,
+    SCHEDULE_STORAGE_VERSION,
+)
+from .limiter import RequestBudgetExceeded
+
+_LOGGER = logging.getLogger(__name__)
+
+GAME_DURATION = timedelta(minutes=GAME_DURATION_MINUTES)
+
+
+def _schedule_event(event: dict) -> dict:
+    """Return the stored form of a schedule event."""
+    competition = (event.get("competitions") or [{}])[0]
+    venue = competition.get("venue", {})
+    address = venue.get("address", {})
+    broadcast = (competition.get("broadcasts") or [{}])[0]
+    return {
+        "id": event["id"],
+        "start": event["date"],
+        "summary": event.get("shortName") or event.get("name"),
+        "description": event.get("name"),
+        "location": ", ".join(
+            part for part in (venue.get("fullName"), address.get("city"), address.get("state")) if part
+        ),
+        "week": event.get("week", {}).get("number"),
+        "tv_network": broadcast.get("media", {}).get("shortName"),
+    }
+
+
+class TeamSchedule:
+    """A team's season schedule, cached in storage and indexed by kickoff.
+
+    The full schedule is downloaded when the stored copy is missing or older
+    than a day; after a failed download it waits half an hour before trying
+    again. In between, kickoff and TV changes seen by the coordinator are
+    patched into single events. Range queries bisect a sorted list of kickoff
+    times, so they never touch the network.
+    """
+
+    def __init__(self, hass: HomeAssistant, team_id: str, league: str = DEFAULT_LEAGUE) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.team_id = team_id
+        self.league = league
+        key = team_id.lower() if league == DEFAULT_LEAGUE else f"{league}_{team_id.lower()}"
+        self._store = Store(hass, SCHEDULE_STORAGE_VERSION, f"{DOMAIN}.schedule_{key}")
+        self._events: dict[str, dict] = {}
+        self._fetched: datetime | None = None
+        self._attempted: datetime | None = None
+        self._ordered: list[dict] = []
+        self._starts: list[datetime] = []
+        self._refreshing = False
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the full schedule should be downloaded again."""
+        now = dt_util.utcnow()
+        if self._attempted is not None and now - self._attempted < timedelta(
+            minutes=SCHEDULE_RETRY_MINUTES
+        ):
+            return False
+        return self._fetched is None or now - self._fetched > timedelta(hours=SCHEDULE_MAX_AGE_HOURS)
+
+    async def async_load(self) -> None:
+        """Load the stored schedule, downloading it if it is missing or stale."""
+        stored = await self._store.async_load()
+        if stored:
+            self._events = {event["id"]: event for event in stored["events"]}
+            self._fetched = dt_util.parse_datetime(stored["fetched"])
+            self._reindex()
+        if self.stale:
+            await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Download the full schedule and merge it into the stored copy."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        self._attempted = dt_util.utcnow()
+        try:
+            data = await get_client(self.hass).async_get_team_schedule(
+                self.team_id, league=self.league
+            )
+        except (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            ValueError,
+            RequestBudgetExceeded,
+        ) as error:
+            _LOGGER.debug("Unable to fetch the %s schedule: %s", self.team_id, error)
+            return
+        finally:
+            self._refreshing = False
+        if data is None:
+            return
+
+        self._fetched = dt_util.utcnow()
+        events = {}
+        for event in data.get("events", []):
+            try:
+                stored = _schedule_event(event)
+            except KeyError:
+                continue
+            events[stored["id"]] = stored
+        if events != self._events:
+            self._events = events
+            self._reindex()
+        self._store.async_delay_save(self._data_to_save, SCHEDULE_SAVE_DELAY)
+
+    @callback
+    def async_update_game(self, event_id: str | None, start: str | None, tv_network: str | None) -> None:
+        """Patch one game with the kickoff and network seen on the scoreboard."""
+        event = self._events.get(event_id)
+        if event is None or start is None:
+            return
+        if event["start"] == start and (tv_network is None or event["tv_network"] == tv_network):
+            return
+
+        _LOGGER.debug("Updating %s schedule entry %s", self.team_id, event_id)
+        event["start"] = start
+        if tv_network is not None:
+            event["tv_network"] = tv_network
+        self._reindex()
+        self._store.async_delay_save(self._data_to_save, SCHEDULE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the schedule in its stored form."""
+        return {
+            "fetched": self._fetched.isoformat() if self._fetched else None,
+            "events": list(self._events.values()),
+        }
+
+    def _reindex(self) -> None:
+        """Rebuild the kickoff index."""
+        ordered = []
+        for event in self._events.values():
+            start = dt_util.parse_datetime(event["start"])
+            if start is not None:
+                ordered.append((start, event))
+        ordered.sort(key=lambda item: item[0])
+        self._starts = [start for start, _ in ordered]
+        self._ordered = [event for _, event in ordered]
+
+    def events_between(self, start: datetime, end: datetime) -> list[tuple[datetime, dict]]:
+        """Return the (kickoff, event) pairs of games overlapping start to end."""
+        first = bisect_left(self._starts, start - GAME_DURATION)
+        last = bisect_left(self._starts, end)
+        return [
+            (self._starts[index], self._ordered[index])
+            for index in range(first, last)
+            if self._starts[index] + GAME_DURATION > start
+        ]
+
+    def next_event(self, now: datetime) -> tuple[datetime, dict] | None:
+        """Return the game in progress or the next one to kick off."""
+        index = bisect_left(self._starts, now - GAME_DURATION)
+        if index < len(self._starts):
+            return self._starts[index], self._ordered[index]
+        return None
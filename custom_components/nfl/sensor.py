@@ -1,34 +1,64 @@
 import logging
-import uuid
 
 import voluptuous as vol
 from homeassistant.components.sensor import PLATFORM_SCHEMA
-from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
-from . import AlertsDataUpdateCoordinator
+from homeassistant.util import dt as dt_util, slugify
+from . import AlertsDataUpdateCoordinator, async_release_entry
+from .api import get_client
+from .limiter import get_request_budget
+from .players import parse_watchlist, stat_line
 
 from .const import (
     ATTRIBUTION,
+    CONF_FRESHNESS_SLO,
+    CONF_GROUPS,
+    CONF_LEAGUE,
+    CONF_LIMIT,
+    CONF_MQTT_MODE,
+    CONF_MQTT_TOPIC,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_STANDINGS,
     CONF_TIMEOUT,
     CONF_TEAM_ID,
+    CONF_WATCHLIST,
     COORDINATOR,
+    DEFAULT_FRESHNESS_SLO,
     DEFAULT_ICON,
+    DEFAULT_LEAGUE,
+    DEFAULT_MQTT_TOPIC,
     DEFAULT_NAME,
+    DETAIL_ICON,
+    FRESHNESS_ICON,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    MQTT_MODE_OFF,
+    MQTT_MODES,
+    PLAYER_ICON,
+    STANDINGS_ICON,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
-        vol.Required(CONF_TEAM_ID): cv.string,
+        vol.Required(CONF_TEAM_ID): vol.All(cv.ensure_list, [cv.string]),
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
         vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
+        vol.Optional(CONF_REQUESTS_PER_MINUTE): int,
+        vol.Optional(CONF_STANDINGS, default=False): cv.boolean,
+        vol.Optional(CONF_WATCHLIST, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_FRESHNESS_SLO, default=DEFAULT_FRESHNESS_SLO): int,
+        vol.Optional(CONF_LEAGUE, default=DEFAULT_LEAGUE): cv.string,
+        vol.Optional(CONF_GROUPS): cv.string,
+        vol.Optional(CONF_LIMIT): int,
+        vol.Optional(CONF_MQTT_MODE, default=MQTT_MODE_OFF): vol.In(MQTT_MODES),
+        vol.Optional(CONF_MQTT_TOPIC, default=DEFAULT_MQTT_TOPIC): cv.string,
     }
 )
 
@@ -43,6 +73,11 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         config.entry_id = slugify(f"{config.get(CONF_TEAM_ID)}")
         config.data = config
 
+    get_request_budget(hass).set_budget(
+        config.entry_id, config.get(CONF_REQUESTS_PER_MINUTE)
+    )
+    get_client(hass).set_results_tracking(config.entry_id, config[CONF_STANDINGS])
+
     # Setup the data coordinator
     coordinator = AlertsDataUpdateCoordinator(
         hass,
@@ -56,25 +91,51 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     hass.data[DOMAIN][config.entry_id] = {
         COORDINATOR: coordinator,
     }
-    async_add_entities([NFLScoresSensor(hass, config)], True)
+    if config[CONF_MQTT_MODE] != MQTT_MODE_OFF:
+        from .mqtt_sync import async_setup_mqtt_sync
+
+        try:
+            await async_setup_mqtt_sync(hass, coordinator)
+        except ConfigEntryNotReady as error:
+            # Stop what the first refresh started; the platform is set up again later
+            async_release_entry(hass, config.entry_id)
+            await coordinator.async_shutdown()
+            raise PlatformNotReady(str(error)) from error
+    async_add_entities(_entities(hass, config), True)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Setup the sensor platform."""
-    async_add_entities([NFLScoresSensor(hass, entry)], True)
+    async_add_entities(_entities(hass, entry), True)
+
+
+def _entities(hass: HomeAssistant, entry: ConfigEntry) -> list:
+    """Return the sensors of an entry: one set per team plus the watched players."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    entities = []
+    for team in coordinator.teams:
+        entities.append(NFLScoresSensor(hass, entry, team))
+        entities.append(NFLGameDetailSensor(hass, entry, team))
+        entities.append(NFLFreshnessSensor(hass, entry, team))
+        if coordinator.config.get(CONF_STANDINGS) and coordinator.league == DEFAULT_LEAGUE:
+            entities.append(NFLStandingsSensor(hass, entry, team))
+    for player in parse_watchlist(coordinator.config):
+        entities.append(NFLPlayerSensor(hass, entry, player))
+    return entities
 
 
 class NFLScoresSensor(CoordinatorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, team: str) -> None:
         """Initialize the sensor."""
         super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
         self._config = entry
+        self._team = team
         self._name = entry.data[CONF_NAME]
         self._icon = DEFAULT_ICON
         self._state = "PRE"
-        self._my_team_abbr = entry.data[CONF_TEAM_ID]
+        self._my_team_abbr = team
         self._detailed_state = None
         self._game_end_time = None
         self._game_length = None
@@ -171,25 +232,32 @@ class NFLScoresSensor(CoordinatorEntity):
         """
         Return a unique, Home Assistant friendly identifier for this entity.
         """
-        return f"{slugify(self._name)}_{self._config.entry_id}"
+        return f"{slugify(self._name)}_{self._config.entry_id}{self.coordinator.unique_id_suffix(self._team)}"
 
     @property
     def name(self):
         """Return the name of the sensor."""
-        return self._name
+        return self.coordinator.team_name(self._team)
 
     @property
     def icon(self):
         """Return the icon to use in the frontend, if any."""
         return self._icon
 
+    @property
+    def _data(self) -> dict | None:
+        """Return the game state of this sensor's team."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get(self._team)
+
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        if self._data is None:
             return None
-        elif "state" in self.coordinator.data.keys():
-            return self.coordinator.data["state"]
+        elif "state" in self._data.keys():
+            return self._data["state"]
         else:
             return None
 
@@ -198,100 +266,101 @@ class NFLScoresSensor(CoordinatorEntity):
         """Return the state message."""
         attrs = {}
 
-        if self.coordinator.data is None:
+        data = self._data
+        if data is None:
             return attrs
 
         attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
-        attrs["my_team_abbr"] = self.coordinator.data["my_team_abbr"]
-        attrs["detailed_state"] = self.coordinator.data["detailed_state"]
-        attrs["game_end_time"] = self.coordinator.data["game_end_time"]
-        attrs["game_length"] = self.coordinator.data["game_length"]
-        attrs["date"] = self.coordinator.data["date"]
-        attrs["week_number"] = self.coordinator.data["week_number"]
-        attrs["attendance"] = self.coordinator.data["attendance"]
-        attrs["event_name"] = self.coordinator.data["event_name"]
-        attrs["event_short_name"] = self.coordinator.data["event_short_name"]
-        attrs["event_type"] = self.coordinator.data["event_type"]
-        attrs["game_notes"] = self.coordinator.data["game_notes"]
-        attrs["series_summary"] = self.coordinator.data["series_summary"]
-        attrs["venue_name"] = self.coordinator.data["venue_name"]
-        attrs["venue_city"] = self.coordinator.data["venue_city"]
-        attrs["venue_state"] = self.coordinator.data["venue_state"]
-        attrs["venue_capacity"] = self.coordinator.data["venue_capacity"]
-        attrs["venue_indoor"] = self.coordinator.data["venue_indoor"]
-        attrs["game_status"] = self.coordinator.data["game_status"]
-        attrs["home_team_abbr"] = self.coordinator.data["home_team_abbr"]
-        attrs["home_team_id"] = self.coordinator.data["home_team_id"]
-        attrs["home_team_city"] = self.coordinator.data["home_team_city"]
-        attrs["home_team_name"] = self.coordinator.data["home_team_name"]
-        attrs["home_team_logo"] = self.coordinator.data["home_team_logo"]
-        attrs["home_team_score"] = self.coordinator.data["home_team_score"]
-        attrs["home_team_colors"] = self.coordinator.data["home_team_colors"]
-        attrs["home_team_ls_1"] = self.coordinator.data["home_team_ls_1"]
-        attrs["home_team_ls_2"] = self.coordinator.data["home_team_ls_2"]
-        attrs["home_team_ls_3"] = self.coordinator.data["home_team_ls_3"]
-        attrs["home_team_ls_4"] = self.coordinator.data["home_team_ls_4"]
-        attrs["home_team_ls_ot"] = self.coordinator.data["home_team_ls_ot"]
-        attrs["home_team_record"] = self.coordinator.data["home_team_record"]
-        attrs["home_team_passing_leader_stats"] = self.coordinator.data["home_team_passing_leader_stats"]
-        attrs["home_team_passing_leader_name"] = self.coordinator.data["home_team_passing_leader_name"]
-        attrs["home_team_rushing_leader_stats"] = self.coordinator.data["home_team_rushing_leader_stats"]
-        attrs["home_team_rushing_leader_name"] = self.coordinator.data["home_team_rushing_leader_name"]
-        attrs["home_team_receiving_leader_stats"] = self.coordinator.data["home_team_receiving_leader_stats"]
-        attrs["home_team_receiving_leader_name"] = self.coordinator.data["home_team_receiving_leader_name"]
-        attrs["away_team_abbr"] = self.coordinator.data["away_team_abbr"]
-        attrs["away_team_id"] = self.coordinator.data["away_team_id"]
-        attrs["away_team_city"] = self.coordinator.data["away_team_city"]
-        attrs["away_team_name"] = self.coordinator.data["away_team_name"]
-        attrs["away_team_logo"] = self.coordinator.data["away_team_logo"]
-        attrs["away_team_score"] = self.coordinator.data["away_team_score"]
-        attrs["away_team_colors"] = self.coordinator.data["away_team_colors"]
-        attrs["away_team_ls_1"] = self.coordinator.data["away_team_ls_1"]
-        attrs["away_team_ls_2"] = self.coordinator.data["away_team_ls_2"]
-        attrs["away_team_ls_3"] = self.coordinator.data["away_team_ls_3"]
-        attrs["away_team_ls_4"] = self.coordinator.data["away_team_ls_4"]
-        attrs["away_team_ls_ot"] = self.coordinator.data["away_team_ls_ot"]
-        attrs["away_team_record"] = self.coordinator.data["away_team_record"]
-        attrs["away_team_passing_leader_stats"] = self.coordinator.data["away_team_passing_leader_stats"]
-        attrs["away_team_passing_leader_name"] = self.coordinator.data["away_team_passing_leader_name"]
-        attrs["away_team_rushing_leader_stats"] = self.coordinator.data["away_team_rushing_leader_stats"]
-        attrs["away_team_rushing_leader_name"] = self.coordinator.data["away_team_rushing_leader_name"]
-        attrs["away_team_receiving_leader_stats"] = self.coordinator.data["away_team_receiving_leader_stats"]
-        attrs["away_team_receiving_leader_name"] = self.coordinator.data["away_team_receiving_leader_name"]
-        attrs["kickoff_in"] = self.coordinator.data["kickoff_in"]
-        attrs["tv_network"] = self.coordinator.data["tv_network"]
-        attrs["odds"] = self.coordinator.data["odds"]
-        attrs["overunder"] = self.coordinator.data["overunder"]
-        attrs["home_team_odds_win_pct"] = self.coordinator.data["home_team_odds_win_pct"]
-        attrs["away_team_odds_win_pct"] = self.coordinator.data["away_team_odds_win_pct"]
-        attrs["headlines"] = self.coordinator.data["headlines"]
-        attrs["weather_conditions"] = self.coordinator.data["weather_conditions"]
-        attrs["weather_temp"] = self.coordinator.data["weather_temp"]
-        attrs["post_game_passing_leader_stats"] = self.coordinator.data["post_game_passing_leader_stats"]
-        attrs["post_game_passing_leader_name"] = self.coordinator.data["post_game_passing_leader_name"]
-        attrs["post_game_rushing_leader_stats"] = self.coordinator.data["post_game_rushing_leader_stats"]
-        attrs["post_game_rushing_leader_name"] = self.coordinator.data["post_game_rushing_leader_name"]
-        attrs["post_game_receiving_leader_stats"] = self.coordinator.data["post_game_receiving_leader_stats"]
-        attrs["post_game_receiving_leader_name"] = self.coordinator.data["post_game_receiving_leader_name"]
-        attrs["quarter"] = self.coordinator.data["quarter"]
-        attrs["clock"] = self.coordinator.data["clock"]
-        attrs["last_play"] = self.coordinator.data["last_play"]
-        attrs["current_drive_summary"] = self.coordinator.data["current_drive_summary"]
-        attrs["current_drive_start_position"] = self.coordinator.data["current_drive_start_position"]
-        attrs["current_drive_elapsed_time"] = self.coordinator.data["current_drive_elapsed_time"]
-        attrs["down"] = self.coordinator.data["down"]
-        attrs["yard_line"] = self.coordinator.data["yard_line"]
-        attrs["distance_to_go"] = self.coordinator.data["distance_to_go"]
-        attrs["short_down_distance_text"] = self.coordinator.data["short_down_distance_text"]
-        attrs["in_red_zone"] = self.coordinator.data["in_red_zone"]
-        attrs["down_distance_text"] = self.coordinator.data["down_distance_text"]
-        attrs["possession"] = self.coordinator.data["possession"]
-        attrs["home_team_timeouts"] = self.coordinator.data["home_team_timeouts"]
-        attrs["home_team_win_probability"] = self.coordinator.data["home_team_win_probability"]
-        attrs["away_team_timeouts"] = self.coordinator.data["away_team_timeouts"]
-        attrs["away_team_win_probability"] = self.coordinator.data["away_team_win_probability"]
-        attrs["last_update"] = self.coordinator.data["last_update"]
-        #attrs["team_id"] = self.coordinator.data["team_id"]
+        attrs["my_team_abbr"] = data["my_team_abbr"]
+        attrs["detailed_state"] = data["detailed_state"]
+        attrs["game_end_time"] = data["game_end_time"]
+        attrs["game_length"] = data["game_length"]
+        attrs["date"] = data["date"]
+        attrs["week_number"] = data["week_number"]
+        attrs["attendance"] = data["attendance"]
+        attrs["event_name"] = data["event_name"]
+        attrs["event_short_name"] = data["event_short_name"]
+        attrs["event_type"] = data["event_type"]
+        attrs["game_notes"] = data["game_notes"]
+        attrs["series_summary"] = data["series_summary"]
+        attrs["venue_name"] = data["venue_name"]
+        attrs["venue_city"] = data["venue_city"]
+        attrs["venue_state"] = data["venue_state"]
+        attrs["venue_capacity"] = data["venue_capacity"]
+        attrs["venue_indoor"] = data["venue_indoor"]
+        attrs["game_status"] = data["game_status"]
+        attrs["home_team_abbr"] = data["home_team_abbr"]
+        attrs["home_team_id"] = data["home_team_id"]
+        attrs["home_team_city"] = data["home_team_city"]
+        attrs["home_team_name"] = data["home_team_name"]
+        attrs["home_team_logo"] = data["home_team_logo"]
+        attrs["home_team_score"] = data["home_team_score"]
+        attrs["home_team_colors"] = data["home_team_colors"]
+        attrs["home_team_ls_1"] = data["home_team_ls_1"]
+        attrs["home_team_ls_2"] = data["home_team_ls_2"]
+        attrs["home_team_ls_3"] = data["home_team_ls_3"]
+        attrs["home_team_ls_4"] = data["home_team_ls_4"]
+        attrs["home_team_ls_ot"] = data["home_team_ls_ot"]
+        attrs["home_team_record"] = data["home_team_record"]
+        attrs["home_team_passing_leader_stats"] = data["home_team_passing_leader_stats"]
+        attrs["home_team_passing_leader_name"] = data["home_team_passing_leader_name"]
+        attrs["home_team_rushing_leader_stats"] = data["home_team_rushing_leader_stats"]
+        attrs["home_team_rushing_leader_name"] = data["home_team_rushing_leader_name"]
+        attrs["home_team_receiving_leader_stats"] = data["home_team_receiving_leader_stats"]
+        attrs["home_team_receiving_leader_name"] = data["home_team_receiving_leader_name"]
+        attrs["away_team_abbr"] = data["away_team_abbr"]
+        attrs["away_team_id"] = data["away_team_id"]
+        attrs["away_team_city"] = data["away_team_city"]
+        attrs["away_team_name"] = data["away_team_name"]
+        attrs["away_team_logo"] = data["away_team_logo"]
+        attrs["away_team_score"] = data["away_team_score"]
+        attrs["away_team_colors"] = data["away_team_colors"]
+        attrs["away_team_ls_1"] = data["away_team_ls_1"]
+        attrs["away_team_ls_2"] = data["away_team_ls_2"]
+        attrs["away_team_ls_3"] = data["away_team_ls_3"]
+        attrs["away_team_ls_4"] = data["away_team_ls_4"]
+        attrs["away_team_ls_ot"] = data["away_team_ls_ot"]
+        attrs["away_team_record"] = data["away_team_record"]
+        attrs["away_team_passing_leader_stats"] = data["away_team_passing_leader_stats"]
+        attrs["away_team_passing_leader_name"] = data["away_team_passing_leader_name"]
+        attrs["away_team_rushing_leader_stats"] = data["away_team_rushing_leader_stats"]
+        attrs["away_team_rushing_leader_name"] = data["away_team_rushing_leader_name"]
+        attrs["away_team_receiving_leader_stats"] = data["away_team_receiving_leader_stats"]
+        attrs["away_team_receiving_leader_name"] = data["away_team_receiving_leader_name"]
+        attrs["kickoff_in"] = data["kickoff_in"]
+        attrs["tv_network"] = data["tv_network"]
+        attrs["odds"] = data["odds"]
+        attrs["overunder"] = data["overunder"]
+        attrs["home_team_odds_win_pct"] = data["home_team_odds_win_pct"]
+        attrs["away_team_odds_win_pct"] = data["away_team_odds_win_pct"]
+        attrs["headlines"] = data["headlines"]
+        attrs["weather_conditions"] = data["weather_conditions"]
+        attrs["weather_temp"] = data["weather_temp"]
+        attrs["post_game_passing_leader_stats"] = data["post_game_passing_leader_stats"]
+        attrs["post_game_passing_leader_name"] = data["post_game_passing_leader_name"]
+        attrs["post_game_rushing_leader_stats"] = data["post_game_rushing_leader_stats"]
+        attrs["post_game_rushing_leader_name"] = data["post_game_rushing_leader_name"]
+        attrs["post_game_receiving_leader_stats"] = data["post_game_receiving_leader_stats"]
+        attrs["post_game_receiving_leader_name"] = data["post_game_receiving_leader_name"]
+        attrs["quarter"] = data["quarter"]
+        attrs["clock"] = data["clock"]
+        attrs["last_play"] = data["last_play"]
+        attrs["current_drive_summary"] = data["current_drive_summary"]
+        attrs["current_drive_start_position"] = data["current_drive_start_position"]
+        attrs["current_drive_elapsed_time"] = data["current_drive_elapsed_time"]
+        attrs["down"] = data["down"]
+        attrs["yard_line"] = data["yard_line"]
+        attrs["distance_to_go"] = data["distance_to_go"]
+        attrs["short_down_distance_text"] = data["short_down_distance_text"]
+        attrs["in_red_zone"] = data["in_red_zone"]
+        attrs["down_distance_text"] = data["down_distance_text"]
+        attrs["possession"] = data["possession"]
+        attrs["home_team_timeouts"] = data["home_team_timeouts"]
+        attrs["home_team_win_probability"] = data["home_team_win_probability"]
+        attrs["away_team_timeouts"] = data["away_team_timeouts"]
+        attrs["away_team_win_probability"] = data["away_team_win_probability"]
+        attrs["last_update"] = data["last_update"]
+        #attrs["team_id"] = data["team_id"]
 
         return attrs
 
@@ -299,3 +368,238 @@ class NFLScoresSensor(CoordinatorEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
+
+
+class NFLGameDetailSensor(CoordinatorEntity):
+    """Drive chart, box score and scoring plays of the live game.
+
+    Details come from a separate request per play, so the sensor is disabled
+    by default and only asks for them while it is enabled.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"drives", "box_score", "scoring_plays"})
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, team: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._team = team
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_game_details{self.coordinator.unique_id_suffix(self._team)}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.coordinator.team_name(self._team)} Game Details"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return DETAIL_ICON
+
+    @property
+    def _details(self) -> dict | None:
+        return (self.coordinator.data or {}).get(self._team, {}).get("game_details")
+
+    @property
+    def state(self):
+        """Return the number of scoring plays so far."""
+        if self._details is None:
+            return None
+        return len(self._details["scoring_plays"])
+
+    @property
+    def extra_state_attributes(self):
+        """Return the drive chart, box score and scoring plays."""
+        if self._details is None:
+            return {}
+        attrs = dict(self._details)
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
+
+    async def async_added_to_hass(self) -> None:
+        """Ask the coordinator for game details while the sensor is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_detail_consumer(self._team))
+
+
+class NFLFreshnessSensor(CoordinatorEntity):
+    """Age of a team's game data, measured from when ESPN produced it."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, team: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._team = team
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_freshness{self.coordinator.unique_id_suffix(self._team)}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.coordinator.team_name(self._team)} Data Age"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return FRESHNESS_ICON
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "s"
+
+    @property
+    def _state(self) -> dict:
+        return (self.coordinator.data or {}).get(self._team, {})
+
+    @property
+    def state(self):
+        """Return how many seconds old the data was when it was last read."""
+        upstream = self._state.get("private_upstream_time")
+        if upstream is None:
+            return None
+        return round((dt_util.utcnow() - upstream).total_seconds(), 1)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the upstream timestamps and the latency histogram."""
+        latency = self.coordinator.latency
+        attrs = {
+            "upstream_time": self._state.get("private_upstream_time"),
+            "last_play_time": self._state.get("private_play_time"),
+            "latency_samples": len(latency),
+            "latency_p50": latency.percentile(0.5),
+            "latency_p95": latency.percentile(0.95),
+            "latency_histogram": latency.buckets(),
+        }
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
+
+
+class NFLPlayerSensor(CoordinatorEntity):
+    """Stat line of a watched player, read from the scoreboard leaders."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, player: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._player = player
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_player_{slugify(self._player)}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.coordinator.config[CONF_NAME]} {self._player}"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return PLAYER_ICON
+
+    @property
+    def _entry(self) -> dict | None:
+        # Every team's state resolves the same watchlist from the same scoreboard
+        state = (self.coordinator.data or {}).get(self.coordinator.teams[0], {})
+        return state.get("private_watchlist", {}).get(self._player)
+
+    @property
+    def state(self):
+        """Return the player's stat line, or None if they aren't a leader today."""
+        if self._entry is None:
+            return None
+        return stat_line(self._entry)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the player's game and stats by category."""
+        if self._entry is None:
+            return {}
+        attrs = {key: value for key, value in self._entry.items() if key != "stats"}
+        attrs.update(self._entry["stats"])
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
+
+
+class NFLStandingsSensor(CoordinatorEntity):
+    """Season record and division standing of the tracked team."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, team: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass.data[DOMAIN][entry.entry_id][COORDINATOR])
+        self._config = entry
+        self._team = team
+        self._record = None
+        self._last_state = None
+
+    @property
+    def unique_id(self):
+        """Return a unique identifier for this entity."""
+        return f"{self._config.entry_id}_standings{self.coordinator.unique_id_suffix(self._team)}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"{self.coordinator.team_name(self._team)} Standings"
+
+    @property
+    def icon(self):
+        """Return the icon to use in the frontend, if any."""
+        return STANDINGS_ICON
+
+    @property
+    def state(self):
+        """Return the team's record, like "10-6"."""
+        if self._record is None:
+            return None
+        return self._record["record"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the details of the team's record."""
+        if self._record is None:
+            return {}
+        attrs = dict(self._record)
+        attrs[ATTR_ATTRIBUTION] = ATTRIBUTION
+        return attrs
+
+    async def async_added_to_hass(self) -> None:
+        """Load the record when the sensor is added."""
+        await super().async_added_to_hass()
+        await self._async_update_record()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reload the record when the game state changes, such as going final."""
+        state = (self.coordinator.data or {}).get(self._team, {}).get("state")
+        if state != self._last_state:
+            self._last_state = state
+            self.hass.async_create_task(self._async_update_record())
+        super()._handle_coordinator_update()
+
+    async def _async_update_record(self) -> None:
+        """Read the team's record and division rank from the results store."""
+        from .results import get_results_store, group_by_division
+
+        store = get_results_store(self.hass)
+        team = self._team
+        season = await store.async_latest_season()
+        self._record = None
+        if season is not None:
+            standings = await store.async_standings(season, 2)
+            for teams in group_by_division(standings).values():
+                for record in teams:
+                    if record["team"] == team:
+                        self._record = record
+        self.async_write_ha_state()
@@ -0,0 +1,79 @@
+"""Bounded time series of live game numbers for NFL."""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+
+from .const import SERIES_SIZE
+
+# Series kept per game and the game state each one is read from
+SERIES_KEYS = {
+    "win_probability": "home_team_win_probability",
+    "spread": "private_spread",
+    "total": "overunder",
+}
+
+
+class RingSeries:
+    """Fixed-size ring of (timestamp, value) samples stored in two arrays.
+
+    A sample is only added when the value differs from the newest one, so a
+    game that sits on the same line for an hour costs a single sample.
+    """
+
+    def __init__(self, size: int = SERIES_SIZE) -> None:
+        """Initialize."""
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._size = size
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def add(self, when: datetime, value: float) -> bool:
+        """Add a sample unless value is the newest one; return whether it was added."""
+        if self._count and self._values[(self._next - 1) % self._size] == value:
+            return False
+        self._times[self._next] = when.timestamp()
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+        return True
+
+    def samples(self, points: int | None = None) -> list[tuple[float, float]]:
+        """Return the samples oldest first, thinned evenly to at most points."""
+        start = (self._next - self._count) % self._size
+        indexes = [(start + offset) % self._size for offset in range(self._count)]
+        if points is not None and 1 < points < len(indexes):
+            # Always keep the newest sample so the chart ends at the current value
+            step = (len(indexes) - 1) / (points - 1)
+            indexes = [indexes[round(point * step)] for point in range(points)]
+        return [(self._times[index], self._values[index]) for index in indexes]
+
+
+class GameSeries:
+    """The win probability, spread and total series of one game."""
+
+    def __init__(self, event_id: str) -> None:
+        """Initialize."""
+        self.event_id = event_id
+        self.series = {key: RingSeries() for key in SERIES_KEYS}
+
+    def add(self, when: datetime, data: dict) -> None:
+        """Add the values in a parsed game state that changed."""
+        for key, field in SERIES_KEYS.items():
+            try:
+                value = float(data[field])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.series[key].add(when, value)
+
+    def as_dict(self, points: int | None = None) -> dict:
+        """Return the series as [timestamp, value] pairs."""
+        return {
+            key: [[when, value] for when, value in series.samples(points)]
+            for key, series in self.series.items()
+        }
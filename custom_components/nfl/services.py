@@ -0,0 +1,594 @@
+"""Services for NFL."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+from itertools import islice
+import json
+import logging
+import os
+import time
+
+import aiohttp
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import extract_scoreboard, get_client
+from .backfill import async_backfill_season
+from .const import (
+    COORDINATOR,
+    DOMAIN,
+    PRIORITY_IDLE,
+    RECORDER_DIR,
+    RECORDER_READ_BATCH,
+    SCOREBOARD_SERVICE_MAX_AGE,
+)
+from .flight_recorder import read_records
+from .limiter import RequestBudgetExceeded
+from .results import get_results_store, group_by_division
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_DIVISION = "division"
+ATTR_BASELINE = "baseline"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_EXAMPLES = "examples"
+ATTR_LIMIT = "limit"
+ATTR_MAX_AGE = "max_age"
+ATTR_MEMORY = "memory"
+ATTR_OPPONENT = "opponent"
+ATTR_PATH = "path"
+ATTR_SEASON = "season"
+ATTR_SEASONTYPE = "seasontype"
+ATTR_SPEED = "speed"
+ATTR_STATE = "state"
+ATTR_TEAM = "team"
+ATTR_TOP = "top"
+ATTR_UPDATE_BASELINE = "update_baseline"
+ATTR_WEEKS = "weeks"
+
+SERVICE_BACKFILL_SEASON = "backfill_season"
+SERVICE_GET_HEAD_TO_HEAD = "get_head_to_head"
+SERVICE_GET_SCOREBOARD = "get_scoreboard"
+SERVICE_GET_STANDINGS = "get_standings"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_REPLAY = "replay"
+SERVICE_VERIFY_PARSER = "verify_parser"
+
+PARSER_BASELINE = "nfl_parser_baseline.json"
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TOP, default=25): vol.All(int, vol.Range(min=1, max=200)),
+        vol.Optional(ATTR_MEMORY, default=False): cv.boolean,
+    }
+)
+
+BACKFILL_SEASON_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_SEASON): vol.All(vol.Coerce(int), vol.Range(min=2000)),
+        vol.Optional(ATTR_SEASONTYPE, default=2): vol.All(vol.Coerce(int), vol.In([1, 2, 3])),
+        vol.Optional(ATTR_WEEKS): vol.All(cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))]),
+    }
+)
+
+GET_STANDINGS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SEASON): vol.Coerce(int),
+        vol.Optional(ATTR_SEASONTYPE, default=2): vol.All(vol.Coerce(int), vol.In([1, 2, 3])),
+        vol.Optional(ATTR_DIVISION): cv.string,
+    }
+)
+
+GET_SCOREBOARD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_STATE): vol.All(
+            cv.ensure_list, [vol.All(cv.string, vol.Upper, vol.In(["PRE", "IN", "POST"]))]
+        ),
+        vol.Optional(ATTR_TEAM): vol.All(cv.ensure_list, [vol.All(cv.string, vol.Upper)]),
+        vol.Optional(ATTR_MAX_AGE, default=SCOREBOARD_SERVICE_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+GET_HEAD_TO_HEAD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_TEAM): vol.All(cv.string, vol.Upper),
+        vol.Required(ATTR_OPPONENT): vol.All(cv.string, vol.Upper),
+        vol.Optional(ATTR_SEASON): vol.Coerce(int),
+    }
+)
+
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PATH, default=RECORDER_DIR): cv.string,
+        vol.Optional(ATTR_SPEED, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT, default=5000): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+VERIFY_PARSER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_PATH, default=RECORDER_DIR): cv.string,
+        vol.Optional(ATTR_BASELINE, default=PARSER_BASELINE): cv.string,
+        vol.Optional(ATTR_LIMIT, default=500): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_EXAMPLES, default=20): vol.All(vol.Coerce(int), vol.Range(min=0, max=500)),
+        vol.Optional(ATTR_UPDATE_BASELINE, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the NFL services."""
+
+    async def async_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        """Run one instrumented refresh and report where the time went."""
+        return await _async_profile_refresh(
+            hass, call.data[ATTR_ENTRY_ID], call.data[ATTR_TOP], call.data[ATTR_MEMORY]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_replay(call: ServiceCall) -> ServiceResponse:
+        """Feed recorded scoreboard payloads back through a coordinator."""
+        return await _async_replay(
+            hass,
+            call.data[ATTR_ENTRY_ID],
+            call.data[ATTR_PATH],
+            call.data[ATTR_SPEED],
+            call.data[ATTR_LIMIT],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        async_replay,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_verify_parser(call: ServiceCall) -> ServiceResponse:
+        """Compare the parser's output for every team against a stored baseline."""
+        return await _async_verify_parser(
+            hass,
+            call.data[ATTR_PATH],
+            call.data[ATTR_BASELINE],
+            call.data[ATTR_LIMIT],
+            call.data[ATTR_EXAMPLES],
+            call.data[ATTR_UPDATE_BASELINE],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_VERIFY_PARSER,
+        async_verify_parser,
+        schema=VERIFY_PARSER_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_backfill(call: ServiceCall) -> ServiceResponse:
+        """Store a past season's results locally."""
+        return await async_backfill_season(
+            hass,
+            call.data[ATTR_SEASON],
+            call.data[ATTR_SEASONTYPE],
+            call.data.get(ATTR_WEEKS),
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_SEASON,
+        async_backfill,
+        schema=BACKFILL_SEASON_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_get_standings(call: ServiceCall) -> ServiceResponse:
+        """Return division standings from the results store."""
+        store = get_results_store(hass)
+        season = call.data.get(ATTR_SEASON) or await store.async_latest_season()
+        seasontype = call.data[ATTR_SEASONTYPE]
+        standings = await store.async_standings(season, seasontype) if season else []
+        divisions = group_by_division(standings)
+        if ATTR_DIVISION in call.data:
+            divisions = {
+                name: teams
+                for name, teams in divisions.items()
+                if name.lower() == call.data[ATTR_DIVISION].lower()
+            }
+        return {"season": season, "seasontype": seasontype, "standings": divisions}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STANDINGS,
+        async_get_standings,
+        schema=GET_STANDINGS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_get_head_to_head(call: ServiceCall) -> ServiceResponse:
+        """Return the stored games between two teams."""
+        team = call.data[ATTR_TEAM]
+        games = await get_results_store(hass).async_head_to_head(
+            team, call.data[ATTR_OPPONENT], call.data.get(ATTR_SEASON)
+        )
+        margins = [
+            game["home_score"] - game["away_score"]
+            if game["home_team"] == team
+            else game["away_score"] - game["home_score"]
+            for game in games
+        ]
+        return {
+            "wins": sum(margin > 0 for margin in margins),
+            "losses": sum(margin < 0 for margin in margins),
+            "ties": sum(margin == 0 for margin in margins),
+            "games": games,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HEAD_TO_HEAD,
+        async_get_head_to_head,
+        schema=GET_HEAD_TO_HEAD_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+    async def async_get_scoreboard(call: ServiceCall) -> ServiceResponse:
+        """Return every current game from the cached league scoreboard."""
+        try:
+            data = await get_client(hass).async_get_scoreboard(
+                max_age=call.data[ATTR_MAX_AGE], priority=PRIORITY_IDLE
+            )
+        except (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            ValueError,
+            RequestBudgetExceeded,
+        ) as error:
+            raise HomeAssistantError(f"Unable to fetch the scoreboard: {error}") from error
+        if data is None:
+            raise HomeAssistantError("Unable to fetch the scoreboard")
+        states = call.data.get(ATTR_STATE)
+        teams = call.data.get(ATTR_TEAM)
+        events = []
+        for event in data.get("events", []):
+            summary = _summarize_event(event)
+            if states and summary["state"] not in states:
+                continue
+            if teams and not {summary["home"]["abbr"], summary["away"]["abbr"]} & set(teams):
+                continue
+            events.append(summary)
+        return {"week": data.get("week", {}).get("number"), "events": events}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCOREBOARD,
+        async_get_scoreboard,
+        schema=GET_SCOREBOARD_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _summarize_event(event: dict) -> dict:
+    """Return a compact view of one scoreboard event."""
+    status = event.get("status", {})
+    competition = (event.get("competitions") or [{}])[0]
+    sides = {}
+    for competitor in competition.get("competitors", []):
+        team = competitor.get("team", {})
+        sides[competitor.get("homeAway")] = {
+            "abbr": team.get("abbreviation"),
+            "name": team.get("name"),
+            "score": competitor.get("score"),
+            "record": (competitor.get("records") or [{}])[0].get("summary"),
+        }
+    odds = (competition.get("odds") or [{}])[0]
+    return {
+        "id": event.get("id"),
+        "short_name": event.get("shortName"),
+        "date": event.get("date"),
+        "state": status.get("type", {}).get("state", "").upper() or None,
+        "detail": status.get("type", {}).get("shortDetail"),
+        "quarter": status.get("period"),
+        "clock": status.get("displayClock"),
+        "home": sides.get("home", {}),
+        "away": sides.get("away", {}),
+        "tv_network": ((competition.get("broadcasts") or [{}])[0].get("names") or [None])[0],
+        "odds": odds.get("details"),
+        "possession": competition.get("situation", {}).get("possession"),
+    }
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str):
+    """Return the coordinator for entry_id."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(entry_data, dict) or COORDINATOR not in entry_data:
+        raise HomeAssistantError(f"No NFL entry with id {entry_id}")
+    return entry_data[COORDINATOR]
+
+
+async def _async_profile_refresh(
+    hass: HomeAssistant, entry_id: str, top: int, memory: bool
+) -> dict:
+    """Profile one refresh of entry_id with cProfile, and tracemalloc if memory is set.
+
+    tracemalloc traces every allocation in the process and slows all of Home
+    Assistant down while it runs, so it is only turned on when asked for, and
+    only for the one refresh. Its peak includes whatever else ran meanwhile;
+    the allocation sites are limited to the integration's own code.
+    """
+    # Only needed when profiling, so keep them off the integration's import path
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    from . import league_query
+
+    coordinator = _get_coordinator(hass, entry_id)
+    client = get_client(hass)
+    profiler = cProfile.Profile()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+
+    timings = {}
+    transfer = {}
+    try:
+        profiler.enable()
+    except ValueError as error:
+        raise HomeAssistantError(f"Another profiler is already running: {error}") from error
+    try:
+        # Drop the shared cached copy so the refresh measures the network and decode phases
+        client.async_invalidate_scoreboard(*league_query(coordinator.config))
+        received = client.bytes_received
+        last_loop_hold, coordinator.last_loop_hold = coordinator.last_loop_hold, None
+        started = time.perf_counter()
+        # The coordinator's own refresh, so the profiled path is the one that polls
+        try:
+            data = await coordinator._async_update_data()
+        except UpdateFailed as error:
+            raise HomeAssistantError(f"Refresh failed: {error}") from error
+        refresh = time.perf_counter() - started
+        if client.bytes_received != received:
+            timings.update(client.last_timings)
+            transfer = dict(client.last_transfer)
+        if coordinator.last_loop_hold is None:
+            # Nothing was parsed, such as for an MQTT subscriber
+            coordinator.last_loop_hold = last_loop_hold
+        else:
+            timings["parse"] = coordinator.last_loop_hold / 1000
+        timings["refresh"] = refresh
+
+        started = time.perf_counter()
+        coordinator.async_set_updated_data(data)
+        timings["entity_write"] = time.perf_counter() - started
+    finally:
+        profiler.disable()
+        allocations = []
+        current = peak = None
+        if memory:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(True, os.path.join(os.path.dirname(__file__), "*"))]
+            )
+            current, peak = tracemalloc.get_traced_memory()
+            allocations = snapshot.statistics("lineno")[:top]
+        if started_tracing:
+            tracemalloc.stop()
+
+    stats_text = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_text)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    lines = [
+        f"NFL refresh profile for {coordinator.name} ({entry_id}) at {dt_util.now().isoformat()}",
+        "",
+        "Phase timings (ms):",
+    ]
+    lines += [f"  {phase}: {seconds * 1000:.2f}" for phase, seconds in timings.items()]
+    if transfer:
+        lines += [
+            "",
+            f"Transfer: {transfer['compressed_bytes']} bytes ({transfer['encoding']}), "
+            f"{transfer['decompressed_bytes']} bytes decoded",
+        ]
+    if memory:
+        lines += [
+            "",
+            f"Traced memory, whole process: current {current / 1024:.1f} KiB, "
+            f"peak {peak / 1024:.1f} KiB",
+            "",
+            "Top allocations:",
+        ]
+        lines += [f"  {stat}" for stat in allocations]
+    lines += ["", "Hotspots:", stats_text.getvalue()]
+
+    path = hass.config.path(
+        f"nfl_profile_{entry_id}_{dt_util.utcnow().strftime('%Y%m%dT%H%M%S')}.txt"
+    )
+    await hass.async_add_executor_job(_write_report, path, "\n".join(lines))
+    _LOGGER.info("Wrote NFL refresh profile to %s", path)
+
+    hotspots = sorted(
+        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+    )[:5]
+    return {
+        "report": path,
+        "timings_ms": {phase: round(seconds * 1000, 2) for phase, seconds in timings.items()},
+        "peak_memory_kib": round(peak / 1024, 1) if memory else None,
+        "transfer": transfer,
+        "hotspots": [
+            {
+                "function": f"{func[0]}:{func[1]}({func[2]})",
+                "cumulative_ms": round(stat[3] * 1000, 2),
+                "calls": stat[1],
+            }
+            for func, stat in hotspots
+        ],
+        "allocations": [
+            {"location": str(stat.traceback[0]), "size_kib": round(stat.size / 1024, 1)}
+            for stat in allocations[:5]
+        ],
+    }
+
+
+async def _async_replay(
+    hass: HomeAssistant, entry_id: str, path: str, speed: float, limit: int
+) -> dict:
+    """Replay recorded payloads at speed; 0 replays back to back and reports timings."""
+    coordinator = _get_coordinator(hass, entry_id)
+    if coordinator.replaying:
+        raise HomeAssistantError(f"A replay is already running for {entry_id}")
+    path = path if os.path.isabs(path) else hass.config.path(path)
+    if not await hass.async_add_executor_job(os.path.exists, path):
+        raise HomeAssistantError(f"No flight recorder data at {path}")
+
+    coordinator.replaying = True
+    records = _async_stream_records(hass, path, limit)
+
+    if not speed:
+        payloads, parse_seconds = await _async_feed(coordinator, records, speed)
+        return {
+            "payloads": payloads,
+            "parse_ms": round(parse_seconds * 1000, 2),
+            "parse_ms_per_payload": round(parse_seconds * 1000 / max(payloads, 1), 3),
+        }
+
+    hass.async_create_background_task(
+        _async_feed(coordinator, records, speed), f"nfl replay {entry_id}"
+    )
+    return {"path": path, "limit": limit}
+
+
+async def _async_stream_records(
+    hass: HomeAssistant, path: str, limit: int
+) -> AsyncIterator[tuple[datetime, bytes]]:
+    """Yield recorded payloads, reading a few at a time in the executor."""
+    records = read_records(path, limit)
+    try:
+        while batch := await hass.async_add_executor_job(
+            list, islice(records, RECORDER_READ_BATCH)
+        ):
+            for record in batch:
+                yield record
+    finally:
+        await hass.async_add_executor_job(records.close)
+
+
+async def _async_feed(
+    coordinator, records: AsyncIterator[tuple[datetime, bytes]], speed: float
+) -> tuple[int, float]:
+    """Push records through the coordinator; return how many, and the time spent parsing."""
+    from . import async_parse_teams
+
+    payloads = 0
+    parse_seconds = 0.0
+    previous = None
+    try:
+        async for timestamp, payload in records:
+            if not speed:
+                # Back to back, but still let the rest of Home Assistant run between payloads
+                await asyncio.sleep(0)
+            elif previous is not None:
+                await asyncio.sleep(max((timestamp - previous).total_seconds(), 0) / speed)
+            previous = timestamp
+
+            started = time.perf_counter()
+            data = await async_parse_teams(
+                coordinator.config, extract_scoreboard(json.loads(payload))
+            )
+            parse_seconds += time.perf_counter() - started
+            payloads += 1
+            coordinator.async_record_series(data, timestamp)
+            coordinator.async_set_updated_data(data)
+    finally:
+        coordinator.replaying = False
+        await records.aclose()
+    _LOGGER.debug("Replayed %s payloads for %s", payloads, coordinator.name)
+    return payloads, parse_seconds
+
+
+async def _async_verify_parser(
+    hass: HomeAssistant, path: str, baseline_path: str, limit: int, examples: int, update: bool
+) -> dict:
+    """Parse recorded payloads for all 32 teams and diff them against the baseline run.
+
+    The first run, or one with update set, stores its output as the baseline
+    instead, so record one before changing the parser and compare after. The
+    parser runs in the executor on its own loop, since hundreds of payloads
+    for 32 teams would otherwise hold Home Assistant's loop for seconds.
+    """
+    # Only needed when verifying, so keep it off the integration's import path
+    from . import async_parse_state
+    from .verify import compare_runs, run_parser
+
+    path = path if os.path.isabs(path) else hass.config.path(path)
+    baseline_path = baseline_path if os.path.isabs(baseline_path) else hass.config.path(baseline_path)
+    # Streamed from the recording inside the executor, one payload at a time
+    payloads = (payload for _, payload in read_records(path, limit))
+    try:
+        run = await hass.async_add_executor_job(run_parser, async_parse_state, payloads)
+    except FileNotFoundError as error:
+        raise HomeAssistantError(f"No flight recorder data at {path}") from error
+    baseline = None if update else await hass.async_add_executor_job(_read_baseline, baseline_path)
+    if baseline is None:
+        await hass.async_add_executor_job(_write_baseline, baseline_path, run)
+        return {
+            "baseline": baseline_path,
+            "written": True,
+            "payloads": run["payloads"],
+            "states": run["payloads"] * len(run["teams"]),
+            "parse_ms": round(run["seconds"] * 1000, 2),
+            "slowest_payload_ms": round(run["slowest_payload_seconds"] * 1000, 2),
+        }
+
+    try:
+        report = compare_runs(baseline, run, examples)
+    except ValueError as error:
+        raise HomeAssistantError(f"Baseline does not match the recording: {error}") from error
+    return {"baseline": baseline_path, "written": False, **report}
+
+
+def _read_baseline(path: str) -> dict | None:
+    """Read a stored parser run, if there is one."""
+    try:
+        with open(path, encoding="utf-8") as baseline:
+            return json.load(baseline)
+    except FileNotFoundError:
+        return None
+
+
+def _write_baseline(path: str, run: dict) -> None:
+    """Store a parser run as the baseline."""
+    with open(path, "w", encoding="utf-8") as baseline:
+        json.dump(run, baseline)
+
+
+def _write_report(path: str, text: str) -> None:
+    """Write a profile report."""
+    with open(path, "w", encoding="utf-8") as report:
+        report.write(text)
@@ -0,0 +1,206 @@
+"""Differential verification of the NFL parser over recorded scoreboards."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+import json
+import time
+import tracemalloc
+
+from .api import extract_scoreboard
+from .const import CONF_TEAM_ID, DIVISIONS
+
+ALL_TEAMS = [team for teams in DIVISIONS.values() for team in teams]
+
+# Attributes that depend on the wall clock at parse time rather than on the payload
+CLOCK_ATTRIBUTES = frozenset({"last_update", "kickoff_in", "private_warm_up", "private_fast_refresh"})
+
+# Attribute holding the exception raised while parsing a team
+ERROR_ATTRIBUTE = "(error)"
+
+_MISSING = "(missing)"
+
+Parser = Callable[[dict, dict], Awaitable[dict]]
+
+
+def normalize(state: dict) -> dict:
+    """Return a state in its JSON form, without the clock dependent attributes."""
+    return {
+        key: value
+        for key, value in json.loads(json.dumps(state, default=str)).items()
+        if key not in CLOCK_ATTRIBUTES
+    }
+
+
+async def _async_parse(parse: Parser, team: str, data: dict) -> dict:
+    """Parse one team, recording an exception as the state so it shows up as a difference."""
+    try:
+        return await parse({CONF_TEAM_ID: team}, data)
+    except Exception as error:  # pylint: disable=broad-except
+        return {ERROR_ATTRIBUTE: f"{type(error).__name__}: {error}"}
+
+
+async def _async_parse_all(parse: Parser, scoreboards: list[dict], teams: list[str]) -> list[dict]:
+    """Parse every team from every scoreboard."""
+    return [
+        {team: await _async_parse(parse, team, data) for team in teams}
+        for data in scoreboards
+    ]
+
+
+async def async_run_parser(
+    parse: Parser,
+    payloads: Iterable[bytes],
+    teams: list[str] = ALL_TEAMS,
+    allocations: bool = False,
+) -> dict:
+    """Run a parser over raw scoreboard payloads for every team.
+
+    Payloads are decoded one at a time, so a recording can be streamed. With
+    allocations set, a second pass over the payloads measures the parser's
+    peak allocations with tracemalloc. tracemalloc traces the whole process
+    and slows the parser down several times over, so only set it offline,
+    never inside Home Assistant. Each pass extracts its own copy of the
+    payloads, so caches one parser builds in a scoreboard, like the team
+    index, cannot flatter the other.
+    """
+    if allocations:
+        payloads = list(payloads)
+    states = []
+    seconds = slowest = 0.0
+    for payload in payloads:
+        data = extract_scoreboard(json.loads(payload))
+        # All teams of a payload are parsed without yielding, as a refresh does
+        started = time.perf_counter()
+        states.extend(await _async_parse_all(parse, [data], teams))
+        elapsed = time.perf_counter() - started
+        seconds += elapsed
+        slowest = max(slowest, elapsed)
+
+    peak_bytes = None
+    if allocations:
+        scoreboards = [extract_scoreboard(json.loads(payload)) for payload in payloads]
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        await _async_parse_all(parse, scoreboards, teams)
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline_bytes
+        if not tracing:
+            tracemalloc.stop()
+
+    return {
+        "payloads": len(states),
+        "teams": teams,
+        "states": [
+            {team: normalize(state) for team, state in payload_states.items()}
+            for payload_states in states
+        ],
+        "seconds": seconds,
+        "slowest_payload_seconds": slowest,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def run_parser(parse: Parser, payloads: Iterable[bytes], teams: list[str] = ALL_TEAMS) -> dict:
+    """Run async_run_parser on a private event loop, from an executor thread.
+
+    Allocations are not measured, since this runs inside Home Assistant.
+    """
+    return asyncio.run(async_run_parser(parse, payloads, teams))
+
+
+def _compare_allocations(baseline: dict, candidate: dict) -> dict | None:
+    """Return the peak allocations of two runs, if both measured them."""
+    if baseline.get("peak_bytes") is None or candidate.get("peak_bytes") is None:
+        return None
+    return {
+        "baseline_peak_kib": round(baseline["peak_bytes"] / 1024, 1),
+        "candidate_peak_kib": round(candidate["peak_bytes"] / 1024, 1),
+        "ratio": round(candidate["peak_bytes"] / baseline["peak_bytes"], 3)
+        if baseline["peak_bytes"]
+        else None,
+    }
+
+
+def compare_runs(baseline: dict, candidate: dict, examples: int = 20) -> dict:
+    """Report the attribute level differences, speed and allocations of two parser runs."""
+    if baseline["payloads"] != candidate["payloads"]:
+        raise ValueError(
+            f"Runs cover {baseline['payloads']} and {candidate['payloads']} payloads"
+        )
+
+    compared = 0
+    mismatched_states = 0
+    attributes: Counter[str] = Counter()
+    found = []
+    for index, (old_states, new_states) in enumerate(zip(baseline["states"], candidate["states"])):
+        for team in sorted(old_states.keys() | new_states.keys()):
+            old = old_states.get(team, {})
+            new = new_states.get(team, {})
+            compared += 1
+            differing = [
+                key
+                for key in sorted(old.keys() | new.keys())
+                if old.get(key, _MISSING) != new.get(key, _MISSING)
+            ]
+            if not differing:
+                continue
+            mismatched_states += 1
+            attributes.update(differing)
+            for key in differing:
+                if len(found) < examples:
+                    found.append(
+                        {
+                            "payload": index,
+                            "team": team,
+                            "attribute": key,
+                            "baseline": old.get(key, _MISSING),
+                            "candidate": new.get(key, _MISSING),
+                        }
+                    )
+
+    return {
+        "payloads": candidate["payloads"],
+        "states": compared,
+        "mismatched_states": mismatched_states,
+        "mismatches": sum(attributes.values()),
+        "attributes": dict(attributes.most_common()),
+        "examples": found,
+        "speed": {
+            "baseline_ms": round(baseline["seconds"] * 1000, 2),
+            "candidate_ms": round(candidate["seconds"] * 1000, 2),
+            "ratio": round(candidate["seconds"] / baseline["seconds"], 3) if baseline["seconds"] else None,
+            "candidate_slowest_payload_ms": round(candidate["slowest_payload_seconds"] * 1000, 2),
+        },
+        "allocations": _compare_allocations(baseline, candidate),
+    }
+
+
+async def async_compare_parsers(
+    legacy: Parser,
+    candidate: Parser,
+    payloads: list[bytes],
+    teams: list[str] = ALL_TEAMS,
+    examples: int = 20,
+) -> dict:
+    """Run two parsers side by side over the same payloads and compare them.
+
+    This needs no running Home Assistant, so a parser rewrite can be checked
+    against the function it replaces over a recorded corpus, and their peak
+    allocations compared. tests/test_verify.py runs it in CI. The slowest
+    payload's time is how long one refresh of all 32 teams would hold the
+    event loop, to hold against LOOP_HOLD_BUDGET_MS. For example:
+
+        records = read_records("tests/fixtures/nfl_flight_recorder")
+        report = await async_compare_parsers(
+            legacy_parse_state, async_parse_state, [payload for _, payload in records]
+        )
+    """
+    return compare_runs(
+        await async_run_parser(legacy, payloads, teams, allocations=True),
+        await async_run_parser(candidate, payloads, teams, allocations=True),
+        examples,
+    )
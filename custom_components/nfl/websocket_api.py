@@ -0,0 +1,169 @@
+"""Websocket API for NFL."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_TEAM_ID, COORDINATOR, DOMAIN, SERIES_POINTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the NFL websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_series)
+
+
+def _public_state(data: dict | None) -> dict:
+    """Return the game state without the coordinator's private keys."""
+    if data is None:
+        return {}
+    return {key: value for key, value in data.items() if not key.startswith("private_")}
+
+
+def _state_diff(old: dict, new: dict) -> dict:
+    """Return the keys of new whose values differ from old; dropped keys map to None."""
+    changed = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    for key in old.keys() - new.keys():
+        changed[key] = None
+    return changed
+
+
+def _tracked_teams(hass: HomeAssistant, team_id: str | None) -> list[tuple]:
+    """Return (coordinator, team) for every entry tracking team_id, or every team if None."""
+    tracked = []
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict) or COORDINATOR not in entry_data:
+            continue
+        coordinator = entry_data[COORDINATOR]
+        for team in coordinator.teams:
+            if team_id is None or team == team_id.upper():
+                tracked.append((coordinator, team))
+    return tracked
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "nfl/subscribe",
+        vol.Optional(CONF_TEAM_ID): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream game state for one team, or the whole league, as diffs.
+
+    The first event for each team carries the full state under "state", later
+    events only carry the fields that changed since the previous one under
+    "changed". While subscribed, live games also carry their game details.
+    When an entry the subscription reads unloads, a last event carrying
+    "unloaded" ends it; subscribe again to follow the reloaded entry.
+    """
+    team_id = msg.get(CONF_TEAM_ID)
+    tracked = _tracked_teams(hass, team_id)
+    if team_id is not None and not tracked:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No NFL entry tracks {team_id}"
+        )
+        return
+
+    last_sent: dict[tuple[int, str], dict] = {}
+    unsubs = []
+
+    @callback
+    def _send_full(coordinator, team: str) -> None:
+        state = _public_state((coordinator.data or {}).get(team))
+        last_sent[(id(coordinator), team)] = state
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {CONF_TEAM_ID: team, "state": state})
+        )
+
+    @callback
+    def _send_diff(coordinator, team: str) -> None:
+        state = _public_state((coordinator.data or {}).get(team))
+        changed = _state_diff(last_sent.get((id(coordinator), team), {}), state)
+        if not changed:
+            return
+        last_sent[(id(coordinator), team)] = state
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {CONF_TEAM_ID: team, "changed": changed})
+        )
+
+    @callback
+    def _unsubscribe() -> None:
+        while unsubs:
+            unsubs.pop()()
+
+    @callback
+    def _end(coordinator) -> None:
+        if connection.subscriptions.pop(msg["id"], None) is None:
+            return
+        _unsubscribe()
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"unloaded": coordinator.name})
+        )
+
+    for coordinator, team in tracked:
+        unsubs.append(
+            coordinator.async_add_listener(lambda c=coordinator, t=team: _send_diff(c, t))
+        )
+        unsubs.append(coordinator.async_add_detail_consumer(team))
+    for coordinator in {coordinator for coordinator, _ in tracked}:
+        unsubs.append(coordinator.async_add_unload_listener(lambda c=coordinator: _end(c)))
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+
+    for coordinator, team in tracked:
+        _send_full(coordinator, team)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "nfl/series",
+        vol.Required(CONF_TEAM_ID): str,
+        vol.Optional("event_id"): str,
+        vol.Optional("points", default=SERIES_POINTS): vol.All(
+            vol.Coerce(int), vol.Range(min=2)
+        ),
+    }
+)
+@callback
+def websocket_series(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the win probability, spread and total series of a team's game.
+
+    Each series is a list of [timestamp, value] pairs, oldest first, thinned
+    to at most "points" samples. The current game is used unless an event_id
+    is given.
+    """
+    team_id = msg[CONF_TEAM_ID]
+    for coordinator, team in _tracked_teams(hass, team_id):
+        state = (coordinator.data or {}).get(team, {})
+        event_id = msg.get("event_id") or state.get("private_event_id")
+        series = coordinator.series.get(event_id)
+        if series is not None:
+            connection.send_result(
+                msg["id"],
+                {
+                    CONF_TEAM_ID: team,
+                    "event_id": event_id,
+                    **series.as_dict(msg["points"]),
+                },
+            )
+            return
+    connection.send_error(
+        msg["id"], websocket_api.ERR_NOT_FOUND, f"No series recorded for {team_id}"
+    )
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Post the scoreboards in a flight recording to an NFL entry's webhook.
+
+Replays what the flight recorder stored, oldest first, so a relay can be
+tried out, or an entry in webhook mode exercised, without a live game:
+
+    script/push_recording.py http://homeassistant.local:8123/api/webhook/<webhook_id> \\
+        config/nfl_flight_recorder --speed 10
+
+Only the standard library is used, so it runs from any machine that can
+reach Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from datetime import datetime
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def read_recording(path: str) -> Iterator[tuple[datetime, bytes]]:
+    """Yield the (timestamp, payload) records of a segment or recorder directory, oldest first."""
+    if os.path.isdir(path):
+        paths = sorted(glob.glob(os.path.join(path, "segment-*.jsonl.gz")))
+    else:
+        paths = [path]
+    for segment_path in paths:
+        with gzip.open(segment_path, "rb") as segment:
+            for header in segment:
+                payload = segment.readline()
+                yield datetime.fromisoformat(json.loads(header)["ts"]), payload
+
+
+def post(url: str, payload: bytes, timeout: float) -> dict:
+    """Post one payload to the webhook and return its response."""
+    request = urllib.request.Request(
+        url, data=payload, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read() or b"{}")
+
+
+def main() -> int:
+    """Replay the recording at the requested pace."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="the entry's webhook, http://<host>:8123/api/webhook/<webhook_id>")
+    parser.add_argument("path", help="a recorder directory or a single segment")
+    pace = parser.add_mutually_exclusive_group()
+    pace.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="playback speed relative to the recording, 0 for back to back (default: 1)",
+    )
+    pace.add_argument("--interval", type=float, help="seconds between posts, ignoring the recording")
+    parser.add_argument("--limit", type=int, help="stop after this many payloads")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for each post")
+    args = parser.parse_args()
+
+    previous = None
+    posted = 0
+    for timestamp, payload in read_recording(args.path):
+        if args.limit is not None and posted >= args.limit:
+            break
+        if args.interval is not None:
+            delay = args.interval if previous is not None else 0
+        elif args.speed and previous is not None:
+            delay = max((timestamp - previous).total_seconds(), 0) / args.speed
+        else:
+            delay = 0
+        time.sleep(delay)
+        previous = timestamp
+
+        try:
+            response = post(args.url, payload, args.timeout)
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            print(f"{timestamp.isoformat()}: {error}", file=sys.stderr)
+            return 1
+        posted += 1
+        print(f"{timestamp.isoformat()}: updated {', '.join(response.get('teams', [])) or 'no teams'}")
+
+    print(f"Posted {posted} payloads")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Reproducible measurements of what the NFL integration costs to run."""
+from __future__ import annotations
+
+import gc
+import gzip
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tracemalloc
+import zlib
+
+from custom_components.nfl.api import brotli, extract_scoreboard
+from custom_components.nfl.const import CONF_TEAM_ID, DEFAULT_LIVE_INTERVAL
+from custom_components.nfl.verify import ALL_TEAMS, Parser
+
+TEAM_COUNTS = (1, 8, 32)
+# Early kickoffs to the end of the night game, in hours
+SUNDAY_HOURS = 11
+INTEGRATION_MODULE = "custom_components.nfl"
+# Holds custom_components, so the integration imports as it does in a config directory
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Loaded by Home Assistant before any integration, so not counted against one
+PRELOADED_MODULES = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+def _traced_bytes() -> int:
+    """Return the bytes still allocated once garbage has been collected."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+async def async_measure_memory(
+    parse: Parser, payload: bytes, team_counts: tuple[int, ...] = TEAM_COUNTS
+) -> dict:
+    """Report the bytes retained after caching and parsing a scoreboard for 1, 8 and 32 teams.
+
+    Like a refresh, the payload is decoded and its slices cached once, then
+    every team is parsed from the cache and its state kept. The cached
+    scoreboard is shared, so bytes_per_team should stay flat as teams are
+    added. tests/test_benchmark.py runs it over a full Sunday.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    results = {}
+    try:
+        for count in team_counts:
+            teams = ALL_TEAMS[:count]
+            start = _traced_bytes()
+            scoreboard = extract_scoreboard(json.loads(payload))
+            cached = _traced_bytes()
+            states = {team: await parse({CONF_TEAM_ID: team}, scoreboard) for team in teams}
+            parsed = _traced_bytes()
+            results[count] = {
+                "scoreboard_bytes": cached - start,
+                "states_bytes": parsed - cached,
+                "retained_bytes": parsed - start,
+                "bytes_per_team": round((parsed - cached) / len(teams)),
+            }
+            del scoreboard, states
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return {"payload_bytes": len(payload), "teams": results}
+
+
+def import_times(module: str = INTEGRATION_MODULE) -> dict[str, tuple[int, int]]:
+    """Import module in a fresh interpreter; return the self and cumulative microseconds it added.
+
+    The modules Home Assistant loads before any integration are imported
+    first, so only what the integration itself pulls in is counted.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {', '.join(PRELOADED_MODULES)}; import {module}",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=REPO_ROOT,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if name in PRELOADED_MODULES:
+            times.clear()
+            continue
+        times[name] = (int(own), int(cumulative))
+    return times
+
+
+def measure_import_time(module: str = INTEGRATION_MODULE, runs: int = 5, top: int = 10) -> dict:
+    """Report how long importing the integration takes, from a fresh interpreter each run.
+
+    The median of several runs evens out disk caching; the slowest modules
+    show what to defer if the import grows.
+    """
+    samples = [import_times(module) for _ in range(runs)]
+    totals = [times[module][1] for times in samples]
+    slowest = sorted(samples[-1].items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "runs": runs,
+        "median_ms": round(statistics.median(totals) / 1000, 2),
+        "max_ms": round(max(totals) / 1000, 2),
+        "slowest_modules": [
+            {"module": name, "self_ms": round(own / 1000, 2)} for name, (own, _) in slowest
+        ],
+    }
+
+
+def _encode(body: bytes, encoding: str) -> bytes:
+    """Return body with a content encoding applied at the usual server levels."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "deflate":
+        return zlib.compress(body)
+    return brotli.compress(body, quality=5)
+
+
+def measure_bandwidth(
+    payload: bytes, interval: float = DEFAULT_LIVE_INTERVAL, hours: float = SUNDAY_HOURS
+) -> dict:
+    """Report the transfer per poll and per Sunday of a scoreboard payload in each encoding.
+
+    Use a payload recorded during a full Sunday slate. Polls are counted at
+    the live interval for the whole window; the scoreboard is shared between
+    entries, so the count does not depend on how many teams are tracked.
+    Upstream compression levels are not known, so the sizes are estimates.
+    """
+    polls = int(hours * 3600 / interval)
+    encodings = ["gzip", "deflate"] + (["br"] if brotli is not None else [])
+    sizes = {"identity": len(payload)}
+    sizes.update({encoding: len(_encode(payload, encoding)) for encoding in encodings})
+    return {
+        "polls": polls,
+        "encodings": {
+            encoding: {
+                "bytes_per_poll": size,
+                "ratio": round(size / len(payload), 3),
+                "mib_per_sunday": round(size * polls / 2**20, 1),
+                "mib_saved": round((len(payload) - size) * polls / 2**20, 1),
+            }
+            for encoding, size in sizes.items()
+        },
+    }
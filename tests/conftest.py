@@ -0,0 +1,19 @@
+"""Fixtures for the NFL tests."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name: str) -> bytes:
+    """Return the raw bytes of a fixture file."""
+    return (FIXTURES / name).read_bytes()
+
+
+@pytest.fixture
+def sunday_payload() -> bytes:
+    """Return a full Sunday scoreboard: nine early games live, seven late games to come."""
+    return load_fixture("scoreboard_sunday.json")
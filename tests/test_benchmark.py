@@ -0,0 +1,98 @@
+"""Budgets for what the NFL integration costs to run, measured with tests/benchmark.py."""
+from __future__ import annotations
+
+import copy
+import json
+import time
+import zlib
+
+from custom_components.nfl import async_parse_state, async_parse_teams
+from custom_components.nfl.api import _ACCEPT_ENCODING, _decode_body, extract_scoreboard
+from custom_components.nfl.const import CONF_TEAM_ID
+from custom_components.nfl.verify import ALL_TEAMS
+
+from .benchmark import _encode, async_measure_memory, measure_bandwidth
+
+# Compressed size over identity size, for the encodings the client accepts
+COMPRESSION_RATIO_BUDGET = 0.2
+# A college football Saturday with every FBS game listed
+SATURDAY_GAMES = 300
+# Timings are the best of a few runs, so a busy machine does not fail the test
+TIMING_RUNS = 5
+
+
+def _saturday_payload(sunday_payload: bytes, games: int = SATURDAY_GAMES) -> bytes:
+    """Return a scoreboard of games copied from the Sunday ones, each between two new teams."""
+    data = json.loads(sunday_payload)
+    template = data["events"]
+    events = []
+    for number in range(games):
+        event = copy.deepcopy(template[number % len(template)])
+        event["id"] = event["competitions"][0]["id"] = str(500000000 + number)
+        for side, competitor in enumerate(event["competitions"][0]["competitors"]):
+            competitor["team"]["abbreviation"] = f"T{2 * number + side:03d}"
+        events.append(event)
+    data["events"] = events
+    return json.dumps(data).encode()
+
+
+async def _async_ms_per_team(payload: bytes, teams: list[str]) -> float:
+    """Return the best time, in milliseconds per team, to parse teams from a decoded payload."""
+    best = None
+    for _ in range(TIMING_RUNS):
+        scoreboard = extract_scoreboard(json.loads(payload))
+        started = time.perf_counter()
+        states = await async_parse_teams({CONF_TEAM_ID: teams}, scoreboard)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    assert {state["state"] for state in states.values()} <= {"PRE", "IN", "POST"}
+    return best * 1000 / len(teams)
+
+
+async def test_memory_per_team_stays_flat(sunday_payload: bytes) -> None:
+    """Teams share the cached scoreboard, so each added team costs only its own state."""
+    report = await async_measure_memory(async_parse_state, sunday_payload)
+    teams = report["teams"]
+
+    # The scoreboard is cached once, whatever the number of teams
+    assert max(t["scoreboard_bytes"] for t in teams.values()) <= 1.01 * min(
+        t["scoreboard_bytes"] for t in teams.values()
+    )
+    # One team also pays for warming up the parser, so compare from 8 teams on
+    assert teams[32]["bytes_per_team"] <= teams[8]["bytes_per_team"]
+    # A team's state must not hold its own copy of the scoreboard
+    assert teams[32]["bytes_per_team"] < teams[32]["scoreboard_bytes"] / 10
+
+
+def test_compression_ratio(sunday_payload: bytes) -> None:
+    """Every encoding the client accepts shrinks a full Sunday scoreboard at least fivefold."""
+    report = measure_bandwidth(sunday_payload)
+    encodings = report["encodings"]
+
+    assert set(encodings) == {"identity", *_ACCEPT_ENCODING.split(", ")}
+    for encoding, sizes in encodings.items():
+        if encoding != "identity":
+            assert sizes["ratio"] <= COMPRESSION_RATIO_BUDGET, encoding
+            assert sizes["mib_saved"] > 0
+
+
+def test_client_decodes_each_encoding(sunday_payload: bytes) -> None:
+    """What the server compresses, the client decodes back to the same body."""
+    for encoding in _ACCEPT_ENCODING.split(", "):
+        assert _decode_body(_encode(sunday_payload, encoding), encoding) == sunday_payload
+    # Some servers send deflate without the zlib header
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    body = raw_deflate.compress(sunday_payload) + raw_deflate.flush()
+    assert _decode_body(body, "deflate") == sunday_payload
+
+
+async def test_parse_scales_to_a_college_saturday(sunday_payload: bytes) -> None:
+    """A team costs no more to parse from 300 games than from an NFL Sunday's 16."""
+    saturday = _saturday_payload(sunday_payload)
+    saturday_teams = [f"T{number:03d}" for number in range(2 * SATURDAY_GAMES)]
+
+    sunday_ms = await _async_ms_per_team(sunday_payload, list(ALL_TEAMS))
+    saturday_ms = await _async_ms_per_team(saturday, saturday_teams)
+
+    # Events are indexed once per payload, so the cost per team must not grow with the slate
+    assert saturday_ms < 2 * sunday_ms, (saturday_ms, sunday_ms)
@@ -0,0 +1,29 @@
+"""Reading recorded scoreboard payloads back."""
+from __future__ import annotations
+
+import json
+
+from custom_components.nfl.flight_recorder import read_records
+
+from .conftest import FIXTURES
+
+RECORDING = str(FIXTURES / "nfl_flight_recorder")
+
+
+def test_read_records_streams_oldest_first() -> None:
+    """Records are yielded one at a time, in the order they were recorded."""
+    records = read_records(RECORDING)
+
+    timestamp, payload = next(records)
+    assert json.loads(payload)["events"]
+    rest = list(records)
+    assert len(rest) == 2
+    assert [timestamp] + [later for later, _ in rest] == sorted(
+        [timestamp] + [later for later, _ in rest]
+    )
+
+
+def test_read_records_stops_at_limit() -> None:
+    """Reading stops once limit records have been yielded."""
+    assert len(list(read_records(RECORDING, limit=2))) == 2
+    assert list(read_records(RECORDING, limit=0)) == []
@@ -0,0 +1,34 @@
+"""Importing the integration must stay cheap, since Home Assistant does it at startup."""
+from __future__ import annotations
+
+from .benchmark import import_times, measure_import_time
+
+# Median cumulative import of the integration, on top of what Home Assistant preloads
+IMPORT_BUDGET_MS = 100
+# Only imported by the setup functions, services and platforms that use them
+DEFERRED_MODULES = (
+    "sqlite3",
+    "custom_components.nfl.backfill",
+    "custom_components.nfl.flight_recorder",
+    "custom_components.nfl.players",
+    "custom_components.nfl.results",
+    "custom_components.nfl.series",
+    "custom_components.nfl.services",
+    "custom_components.nfl.verify",
+    "custom_components.nfl.websocket_api",
+)
+
+
+def test_import_defers_optional_modules() -> None:
+    """The modules only some entries or services need are not loaded by the import."""
+    imported = import_times()
+
+    assert "custom_components.nfl" in imported
+    assert not set(DEFERRED_MODULES) & set(imported)
+
+
+def test_import_within_budget() -> None:
+    """The median import of the integration stays within its budget."""
+    report = measure_import_time(runs=3)
+
+    assert report["median_ms"] < IMPORT_BUDGET_MS, report["slowest_modules"]
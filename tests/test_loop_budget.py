@@ -0,0 +1,43 @@
+"""The parse path must not hold the event loop longer than its budget."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from custom_components.nfl import async_parse_teams
+from custom_components.nfl.api import extract_scoreboard
+from custom_components.nfl.const import CONF_TEAM_ID, LOOP_HOLD_BUDGET_MS
+from custom_components.nfl.verify import ALL_TEAMS
+
+
+async def _async_refresh(payload: bytes) -> dict:
+    """Decode and parse a payload for every team, without yielding, as a refresh does."""
+    return await async_parse_teams(
+        {CONF_TEAM_ID: ALL_TEAMS}, extract_scoreboard(json.loads(payload))
+    )
+
+
+async def test_parse_all_teams_within_loop_budget(caplog, sunday_payload: bytes) -> None:
+    """Asyncio debug mode reports every step that ran longer than the budget."""
+    loop = asyncio.get_running_loop()
+    debug = loop.get_debug()
+    slow_callback_duration = loop.slow_callback_duration
+    loop.set_debug(True)
+    loop.slow_callback_duration = LOOP_HOLD_BUDGET_MS / 1000
+    caplog.set_level(logging.WARNING, logger="asyncio")
+    try:
+        # A task of its own, so the whole parse is one step of the loop
+        states = await loop.create_task(_async_refresh(sunday_payload))
+    finally:
+        loop.set_debug(debug)
+        loop.slow_callback_duration = slow_callback_duration
+
+    assert len(states) == 32
+    assert {state["state"] for state in states.values()} == {"IN", "PRE"}
+    holds = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "asyncio" and record.getMessage().startswith("Executing")
+    ]
+    assert not holds, f"Parsing held the loop over {LOOP_HOLD_BUDGET_MS} ms: {holds}"
@@ -0,0 +1,135 @@
+"""Sharing game states over MQTT, from a publisher to a subscriber."""
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.nfl import async_parse_teams
+from custom_components.nfl.api import extract_scoreboard
+from custom_components.nfl.const import CONF_TEAM_ID, MQTT_SNAPSHOT_EVERY
+from custom_components.nfl.flight_recorder import read_records
+from custom_components.nfl.mqtt_sync import (
+    GameStatePublisher,
+    GameStateSubscriber,
+    _async_templates,
+    _dumps,
+    mqtt,
+)
+
+from .conftest import FIXTURES
+
+TOPIC = "nfl/test"
+# BUF and MIA are live in the second recorded payload and final in the third; SEA plays late
+TEAMS = ["BUF", "MIA", "SEA"]
+
+
+class _Coordinator:
+    """The parts of a coordinator the publisher and subscriber use."""
+
+    def __init__(self, teams: list[str]) -> None:
+        self.config = {CONF_TEAM_ID: teams}
+        self.teams = teams
+        self.data: dict[str, dict] = {}
+
+    def async_set_shared_state(self, team: str, state: dict) -> None:
+        self.data[team] = state
+
+
+def _shared(state: dict) -> dict:
+    """Return a state as it compares over the wire, without what is never shared."""
+    return {
+        key: value
+        for key, value in json.loads(_dumps(state)).items()
+        if key not in ("game_details", "last_update")
+    }
+
+
+async def _async_setup(hass: HomeAssistant, monkeypatch) -> tuple:
+    """Return a publisher and a subscriber joined by a fake broker, and the messages sent."""
+    sent = []
+
+    async def async_publish(hass, topic, payload, qos, retain) -> None:
+        sent.append((topic, payload, retain))
+
+    monkeypatch.setattr(mqtt, "async_publish", async_publish)
+    templates = await _async_templates({}, TEAMS)
+    source = _Coordinator(TEAMS)
+    replica = _Coordinator(TEAMS)
+    publisher = GameStatePublisher(hass, source, TOPIC, templates)
+    subscriber = GameStateSubscriber(replica, templates)
+    return source, replica, publisher, subscriber, sent
+
+
+def _deliver(subscriber: GameStateSubscriber, messages: list) -> None:
+    """Hand published messages to the subscriber, as the broker would."""
+    for topic, payload, _ in messages:
+        subscriber.async_message_received(SimpleNamespace(topic=topic, payload=payload))
+
+
+async def test_recorded_sunday_round_trip(hass: HomeAssistant, monkeypatch) -> None:
+    """The subscriber ends every recorded payload with the publisher's states."""
+    source, replica, publisher, subscriber, sent = await _async_setup(hass, monkeypatch)
+
+    for _, payload in read_records(str(FIXTURES / "nfl_flight_recorder")):
+        source.data = await async_parse_teams(
+            source.config, extract_scoreboard(json.loads(payload))
+        )
+        publisher.async_publish_updates()
+        await hass.async_block_till_done()
+        _deliver(subscriber, sent)
+        sent.clear()
+
+        assert {team: _shared(state) for team, state in replica.data.items()} == {
+            team: _shared(state) for team, state in source.data.items()
+        }
+        assert {state["state"] for state in replica.data.values()} == {
+            state["state"] for state in source.data.values()
+        }
+
+
+async def test_diffs_then_snapshot(hass: HomeAssistant, monkeypatch) -> None:
+    """Changes within a game go out as diffs, with a retained snapshot every few of them."""
+    source, replica, publisher, subscriber, sent = await _async_setup(hass, monkeypatch)
+    *_, (_, live) = list(read_records(str(FIXTURES / "nfl_flight_recorder"), limit=2))
+    source.data = await async_parse_teams(source.config, extract_scoreboard(json.loads(live)))
+    publisher.async_publish_updates()
+    await hass.async_block_till_done()
+    _deliver(subscriber, sent)
+    assert [topic for topic, _, retain in sent if retain] == [f"{TOPIC}/{team}/state" for team in TEAMS]
+
+    for play in range(1, MQTT_SNAPSHOT_EVERY + 2):
+        sent.clear()
+        source.data["BUF"] = {**source.data["BUF"], "last_play": f"Play {play}"}
+        publisher.async_publish_updates()
+        await hass.async_block_till_done()
+
+        kind = "state" if play > MQTT_SNAPSHOT_EVERY else "diff"
+        assert [(topic, retain) for topic, _, retain in sent] == [
+            (f"{TOPIC}/BUF/{kind}", kind == "state")
+        ]
+        if kind == "diff":
+            assert json.loads(sent[0][1])["set"] == {"last_play": f"Play {play}"}
+        _deliver(subscriber, sent)
+        assert replica.data["BUF"]["last_play"] == f"Play {play}"
+
+
+async def test_missed_diff_waits_for_snapshot(hass: HomeAssistant, monkeypatch) -> None:
+    """After a lost diff, later diffs are not applied on top of a stale state."""
+    source, replica, publisher, subscriber, sent = await _async_setup(hass, monkeypatch)
+    *_, (_, live) = list(read_records(str(FIXTURES / "nfl_flight_recorder"), limit=2))
+    source.data = await async_parse_teams(source.config, extract_scoreboard(json.loads(live)))
+    publisher.async_publish_updates()
+    await hass.async_block_till_done()
+    _deliver(subscriber, sent)
+
+    for play in ("Lost", "Next"):
+        sent.clear()
+        source.data["BUF"] = {**source.data["BUF"], "last_play": play}
+        publisher.async_publish_updates()
+        await hass.async_block_till_done()
+        if play == "Next":
+            _deliver(subscriber, sent)
+
+    assert replica.data["BUF"]["last_play"] != "Next"
@@ -0,0 +1,26 @@
+"""Unique ids of entries that track several teams."""
+from __future__ import annotations
+
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.nfl import AlertsDataUpdateCoordinator
+from custom_components.nfl.const import CONF_TEAM_ID
+
+
+async def test_legacy_team_keeps_unsuffixed_ids(hass: HomeAssistant) -> None:
+    """Adding a team ahead of the original one does not move the original's ids."""
+    coordinator = AlertsDataUpdateCoordinator(
+        hass, {CONF_NAME: "NFL", CONF_TEAM_ID: ["KC", "SEA"]}, 120, "SEA"
+    )
+
+    assert coordinator.unique_id_suffix("SEA") == ""
+    assert coordinator.unique_id_suffix("KC") == "_kc"
+
+
+async def test_without_legacy_team_first_team_keeps_ids(hass: HomeAssistant) -> None:
+    """A coordinator set up from YAML treats its first team as the original one."""
+    coordinator = AlertsDataUpdateCoordinator(hass, {CONF_NAME: "NFL", CONF_TEAM_ID: "SEA,KC"}, 120)
+
+    assert coordinator.unique_id_suffix("SEA") == ""
+    assert coordinator.unique_id_suffix("KC") == "_kc"
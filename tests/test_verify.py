@@ -0,0 +1,60 @@
+"""Differential verification of the parser over a recorded Sunday."""
+from __future__ import annotations
+
+from custom_components.nfl import async_parse_state
+from custom_components.nfl.flight_recorder import read_records
+from custom_components.nfl.verify import ERROR_ATTRIBUTE, async_compare_parsers
+
+from .conftest import FIXTURES
+
+
+def _recorded_payloads() -> list[bytes]:
+    """Return the payloads recorded before kickoff, during the early games and after them."""
+    return [payload for _, payload in read_records(str(FIXTURES / "nfl_flight_recorder"))]
+
+
+async def test_same_parser_has_no_differences() -> None:
+    """A parser compared with itself matches on every team of every payload."""
+    report = await async_compare_parsers(
+        async_parse_state, async_parse_state, _recorded_payloads()
+    )
+
+    assert report["payloads"] == 3
+    assert report["states"] == 3 * 32
+    assert report["mismatches"] == 0
+    assert report["examples"] == []
+    assert report["allocations"]["candidate_peak_kib"] > 0
+
+
+async def test_changed_attribute_is_reported() -> None:
+    """Dropping the clock of live games shows up as clock differences only."""
+
+    async def without_clock(config: dict, data: dict) -> dict:
+        state = await async_parse_state(config, data)
+        if state["state"] == "IN":
+            state["clock"] = None
+        return state
+
+    report = await async_compare_parsers(async_parse_state, without_clock, _recorded_payloads())
+
+    # Nine games live in the second payload, two in the third
+    assert report["attributes"] == {"clock": 2 * (9 + 2)}
+    assert report["mismatched_states"] == 2 * (9 + 2)
+    assert {example["attribute"] for example in report["examples"]} == {"clock"}
+    assert all(example["candidate"] is None for example in report["examples"])
+
+
+async def test_parser_error_is_a_difference() -> None:
+    """A parser that raises for one team is reported, not aborted."""
+
+    async def broken_for_sea(config: dict, data: dict) -> dict:
+        if config["team_id"] == "SEA":
+            raise KeyError("situation")
+        return await async_parse_state(config, data)
+
+    report = await async_compare_parsers(
+        async_parse_state, broken_for_sea, _recorded_payloads(), examples=0
+    )
+
+    assert report["mismatched_states"] == 3
+    assert report["attributes"][ERROR_ATTRIBUTE] == 3